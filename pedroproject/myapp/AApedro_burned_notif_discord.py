@@ -1,12 +1,10 @@
 import os
-import base64
 import discord
 import logging
 from typing import Dict, Any
 from decimal import Decimal, InvalidOperation
-from pyinjective.client.model.pagination import PaginationOption
-from pyinjective.async_client import AsyncClient
-from pyinjective.core.network import Network
+from .injective_chain import chain_client
+from .injective_cw20_balances import PEDRO_CW20, cw20_supply_and_burned
 from dotenv import load_dotenv
 
 """
@@ -30,8 +28,7 @@ logger = logging.getLogger(__name__)
 
 class PedroTokenBurnNotifier:
     def __init__(self):
-        self.network = Network.mainnet()
-        self.client = AsyncClient(self.network)
+        self.client = chain_client()
         self.discord_webhook_url = os.getenv("DISCORD_BURN_WEBHOOK")
         self.role_id = "1340790768360755281"
         self.explorer_base_url = "https://explorer.injective.network/transaction"
@@ -46,7 +43,6 @@ class PedroTokenBurnNotifier:
         
     async def pedro_token_burned_native_cw20(self):
         burn_coin = 0
-        total_supply = 0
 
         all_bank_balance = await self.client.fetch_bank_balances(address="inj1qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqe2hm49")
         
@@ -55,33 +51,8 @@ class PedroTokenBurnNotifier:
             if balance['denom'] == pedro_denom:
                 burn_coin += float(balance['amount']) / 10 ** 18
 
-        holders = await self.client.fetch_all_contracts_state(
-            address="inj1c6lxety9hqn9q4khwqvjcfa24c2qeqvvfsg4fm", 
-            pagination=PaginationOption(limit=1000)
-        )
-
-        first_fetch = holders
-        while holders['pagination']['nextKey']:
-            pagination = PaginationOption(limit=1000, encoded_page_key=holders['pagination']['nextKey'])
-            holders = await self.client.fetch_all_contracts_state(
-                address="inj1c6lxety9hqn9q4khwqvjcfa24c2qeqvvfsg4fm", 
-                pagination=pagination
-            )
-            first_fetch['models'] += holders['models']
-            first_fetch['pagination'] = holders['pagination']
-
-        for model in first_fetch['models']:
-            value_decoded = base64.b64decode(model['value']).decode('utf-8').strip('"')
-
-            if value_decoded.isdigit():
-                amount_coin = float(value_decoded) / 10 ** 18
-                total_supply += amount_coin
-                
-                inj_address = base64.b64decode(model['key']).decode('utf-8')[9:]
-
-                if inj_address == "inj1qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqe2hm49":
-                    burn_coin += amount_coin
-                    break
+        _, burned_cw20 = await cw20_supply_and_burned(PEDRO_CW20, client=self.client)
+        burn_coin += burned_cw20 / 10 ** 18
 
         return burn_coin
 
@@ -1,8 +1,6 @@
-import base64
 from datetime import datetime
-from pyinjective.client.model.pagination import PaginationOption
-from pyinjective.async_client import AsyncClient
-from pyinjective.core.network import Network
+from .injective_chain import chain_client
+from .injective_cw20_balances import BURN_ADDRESS, cw20_supply_and_burned
 
 #This info is very important in the $PEDRO website for burn page.
 class PedroTokenInfo:
@@ -19,8 +17,7 @@ class PedroTokenInfo:
     ]
 
     def __init__(self):
-        self.network = Network.mainnet()
-        self.client = AsyncClient(self.network)
+        self.client = chain_client()
 
     async def burn_supply_native(self):
         all_bank_balances = await self.client.fetch_bank_balances(address="inj1qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqe2hm49")
@@ -41,35 +38,11 @@ class PedroTokenInfo:
         cw20_tokens = [token for token in self.memecoin if token['cw20'] != "none"]
 
         for token in cw20_tokens:
-            total_supply = 0
-            burn_coin = 0
-            unique_holders = set()
-            holders = await self.client.fetch_all_contracts_state(address=token['cw20'], pagination=PaginationOption(limit=1000))
-
-            first_fetch = holders
-            while holders['pagination']['nextKey']:
-                pagination = PaginationOption(limit=1000, encoded_page_key=holders['pagination']['nextKey'])
-                holders = await self.client.fetch_all_contracts_state(address=token['cw20'], pagination=pagination)
-                first_fetch['models'] += holders['models']
-                first_fetch['pagination'] = holders['pagination']
-
-            for model in first_fetch['models']:
-                value_decoded = base64.b64decode(model['value']).decode('utf-8').strip('"')
-
-                if value_decoded.isdigit():
-                    amount_coin = float(value_decoded) / 10 ** 18
-                    total_supply += amount_coin
-                    
-                    inj_address = base64.b64decode(model['key']).decode('utf-8')[9:]
-
-                    if inj_address not in ["inj1qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqe2hm49", token['cw20']]:
-                        unique_holders.add(inj_address)
-                    
-                    if inj_address == "inj1qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqe2hm49" or inj_address == token['cw20']:
-                        burn_coin += amount_coin
-
-            token['total_supply_cw20'] = total_supply
-            token['total_burn_cw20'] = burn_coin
+            total_supply, burn_coin = await cw20_supply_and_burned(
+                token['cw20'], (BURN_ADDRESS, token['cw20']), client=self.client,
+            )
+            token['total_supply_cw20'] = total_supply / 10 ** 18
+            token['total_burn_cw20'] = burn_coin / 10 ** 18
 
     async def circulation_supply(self):
         await self.burn_supply_native()
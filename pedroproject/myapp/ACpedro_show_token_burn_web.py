@@ -1,18 +1,21 @@
 import asyncio
 import aiohttp
 from typing import Dict, List, Optional
-from pyinjective.core.network import Network
-from pyinjective.async_client import AsyncClient
+from .injective_chain import chain_client
 import backoff
 
 from .models import VerifiedToken
+from .tiered_cache import TieredCache
+
+# The verified-token list only changes when import_verified_tokens runs, which
+# invalidates it; the TTL is a backstop.
+VERIFIED_TOKENS_CACHE = TieredCache('verified_tokens', ttl=3600, max_entries=1)
 
 class TokenVerifier:
 
     def __init__(self, address: str):
         self.address = address
-        self.network = Network.mainnet()
-        self.client = AsyncClient(self.network)
+        self.client = chain_client()
         self.session = aiohttp.ClientSession()
         self.semaphore = asyncio.Semaphore(10)
         self.verified_tokens: List[Dict] = []
@@ -20,6 +23,10 @@ class TokenVerifier:
     async def _ensure_tokens_loaded(self) -> None:
         if self.verified_tokens:
             return
+        cached = await VERIFIED_TOKENS_CACHE.aget('all')
+        if cached is not None:
+            self.verified_tokens = cached
+            return
         # Map snake_case model fields back to the camelCase keys the rest of
         # this class expects, so _find_verified_token stays unchanged.
         self.verified_tokens = [
@@ -39,6 +46,7 @@ class TokenVerifier:
             }
             async for t in VerifiedToken.objects.all()
         ]
+        await VERIFIED_TOKENS_CACHE.aset('all', self.verified_tokens)
 
     @backoff.on_exception(backoff.expo, Exception, max_tries=5)
     async def _fetch_balances(self) -> Dict:
@@ -5,12 +5,14 @@ import json
 from typing import List, Dict, Any, Union
 from datetime import datetime
 
+from django.conf import settings
+
 from .models import ScamWallet
 
 class ScamScannerChecker:
     def __init__(self, address: str):
         self.address = address
-        self.base_url = f"https://sentry.exchange.grpc-web.injective.network/api/explorer/v1/accountTxs/{address}"
+        self.base_url = f"{settings.INJECTIVE_EXPLORER_API}/api/explorer/v1/accountTxs/{address}"
         self.df = pd.DataFrame()
         self.range_size = 100
         self.current_block = 0
@@ -1,18 +1,15 @@
-import base64
 import msgpack
-import json
 import asyncio
 import pandas as pd
 from datetime import datetime
-from pyinjective.core.network import Network
-from pyinjective.async_client import AsyncClient
+from .injective_chain import chain_client
+from .injective_cw20_balances import cw20_holders, fetch_cw20_balances_from_chain
 from pyinjective.client.model.pagination import PaginationOption
 
 class InjectiveMemeHolders:
 
     def __init__(self):
-        self.network = Network.mainnet()
-        self.client = AsyncClient(self.network)
+        self.client = chain_client()
 
     async def fetch_holder_native_token(self, native_address):
         async def fetch_page(pagination_key=None):
@@ -58,30 +55,16 @@ class InjectiveMemeHolders:
         return df_holder_native
     
     async def fetch_holders_cw20_token(self, cw20_address):
-        holders_cw20_wallet = []
-        holders = await self.client.fetch_all_contracts_state(address=cw20_address, pagination=PaginationOption(limit=1000))
-
-        if holders is None:
-            return
-
-        A = holders
-        while A['pagination']['nextKey']:
-            pagination = PaginationOption(limit=1000, encoded_page_key=A['pagination']['nextKey'])
-            holders = await self.client.fetch_all_contracts_state(address=cw20_address, pagination=pagination)
-            A['models'] += holders['models']
-            A['pagination'] = holders['pagination']
-
-        for model in A['models']:
-            try:
-                amount_Coin = int(base64.b64decode(model['value']).decode('utf-8').strip('"')) / 1e18
-                inj_address = base64.b64decode(model['key']).decode('utf-8')[9:]
-
-                if amount_Coin != 0:
-                    holders_cw20_wallet.append({'key': inj_address, 'value': amount_Coin})
-
-            except (ValueError, json.JSONDecodeError):
-                continue
-        
+        balances = await cw20_holders(cw20_address)
+        if balances is None:
+            balances = (
+                await fetch_cw20_balances_from_chain(cw20_address, client=self.client)
+            ).items()
+
+        holders_cw20_wallet = [
+            {'key': inj_address, 'value': amount / 1e18}
+            for inj_address, amount in balances
+        ]
         df_holders_cw20 = pd.DataFrame(holders_cw20_wallet)
         return df_holders_cw20
 
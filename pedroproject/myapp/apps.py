@@ -9,10 +9,10 @@ class MyappConfig(AppConfig):
     name = 'myapp'
 
     def ready(self):
-        # Warm the Pedro NFT holder cache in the background at boot so the
-        # first visitor after a (re)start doesn't wait on the full contract-
-        # state scan. Stale-while-revalidate keeps it warm afterwards — see
-        # _fetch_pedro_nft_count in views.py. This replaces the cron job.
+        # Refresh the Pedro NFT holder snapshot in the background at boot so
+        # the first visitor after a (re)start doesn't wait on the full
+        # contract-state scan. Stale-while-revalidate keeps it fresh
+        # afterwards — see _fetch_pedro_nft_count in views.py. This replaces the cron job.
         #
         # ready() also runs during manage.py commands (migrate, collectstatic,
         # the refresh_nft_holders command, tests…) where a network scan would
@@ -31,11 +31,14 @@ class MyappConfig(AppConfig):
         try:
             # Lazy import: avoid pulling views (and its heavy import chain) at
             # module-load time / into manage.py commands.
-            from .views import _trigger_async_holder_refresh
+            from .views import _trigger_async_holder_refresh, start_game_sync_flusher
 
             # Non-blocking — spawns its own daemon thread, so startup isn't
             # delayed by the scan.
             _trigger_async_holder_refresh()
+            # Buffered /game/upgrades/sync/ deltas live in this worker's
+            # memory, so this worker flushes the players who stopped syncing.
+            start_game_sync_flusher()
         except Exception:
             # Never let a boot-time warm-up break startup.
             pass
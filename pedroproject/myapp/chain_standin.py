@@ -0,0 +1,583 @@
+"""
+Offline stand-in for the Injective chain, for benchmarks and load tests.
+
+Everything that reads the chain goes through one of two doors: the gRPC
+gateway (`chain_client()`, injective_chain.py) or HTTP to the LCD / explorer
+(lcd_pool.py, the scam checker). The stand-in answers both from a dataset
+file, so the holder, scam and verification pipelines run with no network:
+
+    INJECTIVE_CHAIN_STANDIN=/tmp/chain.json      # gRPC calls, in-process
+    INJECTIVE_LCD_ENDPOINTS=http://127.0.0.1:8787 # LCD, via `chain_standin serve`
+    INJECTIVE_EXPLORER_API=http://127.0.0.1:8787  # explorer accountTxs
+
+A dataset is JSON with up to three parts:
+
+  * "synthetic": a spec the data is generated from on load, deterministic
+    for a given seed — CW20s with N holders, CW721s with N tokens, native
+    denoms with N owners, burn txs into the burn address and explorer
+    account txs. Only the spec is stored, so a 500k-holder CW20 is a few
+    bytes on disk (and some tens of MB once materialized).
+  * "grpc" / "lcd": responses recorded from mainnet by `chain_standin
+    record`, replayed verbatim and taking precedence over synthetic data.
+
+Latency and failures are injected per call: a base latency plus jitter, and
+a failure rate at which gRPC calls raise `StandinFailure` and HTTP requests
+answer 503. A gRPC call the dataset has no answer for raises
+`StandinMissingData`, naming the method or query. See
+`manage.py chain_standin --help` for building datasets.
+
+Synthetic addresses look like `inj1...` but carry no valid bech32 checksum;
+nothing on these code paths decodes them.
+"""
+
+import asyncio
+import base64
+import bisect
+import json
+import logging
+import random
+import re
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+from django.conf import settings
+
+from .injective_chain import CW20_BALANCE_NAMESPACE
+
+logger = logging.getLogger(__name__)
+
+BURN_ADDRESS = 'inj1qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqe2hm49'
+PEDRO_DENOM = (
+    'factory/inj14ejqjyq8um4p3xfqj74yld5waqljf88f9eneuk/'
+    'inj1c6lxety9hqn9q4khwqvjcfa24c2qeqvvfsg4fm'
+)
+PEDRO_CW20 = 'inj1c6lxety9hqn9q4khwqvjcfa24c2qeqvvfsg4fm'
+PEDRO_NFT_CONTRACT = 'inj1uq453kp4yda7ruc0axpmd9vzfm0fj62padhe0p'
+MSG_SEND_TYPE = '/cosmos.bank.v1beta1.MsgSend'
+
+# The chain's own sizes, give or take, for `chain_standin synthesize --preset`.
+PRESETS = {
+    'pedro': {
+        'cw20': {PEDRO_CW20: 20_000},
+        'cw721': {PEDRO_NFT_CONTRACT: {'tokens': 5_000}},
+        'denoms': {PEDRO_DENOM: 10_000},
+        'burn_txs': 2_000,
+    },
+    'large': {
+        'cw20': {PEDRO_CW20: 500_000},
+        'cw721': {PEDRO_NFT_CONTRACT: {'tokens': 100_000}},
+        'denoms': {PEDRO_DENOM: 100_000},
+        'burn_txs': 20_000,
+    },
+}
+
+CW721_TOKENS_NAMESPACE = b'\x00\x06tokens'
+_ADDRESS_CHARS = 'qpzry9x8gf2tvdw0s3jn54khce6mua7l'
+_GENESIS_HEIGHT = 80_000_000
+_GENESIS_TIME = 1_700_000_000  # unix seconds
+
+
+class StandinFailure(ConnectionError):
+    """An injected failure."""
+
+
+class StandinMissingData(LookupError):
+    """The dataset has no recorded response and no synthetic handler for a
+    call: record it from mainnet (`chain_standin record`) to replay it."""
+
+
+def _rng(seed: int, name: str) -> random.Random:
+    return random.Random(seed * 1_000_003 + zlib.crc32(name.encode()))
+
+
+def _address(rng: random.Random) -> str:
+    return 'inj1' + ''.join(rng.choices(_ADDRESS_CHARS, k=38))
+
+
+def _b64(raw: bytes) -> str:
+    return base64.b64encode(raw).decode()
+
+
+def _amount(rng: random.Random) -> int:
+    # Heavy-tailed like real holder lists: most dust, a few whales.
+    return int(rng.lognormvariate(0, 2.5) * 10 ** 18)
+
+
+def _iso(ts: int) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(ts))
+
+
+def _page(items: list, start: int, limit: int):
+    """Slice a key-sorted list; returns (page, index of the next item or None)."""
+    end = start + max(1, limit)
+    return items[start:end], (end if end < len(items) else None)
+
+
+# ---------------------------------------------------------------------------
+# Dataset
+# ---------------------------------------------------------------------------
+
+class ChainDataset:
+    """Recorded responses plus lazily materialized synthetic data."""
+
+    def __init__(self, synthetic: dict | None = None,
+                 grpc: dict | None = None, lcd: dict | None = None):
+        self.synthetic = synthetic or {}
+        self.grpc = grpc or {}
+        self.lcd = lcd or {}
+        self.seed = int(self.synthetic.get('seed', 1))
+        self._lock = threading.Lock()
+        self._state: dict[str, list[tuple[bytes, bytes]]] = {}
+        self._owners: dict[str, list[tuple[str, int]]] = {}
+        self._txs: dict | None = None
+
+    @classmethod
+    def load(cls, path: str) -> 'ChainDataset':
+        with open(path) as f:
+            data = json.load(f)
+        return cls(data.get('synthetic'), data.get('grpc'), data.get('lcd'))
+
+    def save(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump({'synthetic': self.synthetic, 'grpc': self.grpc, 'lcd': self.lcd}, f)
+
+    # -- synthetic contracts -------------------------------------------------
+
+    def contract_state(self, contract: str) -> list[tuple[bytes, bytes]]:
+        """Raw (key, value) state entries, sorted by key like the chain's."""
+        with self._lock:
+            if contract not in self._state:
+                self._state[contract] = self._build_state(contract)
+            return self._state[contract]
+
+    def _build_state(self, contract: str) -> list[tuple[bytes, bytes]]:
+        rng = _rng(self.seed, contract)
+        entries = []
+        cw20 = (self.synthetic.get('cw20') or {}).get(contract)
+        if cw20:
+            entries.append((b'token_info', json.dumps({
+                'name': 'Synthetic', 'symbol': 'SYN', 'decimals': 18,
+            }).encode()))
+            for _ in range(int(cw20)):
+                entries.append((
+                    CW20_BALANCE_NAMESPACE + _address(rng).encode(),
+                    f'"{_amount(rng)}"'.encode(),
+                ))
+        cw721 = (self.synthetic.get('cw721') or {}).get(contract)
+        if cw721:
+            tokens = int(cw721['tokens'])
+            owners = [_address(rng) for _ in range(max(1, int(cw721.get('owners') or tokens // 4)))]
+            entries.append((b'nft_info', json.dumps({'name': 'Synthetic NFT', 'symbol': 'SNFT'}).encode()))
+            for token_id in range(1, tokens + 1):
+                # Squared draw: a few wallets hold many tokens.
+                owner = owners[min(int(len(owners) * rng.random() ** 2), len(owners) - 1)]
+                entries.append((
+                    CW721_TOKENS_NAMESPACE + str(token_id).encode(),
+                    json.dumps({'owner': owner, 'token_id': str(token_id), 'approvals': []}).encode(),
+                ))
+        entries.sort()
+        return entries
+
+    def cw20_balance(self, contract: str, address: str) -> int | None:
+        raw = self.raw_state(contract, CW20_BALANCE_NAMESPACE + address.encode())
+        return None if raw is None else int(raw.decode().strip('"'))
+
+    def raw_state(self, contract: str, key: bytes) -> bytes | None:
+        state = self.contract_state(contract)
+        i = bisect.bisect_left(state, (key,))
+        if i < len(state) and state[i][0] == key:
+            return state[i][1]
+        return None
+
+    # -- synthetic bank ------------------------------------------------------
+
+    def denom_owners(self, denom: str) -> list[tuple[str, int]]:
+        with self._lock:
+            if denom not in self._owners:
+                count = int((self.synthetic.get('denoms') or {}).get(denom) or 0)
+                rng = _rng(self.seed, denom)
+                owners = {_address(rng): _amount(rng) for _ in range(count)}
+                if count:
+                    owners[BURN_ADDRESS] = owners.get(BURN_ADDRESS, 0) + self._burned(denom)
+                self._owners[denom] = sorted(owners.items())
+            return self._owners[denom]
+
+    def _burned(self, denom: str) -> int:
+        return sum(
+            int(msg['amount'][0]['amount'])
+            for tx, _ in self.txs().values()
+            for msg in tx['body']['messages']
+            if msg['amount'][0]['denom'] == denom
+        )
+
+    def balances_of(self, address: str) -> list[dict]:
+        out = []
+        for denom in self.synthetic.get('denoms') or {}:
+            owners = self.denom_owners(denom)
+            i = bisect.bisect_left(owners, (address,))
+            if i < len(owners) and owners[i][0] == address:
+                out.append({'denom': denom, 'amount': str(owners[i][1])})
+        return out
+
+    def supply_of(self, denom: str) -> int:
+        return sum(amount for _, amount in self.denom_owners(denom))
+
+    # -- synthetic txs -------------------------------------------------------
+
+    def txs(self) -> dict[str, tuple[dict, dict]]:
+        """{hash: (tx, tx_response)} for the synthetic burn txs, in height
+        order. Each sends 0.1–100 PEDRO from a PEDRO holder to the burn
+        address."""
+        if self._txs is not None:
+            return self._txs
+        count = int(self.synthetic.get('burn_txs') or 0)
+        denom = self.synthetic.get('burn_denom') or PEDRO_DENOM
+        rng = _rng(self.seed, 'burn_txs')
+        senders = [_address(rng) for _ in range(max(1, count // 10))]
+        txs = {}
+        for n in range(count):
+            sender = rng.choice(senders)
+            amount = str(rng.choice((1, 10, 50, 100, 1000)) * 10 ** 17)
+            height = _GENESIS_HEIGHT + n * 3
+            tx_hash = f'{zlib.crc32(f"{self.seed}:{n}".encode()):08X}' * 8
+            msg = {
+                '@type': MSG_SEND_TYPE,
+                'from_address': sender,
+                'to_address': BURN_ADDRESS,
+                'amount': [{'denom': denom, 'amount': amount}],
+            }
+            tx = {'body': {'messages': [msg], 'memo': rng.choice(('', 'pedro-game', 'raffle'))}}
+            tx_response = {
+                'txhash': tx_hash,
+                'height': str(height),
+                'code': 0,
+                'timestamp': _iso(_GENESIS_TIME + n * 3),
+                'events': [{'type': 'transfer', 'attributes': [
+                    {'key': 'recipient', 'value': BURN_ADDRESS},
+                    {'key': 'sender', 'value': sender},
+                    {'key': 'amount', 'value': f'{amount}{denom}'},
+                ]}],
+            }
+            txs[tx_hash] = (tx, tx_response)
+        self._txs = txs
+        return txs
+
+    def account_txs(self, address: str) -> list[dict]:
+        """Explorer-style tx rows for `address`, newest first."""
+        count = int((self.synthetic.get('account_txs') or {}).get(address) or 0)
+        rng = _rng(self.seed, f'account_txs:{address}')
+        rows = []
+        for n in range(count):
+            ts = _GENESIS_TIME + n * 600
+            rows.append({
+                'id': '',
+                'block_number': _GENESIS_HEIGHT + n * 200,
+                'block_timestamp': time.strftime('%Y-%m-%d %H:%M:%S.000 +0000 UTC', time.gmtime(ts)),
+                'hash': f'0x{zlib.crc32(f"{address}:{n}".encode()):08x}' * 8,
+                'code': 0,
+                'tx_type': 'injective',
+                'messages': [{'type': MSG_SEND_TYPE, 'value': {
+                    'from_address': address, 'to_address': _address(rng),
+                    'amount': [{'denom': 'inj', 'amount': str(_amount(rng))}],
+                }}],
+                'gas_wanted': 200_000,
+                'gas_used': rng.randint(80_000, 180_000),
+                'fee': 100_000_000_000_000,
+            })
+        rows.reverse()
+        return rows
+
+
+# ---------------------------------------------------------------------------
+# Behaviour (latency / failure injection)
+# ---------------------------------------------------------------------------
+
+@dataclass
+class StandinBehaviour:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    failure_rate: float = 0.0
+
+    @classmethod
+    def from_settings(cls) -> 'StandinBehaviour':
+        return cls(
+            latency_ms=float(getattr(settings, 'INJECTIVE_STANDIN_LATENCY_MS', 0) or 0),
+            jitter_ms=float(getattr(settings, 'INJECTIVE_STANDIN_JITTER_MS', 0) or 0),
+            failure_rate=float(getattr(settings, 'INJECTIVE_STANDIN_FAILURE_RATE', 0) or 0),
+        )
+
+    def delay(self) -> float:
+        jitter = random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        return (self.latency_ms + jitter) / 1000
+
+    def fails(self) -> bool:
+        return self.failure_rate > 0 and random.random() < self.failure_rate
+
+
+# ---------------------------------------------------------------------------
+# gRPC side: a gateway with ChainGateway's `call` / `close` surface
+# ---------------------------------------------------------------------------
+
+def _jsonable(value):
+    if hasattr(value, '__dict__') and not isinstance(value, (str, bytes, int, float)):
+        return {k: v for k, v in vars(value).items() if v is not None}
+    return value
+
+
+def grpc_key(method: str, args, kwargs) -> str:
+    """Stable key for a recorded call, e.g. fetch_bank_balances(address=X)."""
+    return json.dumps(
+        [method, [_jsonable(a) for a in args], {k: _jsonable(v) for k, v in kwargs.items()}],
+        sort_keys=True, default=str,
+    )
+
+
+class StandinGateway:
+    """Answers `AsyncClient.fetch_*` calls from a ChainDataset. Drop-in for
+    ChainGateway behind `ChainClient`."""
+
+    def __init__(self, dataset: ChainDataset, behaviour: StandinBehaviour | None = None):
+        self.dataset = dataset
+        self.behaviour = behaviour or StandinBehaviour()
+        self.calls: dict[str, int] = {}
+
+    async def call(self, method: str, *args, **kwargs):
+        self.calls[method] = self.calls.get(method, 0) + 1
+        delay = self.behaviour.delay()
+        if delay:
+            await asyncio.sleep(delay)
+        if self.behaviour.fails():
+            raise StandinFailure(f"injected failure in {method}")
+        recorded = self.dataset.grpc.get(grpc_key(method, args, kwargs))
+        if recorded is not None:
+            return recorded
+        handler = getattr(self, f'_{method}', None)
+        if handler is None:
+            raise StandinMissingData(f"chain stand-in has no data for {method}")
+        return handler(*args, **kwargs)
+
+    def close(self, timeout: float = 5.0) -> None:
+        pass
+
+    @staticmethod
+    def _start_and_limit(dataset_items, pagination, key_of):
+        key = getattr(pagination, 'encoded_page_key', None)
+        limit = getattr(pagination, 'limit', None) or 100
+        start = 0
+        if key:
+            start = bisect.bisect_left(dataset_items, key_of(base64.b64decode(key)))
+        return start, limit
+
+    # -- handlers ------------------------------------------------------------
+
+    def _fetch_all_contracts_state(self, address, pagination=None):
+        state = self.dataset.contract_state(address)
+        start, limit = self._start_and_limit(state, pagination, lambda k: (k,))
+        page, nxt = _page(state, start, limit)
+        return {
+            'models': [{'key': _b64(k), 'value': _b64(v)} for k, v in page],
+            'pagination': {'nextKey': _b64(state[nxt][0]) if nxt is not None else ''},
+        }
+
+    def _fetch_smart_contract_state(self, address, query_data):
+        query = json.loads(query_data)
+        if 'balance' in query:
+            balance = self.dataset.cw20_balance(address, query['balance']['address']) or 0
+            return {'data': _b64(json.dumps({'balance': str(balance)}).encode())}
+        raise StandinMissingData(
+            f"chain stand-in has no data for fetch_smart_contract_state query {sorted(query)}",
+        )
+
+    def _fetch_raw_contract_state(self, address, query_data):
+        raw = self.dataset.raw_state(address, query_data.encode())
+        return {'data': _b64(raw) if raw is not None else ''}
+
+    def _fetch_denom_owners(self, denom, pagination=None):
+        owners = self.dataset.denom_owners(denom)
+        start, limit = self._start_and_limit(owners, pagination, lambda k: (k.decode(),))
+        page, nxt = _page(owners, start, limit)
+        return {
+            'denomOwners': [
+                {'address': a, 'balance': {'denom': denom, 'amount': str(amount)}}
+                for a, amount in page
+            ],
+            'pagination': {
+                'nextKey': _b64(owners[nxt][0].encode()) if nxt is not None else '',
+                'total': str(len(owners)),
+            },
+        }
+
+    def _fetch_bank_balances(self, address, pagination=None):
+        balances = self.dataset.balances_of(address)
+        return {'balances': balances, 'pagination': {'total': str(len(balances))}}
+
+    def _fetch_supply_of(self, denom):
+        return {'amount': {'denom': denom, 'amount': str(self.dataset.supply_of(denom))}}
+
+    def _fetch_denom_metadata(self, denom):
+        symbol = denom.rsplit('/', 1)[-1][:12].upper()
+        return {'metadata': {
+            'base': denom,
+            'display': symbol,
+            'name': symbol,
+            'symbol': symbol,
+            'decimals': 18,
+            'denomUnits': [{'denom': denom, 'exponent': 0}, {'denom': symbol, 'exponent': 18}],
+        }}
+
+    def _fetch_denom_authority_metadata(self, creator, sub_denom=None):
+        return {'authorityMetadata': {'admin': creator}}
+
+    def _fetch_account(self, address):
+        return {'account': {
+            '@type': '/injective.types.v1beta1.EthAccount',
+            'baseAccount': {'address': address, 'accountNumber': '1', 'sequence': '0'},
+        }}
+
+    def _fetch_account_txs(self, address, pagination=None, **kwargs):
+        rows = self.dataset.account_txs(address)
+        skip = getattr(pagination, 'skip', None) or 0
+        limit = getattr(pagination, 'limit', None) or 100
+        return {'paging': {'total': str(len(rows))}, 'data': rows[skip:skip + limit]}
+
+
+class RecordingGateway:
+    """Wraps the real gateway and stores every response in `dataset.grpc`,
+    so `chain_standin record` can replay them offline later."""
+
+    def __init__(self, gateway, dataset: ChainDataset):
+        self.gateway = gateway
+        self.dataset = dataset
+
+    async def call(self, method: str, *args, **kwargs):
+        response = await self.gateway.call(method, *args, **kwargs)
+        self.dataset.grpc[grpc_key(method, args, kwargs)] = response
+        return response
+
+    def close(self, timeout: float = 5.0) -> None:
+        self.gateway.close(timeout)
+
+
+# ---------------------------------------------------------------------------
+# HTTP side: LCD and explorer REST
+# ---------------------------------------------------------------------------
+
+def lcd_key(path: str, params: dict) -> str:
+    items = sorted((k, str(v)) for k, v in (params or {}).items() if v is not None)
+    return f'{path}?{urlencode(items)}' if items else path
+
+
+_TX_BY_HASH = re.compile(r'^/cosmos/tx/v1beta1/txs/([0-9A-Fa-f]+)$')
+_CONTRACT_STATE = re.compile(r'^/cosmwasm/wasm/v1/contract/([^/]+)/state$')
+_ACCOUNT_TXS = re.compile(r'^/api/explorer/v1/accountTxs/([^/]+)$')
+_BALANCES = re.compile(r'^/cosmos/bank/v1beta1/balances/([^/]+)$')
+_QUERY_RECIPIENT = re.compile(r"transfer\.recipient='([^']+)'")
+_QUERY_MIN_HEIGHT = re.compile(r'tx\.height>=(\d+)')
+
+
+def lcd_response(dataset: ChainDataset, path: str, params: dict) -> tuple[int, dict]:
+    """(status, JSON body) the LCD / explorer REST API would give for GET
+    `path` with query `params`."""
+    recorded = dataset.lcd.get(lcd_key(path, params))
+    if recorded is not None:
+        return recorded['status'], recorded['body']
+
+    match = _TX_BY_HASH.match(path)
+    if match:
+        found = dataset.txs().get(match.group(1).upper())
+        if found is None:
+            return 404, {'code': 5, 'message': 'tx not found', 'details': []}
+        tx, tx_response = found
+        return 200, {'tx': tx, 'tx_response': tx_response}
+
+    if path == '/cosmos/tx/v1beta1/txs':
+        query = params.get('query') or params.get('events') or ''
+        recipient = _QUERY_RECIPIENT.search(query)
+        min_height = int((_QUERY_MIN_HEIGHT.search(query) or [0, 0])[1])
+        rows = [
+            (tx, resp) for tx, resp in dataset.txs().values()
+            if int(resp['height']) >= min_height
+            and (recipient is None or recipient.group(1) == BURN_ADDRESS)
+        ]
+        limit = int(params.get('limit') or 100)
+        page = max(1, int(params.get('page') or 1))
+        chunk = rows[(page - 1) * limit:page * limit]
+        return 200, {
+            'txs': [tx for tx, _ in chunk],
+            'tx_responses': [resp for _, resp in chunk],
+            'total': str(len(rows)),
+        }
+
+    match = _CONTRACT_STATE.match(path)
+    if match:
+        state = dataset.contract_state(match.group(1))
+        key = params.get('pagination.key')
+        start = bisect.bisect_left(state, (base64.b64decode(key),)) if key else 0
+        page, nxt = _page(state, start, int(params.get('pagination.limit') or 100))
+        return 200, {
+            'models': [{'key': k.hex().upper(), 'value': _b64(v)} for k, v in page],
+            'pagination': {'next_key': _b64(state[nxt][0]) if nxt is not None else None},
+        }
+
+    match = _ACCOUNT_TXS.match(path)
+    if match:
+        rows = dataset.account_txs(match.group(1))
+        if params.get('from_number') is not None and params.get('to_number') is not None:
+            lo, hi = int(params['from_number']), int(params['to_number'])
+            rows = [r for r in rows if lo <= r['block_number'] <= hi]
+        skip = int(params.get('skip') or 0)
+        limit = int(params.get('limit') or 100)
+        return 200, {'paging': {'total': len(rows)}, 'data': rows[skip:skip + limit]}
+
+    match = _BALANCES.match(path)
+    if match:
+        balances = dataset.balances_of(match.group(1))
+        return 200, {'balances': balances, 'pagination': {'total': str(len(balances))}}
+
+    if path == '/cosmos/bank/v1beta1/supply/by_denom':
+        denom = params.get('denom', '')
+        return 200, {'amount': {'denom': denom, 'amount': str(dataset.supply_of(denom))}}
+
+    return 501, {'code': 12, 'message': f'chain stand-in does not serve {path}'}
+
+
+def serve_http(dataset: ChainDataset, host: str = '127.0.0.1', port: int = 8787,
+               behaviour: StandinBehaviour | None = None) -> ThreadingHTTPServer:
+    """Start the LCD / explorer stand-in on a background thread and return
+    the server (`server.shutdown()` stops it; port 0 picks a free one)."""
+    behaviour = behaviour or StandinBehaviour()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, fmt, *args):
+            logger.debug("chain stand-in: " + fmt, *args)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            delay = behaviour.delay()
+            if delay:
+                time.sleep(delay)
+            if behaviour.fails():
+                status, body = 503, {'code': 14, 'message': 'injected failure'}
+            else:
+                status, body = lcd_response(dataset, unquote(url.path), params)
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True, name='chain-standin-http').start()
+    return server
+
+
+def load_standin_gateway(path: str) -> StandinGateway:
+    logger.warning("Injective chain calls are served by the offline stand-in (%s)", path)
+    return StandinGateway(ChainDataset.load(path), StandinBehaviour.from_settings())
@@ -0,0 +1,203 @@
+"""
+Local index of everything sent to the $PEDRO burn address.
+
+Every paid action (game score, raffle tickets, proposal creation, ...) burns
+$PEDRO by sending it to PEDRO_BURN_ADDRESS, and each verification used to
+download the tx again. `index_burns()` follows the LCD tx search for
+`transfer.recipient='<burn address>'` in height order, from the height stored
+in `BurnIndexCursor`, and writes one compact `BurnEvent` row per coin
+received. It runs from the `index_burns` management command on cron, under a
+lease so only one worker pages the LCD.
+
+Reader: `indexed_burn_match()` answers "does tx X burn exactly N of denom D
+from address A" from the table. It returns None when the tx isn't indexed
+(yet), so `GameVerifier.verify_pedro_burn` falls back to the LCD. Burn totals
+stay on the burn address's bank balance, which is authoritative; the index
+only ever covers what its tx search has returned.
+
+Transfers are read from the tx events rather than the message list, so a
+burn made by a contract (a BankMsg from inside an execute) is counted too;
+its `from_address` is then the contract, which never matches a user's burn.
+"""
+
+import logging
+import re
+from datetime import datetime, timezone
+
+import requests
+from django.utils.dateparse import parse_datetime
+
+from .injective_txs import normalize_tx_hash
+from .lcd_pool import lcd_get
+from .leases import hold_lease, renew_lease
+from .models import BurnEvent, BurnIndexCursor
+
+logger = logging.getLogger(__name__)
+
+BURN_ADDRESS = 'inj1qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqe2hm49'
+BURN_INDEX_LEASE = 'burn_index'
+BURN_INDEX_LEASE_SECONDS = 120
+# The LCD caps tx search pages at 100.
+BURN_SEARCH_PAGE_LIMIT = 100
+BURN_SEARCH_TIMEOUT = 20  # seconds
+
+_COIN_RE = re.compile(r'^(\d+)([a-zA-Z].*)$')
+
+
+class BurnIndexError(Exception):
+    pass
+
+
+def _parse_coins(value: str) -> list[tuple[str, int]]:
+    """'100factory/x/y,5inj' -> [('factory/x/y', 100), ('inj', 5)]"""
+    coins = []
+    for part in (value or '').split(','):
+        match = _COIN_RE.match(part.strip())
+        if match:
+            coins.append((match.group(2), int(match.group(1))))
+    return coins
+
+
+def _transfer_events(tx_response: dict) -> list[dict]:
+    """`transfer` events as {attribute: value} dicts. Newer LCDs put all
+    events on the tx response; older ones nest them in per-message logs."""
+    events = tx_response.get('events')
+    if not events:
+        events = [e for log in tx_response.get('logs') or () for e in log.get('events') or ()]
+    out = []
+    for event in events:
+        if event.get('type') != 'transfer':
+            continue
+        out.append({a.get('key'): a.get('value') for a in event.get('attributes') or ()})
+    return out
+
+
+def burn_events_from_tx(tx_response: dict, tx: dict | None) -> list[BurnEvent]:
+    """Unsaved BurnEvent rows for every coin `tx_response` sent to the burn
+    address. Failed txs burn nothing."""
+    if tx_response.get('code', 0) != 0:
+        return []
+    tx_hash = normalize_tx_hash(tx_response.get('txhash', ''))
+    memo = (((tx or {}).get('body') or {}).get('memo') or '')[:256]
+    height = int(tx_response.get('height') or 0)
+    block_time = parse_datetime(tx_response.get('timestamp') or '')
+    rows = []
+    for attrs in _transfer_events(tx_response):
+        if attrs.get('recipient') != BURN_ADDRESS:
+            continue
+        for denom, amount in _parse_coins(attrs.get('amount', '')):
+            rows.append(BurnEvent(
+                tx_hash=tx_hash,
+                seq=len(rows),
+                from_address=attrs.get('sender', ''),
+                denom=denom,
+                amount_wei=str(amount),
+                memo=memo,
+                height=height,
+                block_time=block_time,
+            ))
+    return rows
+
+
+def _search_page(from_height: int, page: int) -> dict:
+    params = {
+        'query': f"transfer.recipient='{BURN_ADDRESS}' AND tx.height>={from_height}",
+        'order_by': 'ORDER_BY_ASC',
+        'page': page,
+        'limit': BURN_SEARCH_PAGE_LIMIT,
+    }
+    try:
+        resp = lcd_get("/cosmos/tx/v1beta1/txs", params=params, timeout=BURN_SEARCH_TIMEOUT)
+    except requests.RequestException as e:
+        raise BurnIndexError(f"LCD tx search unreachable: {e}") from e
+    if resp.status_code != 200:
+        raise BurnIndexError(f"LCD tx search failed (status {resp.status_code})")
+    try:
+        return resp.json()
+    except ValueError as e:
+        raise BurnIndexError("Invalid JSON from LCD tx search") from e
+
+
+def _index_pages(cursor: BurnIndexCursor, max_pages: int | None, lease) -> dict:
+    stats = {'pages': 0, 'txs': 0, 'events': 0, 'caught_up': False}
+    from_height = cursor.next_height
+    page = 1
+    while max_pages is None or stats['pages'] < max_pages:
+        data = _search_page(from_height, page)
+        tx_responses = data.get('tx_responses') or []
+        txs = data.get('txs') or []
+        rows = []
+        for i, tx_response in enumerate(tx_responses):
+            rows.extend(burn_events_from_tx(tx_response, txs[i] if i < len(txs) else None))
+        # Pages overlap the previous run at `next_height`; the unique
+        # (tx_hash, seq) makes re-inserting those rows a no-op.
+        BurnEvent.objects.bulk_create(rows, ignore_conflicts=True, batch_size=500)
+
+        stats['pages'] += 1
+        stats['txs'] += len(tx_responses)
+        stats['events'] += len(rows)
+        if tx_responses:
+            # Results are in height order, so every height below the last
+            # one seen is complete; the last one is re-read next time.
+            cursor.next_height = max(cursor.next_height, int(tx_responses[-1].get('height') or 0))
+        cursor.save(update_fields=['next_height', 'updated_at'])
+        if lease is not None and not renew_lease(lease, BURN_INDEX_LEASE_SECONDS):
+            logger.warning("Burn index lease lost after %s pages; stopping", stats['pages'])
+            break
+
+        if len(tx_responses) < BURN_SEARCH_PAGE_LIMIT:
+            stats['caught_up'] = True
+            break
+        page += 1
+    return stats
+
+
+def index_burns(max_pages: int | None = None) -> dict | None:
+    """Advance the burn index. Returns run stats, or None when another
+    worker holds the indexer lease."""
+    with hold_lease(BURN_INDEX_LEASE, BURN_INDEX_LEASE_SECONDS) as lease:
+        if lease is None:
+            return None
+        cursor, _ = BurnIndexCursor.objects.get_or_create(address=BURN_ADDRESS)
+        try:
+            stats = _index_pages(cursor, max_pages, lease)
+        except BurnIndexError as e:
+            cursor.last_error = str(e)[:1000]
+            cursor.save(update_fields=['last_error', 'updated_at'])
+            raise
+        fields = ['events', 'last_error', 'updated_at']
+        cursor.events = BurnEvent.objects.count()
+        cursor.last_error = ''
+        if stats['caught_up']:
+            cursor.caught_up_at = datetime.now(timezone.utc)
+            fields.append('caught_up_at')
+        cursor.save(update_fields=fields)
+        stats['next_height'] = cursor.next_height
+        return stats
+
+
+# ---------------------------------------------------------------------------
+# Readers
+# ---------------------------------------------------------------------------
+
+def indexed_burn_match(tx_hash: str, from_address: str, denom: str, amount_wei: str) -> bool | None:
+    """True/False when `tx_hash` is in the index: whether it burned exactly
+    `amount_wei` of `denom` from `from_address`. None when it isn't indexed,
+    meaning the caller has to ask the LCD."""
+    rows = list(
+        BurnEvent.objects
+        .filter(tx_hash=normalize_tx_hash(tx_hash))
+        .values_list('from_address', 'denom', 'amount_wei')
+    )
+    if not rows:
+        return None
+    try:
+        expected = int(amount_wei)
+        amounts = [int(amount) for _, _, amount in rows]
+    except (TypeError, ValueError):
+        return None
+    return any(
+        sender == from_address and row_denom == denom and amount == expected
+        for (sender, row_denom, _), amount in zip(rows, amounts)
+    )
+
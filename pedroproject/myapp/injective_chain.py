@@ -0,0 +1,477 @@
+"""
+Process-wide gateway to the Injective chain.
+
+Every on-chain class used to build `Network.mainnet()` + a fresh `AsyncClient`
+in its __init__, so each HTTP request paid gRPC channel setup and TLS
+handshakes again. Instead, each worker process now owns ONE gateway: a small
+pool of AsyncClients living on a dedicated event-loop thread. Callers on any
+loop (ASGI, asgiref's per-request loop under WSGI, `asyncio.run` in a
+management command) hand their calls to that loop and await the result, so
+the channels are opened once and reused for the life of the worker.
+
+    client = chain_client()
+    balances = await client.fetch_bank_balances(address=address)
+
+`chain_client()` returns a thin proxy with the same `fetch_*` surface as
+AsyncClient, which is why the existing classes only had to swap the line that
+built their client.
+"""
+
+import asyncio
+import atexit
+import base64
+import binascii
+import contextlib
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+from django.conf import settings
+from pyinjective.async_client import AsyncClient
+from pyinjective.client.model.pagination import PaginationOption
+from pyinjective.core.network import Network
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_CONCURRENCY = 32
+
+
+class ChainGateway:
+    """Owns the event-loop thread, the AsyncClient pool and the concurrency
+    limit. Started lazily on first use; `close()` shuts the channels down."""
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 network_factory=Network.mainnet):
+        self.pool_size = max(1, int(pool_size))
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._network_factory = network_factory
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._clients: list[AsyncClient] = []
+        self._next_client = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+        with self._lock:
+            if self._loop is not None:
+                return self._loop
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=self._run_loop, args=(loop,),
+                daemon=True, name='injective-chain-gateway',
+            )
+            thread.start()
+            # gRPC aio channels bind to the loop that creates them, so the
+            # clients must be built on the gateway loop, not the caller's.
+            asyncio.run_coroutine_threadsafe(self._open(), loop).result()
+            self._thread = thread
+            self._loop = loop
+            logger.info(
+                "Injective chain gateway started (%s clients, %s concurrent calls)",
+                self.pool_size, self.max_concurrency,
+            )
+            return loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    async def _open(self) -> None:
+        network = self._network_factory()
+        self._clients = [AsyncClient(network) for _ in range(self.pool_size)]
+        self._next_client = itertools.cycle(self._clients)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def _shutdown(self) -> None:
+        for client in self._clients:
+            client._cancel_timeout_height_sync_task()
+            for channel in (
+                client.chain_channel,
+                client.exchange_channel,
+                client.explorer_channel,
+                client.chain_stream_channel,
+            ):
+                try:
+                    await channel.close()
+                except Exception as e:  # never let one channel block the rest
+                    logger.debug("Error closing gRPC channel: %s", e)
+        self._clients = []
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Close every channel and stop the loop thread. Safe to call twice."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.warning("Injective chain gateway shutdown incomplete: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+        loop.close()
+
+    # -- calls -------------------------------------------------------------
+
+    async def _call(self, method: str, args, kwargs):
+        async with self._semaphore:
+            client = next(self._next_client)
+            return await getattr(client, method)(*args, **kwargs)
+
+    async def call(self, method: str, *args, **kwargs):
+        """Run `AsyncClient.<method>(*args, **kwargs)` on the gateway loop and
+        await it from whichever loop the caller is on."""
+        loop = self._ensure_started()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            return await self._call(method, args, kwargs)
+        future = asyncio.run_coroutine_threadsafe(
+            self._call(method, args, kwargs), loop,
+        )
+        # Cancelling the caller (timeout, client disconnect) cancels the
+        # in-flight call on the gateway loop too.
+        return await asyncio.wrap_future(future)
+
+
+class ChainClient:
+    """Drop-in stand-in for AsyncClient: any `client.fetch_*(...)` call is
+    routed through the shared gateway."""
+
+    def __init__(self, gateway: ChainGateway):
+        self._gateway = gateway
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        async def method(*args, **kwargs):
+            return await self._gateway.call(name, *args, **kwargs)
+
+        method.__name__ = name
+        return method
+
+
+_GATEWAY: ChainGateway | None = None
+_GATEWAY_PID: int | None = None
+_GATEWAY_LOCK = threading.Lock()
+
+
+def get_chain_gateway() -> ChainGateway:
+    """The gateway for this worker process. Re-created after a fork so a
+    gunicorn worker never inherits its parent's loop thread or sockets.
+    With settings.INJECTIVE_CHAIN_STANDIN set, the offline stand-in
+    (chain_standin.py) answers instead of mainnet."""
+    global _GATEWAY, _GATEWAY_PID
+    pid = os.getpid()
+    if _GATEWAY is not None and _GATEWAY_PID == pid:
+        return _GATEWAY
+    with _GATEWAY_LOCK:
+        if _GATEWAY is None or _GATEWAY_PID != pid:
+            standin = getattr(settings, 'INJECTIVE_CHAIN_STANDIN', '')
+            if standin:
+                from .chain_standin import load_standin_gateway
+                _GATEWAY = load_standin_gateway(standin)
+                _GATEWAY_PID = pid
+                return _GATEWAY
+            _GATEWAY = ChainGateway(
+                pool_size=getattr(settings, 'INJECTIVE_CHAIN_POOL_SIZE', DEFAULT_POOL_SIZE),
+                max_concurrency=getattr(
+                    settings, 'INJECTIVE_CHAIN_MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY,
+                ),
+            )
+            _GATEWAY_PID = pid
+        return _GATEWAY
+
+
+def chain_client() -> ChainClient:
+    return ChainClient(get_chain_gateway())
+
+
+def close_chain_gateway() -> None:
+    global _GATEWAY
+    with _GATEWAY_LOCK:
+        gateway, _GATEWAY = _GATEWAY, None
+    if gateway is not None and _GATEWAY_PID == os.getpid():
+        gateway.close()
+
+
+atexit.register(close_chain_gateway)
+
+
+# ---------------------------------------------------------------------------
+# Contract-state scanning
+# ---------------------------------------------------------------------------
+
+STATE_PAGE_LIMIT = 1000
+
+
+@dataclass
+class ContractStateScanStats:
+    """Counters filled in by `scan_contract_state` as it goes. `next_key` is
+    the pagination key of the first page NOT yet read (None once the scan
+    reached the end), so a caller that stops early can resume from it."""
+    pages: int = 0
+    entries: int = 0    # state entries received
+    matched: int = 0    # entries that passed the key filter and decoded
+    skipped: int = 0    # passed the filter but failed to decode
+    bytes: int = 0      # base64 key + value characters received
+    seconds: float = 0.0
+    next_key: str | None = None
+    complete: bool = False
+
+
+def b64_key_prefix(namespace: bytes) -> str:
+    """Longest base64 string every key starting with `namespace` shares.
+    Only whole 3-byte groups encode independently of the bytes after them,
+    so the tail of the namespace is checked on the decoded key instead."""
+    aligned = len(namespace) - len(namespace) % 3
+    return base64.b64encode(namespace[:aligned]).decode()
+
+
+def decode_json_value(raw: bytes):
+    return json.loads(raw)
+
+
+def decode_int_value(raw: bytes) -> int:
+    # CW20 amounts are stored as a JSON string: b'"123"'.
+    return int(raw.decode('utf-8').strip('"'))
+
+
+async def scan_contract_state_pages(
+    client,
+    contract: str,
+    *,
+    key_prefix: bytes = b'',
+    decode=decode_json_value,
+    start_key: str | None = None,
+    max_pages: int | None = None,
+    page_limit: int = STATE_PAGE_LIMIT,
+    stats: ContractStateScanStats | None = None,
+) -> AsyncIterator[list[tuple[bytes, object]]]:
+    """Stream a contract's raw state one page at a time, as lists of
+    `(key bytes, decoded value)` pairs.
+
+    Only one page is held at a time, so memory stays flat however large the
+    contract is. The request for page N+1 is sent before page N is decoded
+    and handed to the caller, so decoding overlaps the network round trip.
+    Entries whose key does not start with `key_prefix` are dropped on the
+    base64 string before anything is decoded; values `decode` rejects are
+    counted in `stats.skipped` and skipped.
+
+    `start_key` / `max_pages` bound a scan to a slice of the contract. While
+    a page is with the caller, `stats.next_key` is the key of the page after
+    it, so a caller that stops between pages can resume from there."""
+    stats = stats if stats is not None else ContractStateScanStats()
+    b64_prefix = b64_key_prefix(key_prefix)
+    started = time.monotonic()
+
+    def fetch(key):
+        return asyncio.ensure_future(client.fetch_all_contracts_state(
+            address=contract,
+            pagination=PaginationOption(limit=page_limit, encoded_page_key=key),
+        ))
+
+    stats.next_key = start_key
+    pending = fetch(start_key)
+    pages = 0
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            pages += 1
+            stats.pages += 1
+            next_key = (page or {}).get('pagination', {}).get('nextKey') or None
+            stats.next_key = next_key
+            if next_key and (max_pages is None or pages < max_pages):
+                pending = fetch(next_key)
+
+            entries = []
+            for model in (page or {}).get('models', ()):
+                key_b64, value_b64 = model['key'], model['value']
+                stats.entries += 1
+                stats.bytes += len(key_b64) + len(value_b64)
+                if not key_b64.startswith(b64_prefix):
+                    continue
+                try:
+                    key = base64.b64decode(key_b64)
+                    if not key.startswith(key_prefix):
+                        continue
+                    value = decode(base64.b64decode(value_b64))
+                except (binascii.Error, ValueError, UnicodeDecodeError):
+                    stats.skipped += 1
+                    continue
+                stats.matched += 1
+                entries.append((key, value))
+            yield entries
+        stats.complete = stats.next_key is None
+    finally:
+        if pending is not None:
+            pending.cancel()
+        stats.seconds += time.monotonic() - started
+
+
+async def scan_contract_state(
+    client,
+    contract: str,
+    *,
+    stats: ContractStateScanStats | None = None,
+    **options,
+) -> AsyncIterator[tuple[bytes, object]]:
+    """`scan_contract_state_pages`, flattened to one `(key bytes, decoded
+    value)` pair at a time; takes the same options. A caller that stops
+    mid-page should not resume from `stats.next_key`, which already points
+    past the page it stopped in."""
+    stats = stats if stats is not None else ContractStateScanStats()
+    async with contextlib.aclosing(
+        scan_contract_state_pages(client, contract, stats=stats, **options),
+    ) as pages:
+        async for entries in pages:
+            for entry in entries:
+                yield entry
+
+
+class LcdStateError(ConnectionError):
+    """The LCD answered a contract-state page with an error status."""
+
+
+class LcdContractStateClient:
+    """`fetch_all_contracts_state` served by the LCD REST API (through the
+    worker's LcdPool) in the gRPC response shape, so `scan_contract_state`
+    can page a contract over LCD with the same loop. The REST API returns
+    keys hex-encoded and the pagination key as `next_key`; both are
+    translated here."""
+
+    def __init__(self, timeout: float = 30):
+        self.timeout = timeout
+
+    async def fetch_all_contracts_state(self, address: str, pagination=None) -> dict:
+        from .lcd_pool import lcd_get
+
+        params = {'pagination.limit': str(getattr(pagination, 'limit', None) or STATE_PAGE_LIMIT)}
+        key = getattr(pagination, 'encoded_page_key', None)
+        if key:
+            params['pagination.key'] = key
+        resp = await asyncio.to_thread(
+            lcd_get, f"/cosmwasm/wasm/v1/contract/{address}/state",
+            params=params, timeout=self.timeout,
+        )
+        if resp.status_code != 200:
+            raise LcdStateError(f"HTTP {resp.status_code}")
+        data = resp.json()
+        return {
+            'models': [
+                {
+                    'key': base64.b64encode(bytes.fromhex(model.get('key') or '')).decode(),
+                    'value': model.get('value') or '',
+                }
+                for model in data.get('models') or ()
+            ],
+            'pagination': {'nextKey': (data.get('pagination') or {}).get('next_key') or ''},
+        }
+
+
+# Raw storage key of a CW20 `balance` Map entry is this namespace prefix
+# (2-byte length + b"balance") followed by the holder address bytes.
+CW20_BALANCE_NAMESPACE = b'\x00\x07balance'
+# Same prefix, base64-encoded as it appears in `fetch_all_contracts_state`
+# keys. 9 bytes -> 12 chars with no padding, so it is a clean string prefix.
+CW20_BALANCE_KEY_PREFIX_B64 = b64_key_prefix(CW20_BALANCE_NAMESPACE)
+
+
+async def scan_cw20_balances(client, contract: str,
+                             stats: ContractStateScanStats | None = None,
+                             ) -> AsyncIterator[tuple[str, int]]:
+    """Stream `(holder address, raw amount)` for every entry of a CW20's
+    `balance` map, zero balances included."""
+    async for key, amount in scan_contract_state(
+        client, contract,
+        key_prefix=CW20_BALANCE_NAMESPACE, decode=decode_int_value, stats=stats,
+    ):
+        yield key[len(CW20_BALANCE_NAMESPACE):].decode('utf-8'), amount
+
+
+def decode_nft_token_owner(raw: bytes) -> tuple[str, str]:
+    obj = json.loads(raw)
+    # Token records carry BOTH owner and token_id; config, minter and other
+    # state entries don't.
+    if not isinstance(obj, dict) or not obj.get('owner') or not obj.get('token_id'):
+        raise ValueError('not a token record')
+    return obj['owner'], obj['token_id']
+
+
+async def fetch_nft_owner_counts(client, contract: str,
+                                 stats: ContractStateScanStats | None = None,
+                                 ) -> dict[str, dict]:
+    """{owner: {'token_id': first token seen, 'total': tokens held}} for an
+    NFT contract, aggregated while streaming so individual token records are
+    never held in memory. Raw state is used because the standard CW721
+    `tokens(owner)` query doesn't return correct counts on the Pedro NFT
+    contract."""
+    owners: dict[str, dict] = {}
+    async for _, (owner, token_id) in scan_contract_state(
+        client, contract, decode=decode_nft_token_owner, stats=stats,
+    ):
+        entry = owners.get(owner)
+        if entry is None:
+            owners[owner] = {'token_id': token_id, 'total': 1}
+        else:
+            entry['total'] += 1
+    return owners
+
+
+async def fetch_cw20_balance(client, contract: str, address: str) -> int:
+    """Raw (integer, undivided) CW20 balance of `address`, in one round trip.
+
+    Tries the contract's `{"balance": {"address": ...}}` smart query first,
+    then a raw-key read of the `balance` Map entry, and only falls back to
+    paging the whole contract state if both point lookups fail (e.g. a
+    non-standard CW20 or a node that rejects the query)."""
+    try:
+        response = await client.fetch_smart_contract_state(
+            address=contract,
+            query_data=json.dumps({'balance': {'address': address}}),
+        )
+        return int(json.loads(base64.b64decode(response['data']))['balance'])
+    except Exception as e:
+        logger.info("CW20 smart balance query failed for %s: %s", contract, e)
+
+    try:
+        response = await client.fetch_raw_contract_state(
+            address=contract,
+            query_data=(CW20_BALANCE_NAMESPACE + address.encode()).decode(),
+        )
+        raw = base64.b64decode(response.get('data') or '')
+        # An absent key means the address never held the token.
+        return int(raw.decode().strip('"')) if raw else 0
+    except Exception as e:
+        logger.info("CW20 raw balance lookup failed for %s: %s", contract, e)
+
+    return await scan_cw20_balance(client, contract, address)
+
+
+async def scan_cw20_balance(client, contract: str, address: str) -> int:
+    """Slow path for `fetch_cw20_balance`: stream the contract's balances
+    until one holder's entry turns up. O(all holders) — only a fallback."""
+    async with contextlib.aclosing(scan_cw20_balances(client, contract)) as balances:
+        async for holder, amount in balances:
+            if holder == address:
+                return amount
+    return 0
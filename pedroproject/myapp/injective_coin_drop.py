@@ -1,15 +1,13 @@
 import asyncio
 import pandas as pd
 from datetime import datetime
-from pyinjective.core.network import Network
-from pyinjective.async_client import AsyncClient
+from .injective_chain import chain_client
 from pyinjective.client.model.pagination import PaginationOption
 
 class CoinDrop:
 
     def __init__(self):
-        self.network = Network.mainnet()
-        self.client = AsyncClient(self.network)
+        self.client = chain_client()
 
     async def fetch_holder_native_token(self, native_address):
         async def fetch_page(pagination_key=None):
@@ -0,0 +1,212 @@
+"""
+Materialized CW20 balances for the Pedro / Shroom / Nonja tokens.
+
+`refresh_cw20_balances()` pages the contract state once (from the
+`refresh_cw20_balances` management command, on cron) and writes the result to
+the `Cw20Balance` table, touching only the rows whose balance actually
+changed. Holder lists, supply, burn totals and per-wallet balances are then
+answered from SQL by the async helpers below, so none of the dashboards page
+the chain inside a request.
+
+A contract that has never been refreshed has no `Cw20BalanceSync` row; the
+readers return None for it so callers can fall back to the chain until the
+first refresh lands (e.g. right after deploying this table).
+"""
+
+import logging
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+
+from .injective_chain import ContractStateScanStats, chain_client, scan_cw20_balances
+from .models import Cw20Balance, Cw20BalanceSync
+
+logger = logging.getLogger(__name__)
+
+PEDRO_CW20 = 'inj1c6lxety9hqn9q4khwqvjcfa24c2qeqvvfsg4fm'
+SHROOM_CW20 = 'inj1300xcg9naqy00fujsr9r8alwk7dh65uqu87xm8'
+NONJA_CW20 = 'inj1fu5u29slsg2xtsj7v5la22vl4mr4ywl7wlqeck'
+TRACKED_CW20_CONTRACTS = (PEDRO_CW20, SHROOM_CW20, NONJA_CW20)
+
+BURN_ADDRESS = 'inj1qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqe2hm49'
+
+
+# ---------------------------------------------------------------------------
+# Refresh (background job)
+# ---------------------------------------------------------------------------
+
+async def fetch_cw20_balances_from_chain(contract: str, client=None) -> dict[str, int]:
+    """Full scan of a CW20's `balance` map -> {address: raw amount}. Zero
+    balances are dropped."""
+    client = client or chain_client()
+    stats = ContractStateScanStats()
+    balances = {
+        address: amount
+        async for address, amount in scan_cw20_balances(client, contract, stats=stats)
+        if amount
+    }
+    logger.debug(
+        "CW20 scan of %s: %s pages, %s entries, %s bytes in %.1fs",
+        contract, stats.pages, stats.entries, stats.bytes, stats.seconds,
+    )
+    return balances
+
+
+def _raw_amount(value: str) -> int | None:
+    """A stored digit string as an int; None for a value that isn't one
+    (e.g. a rounded float left by the old DecimalField column), so the
+    refresh rewrites it."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        try:
+            return int(Decimal(value))
+        except (InvalidOperation, TypeError, ValueError):
+            return None
+
+
+def store_cw20_balances(contract: str, balances: dict[str, int]) -> dict:
+    """Diff `balances` against the stored rows for `contract` and write only
+    what changed: new holders are inserted, changed amounts updated, holders
+    that dropped to zero (or vanished) deleted. Stamps `Cw20BalanceSync`
+    in the same transaction so readers never see a half-applied refresh.
+
+    The contract's sync row is locked before the stored rows are read, so
+    two refreshes of one contract run one after the other instead of
+    diffing against the same rows."""
+    now = datetime.now(timezone.utc)
+    with transaction.atomic():
+        sync, _ = (
+            Cw20BalanceSync.objects
+            .select_for_update()
+            .get_or_create(contract=contract, defaults={'synced_at': now})
+        )
+        existing = {
+            address: (pk, _raw_amount(amount))
+            for pk, address, amount in
+            Cw20Balance.objects.filter(contract=contract).values_list('id', 'address', 'amount')
+        }
+
+        to_create, to_update = [], []
+        for address, amount in balances.items():
+            current = existing.get(address)
+            if current is None:
+                to_create.append(Cw20Balance(
+                    contract=contract, address=address, amount=str(amount),
+                ))
+            elif current[1] != amount:
+                to_update.append(Cw20Balance(
+                    id=current[0], amount=str(amount), updated_at=now,
+                ))
+        stale_ids = [pk for address, (pk, _) in existing.items() if address not in balances]
+
+        if stale_ids:
+            Cw20Balance.objects.filter(id__in=stale_ids).delete()
+        if to_update:
+            # bulk_update bypasses auto_now, hence the explicit updated_at.
+            Cw20Balance.objects.bulk_update(to_update, ['amount', 'updated_at'], batch_size=500)
+        if to_create:
+            Cw20Balance.objects.bulk_create(to_create, batch_size=500)
+        sync.holders = len(balances)
+        sync.total_supply = str(sum(balances.values()))
+        sync.rows_changed = len(to_create) + len(to_update) + len(stale_ids)
+        sync.synced_at = now
+        sync.save()
+
+    return {
+        'contract': contract,
+        'holders': len(balances),
+        'created': len(to_create),
+        'updated': len(to_update),
+        'deleted': len(stale_ids),
+    }
+
+
+async def refresh_cw20_balances(contract: str, client=None) -> dict:
+    """Scan the chain for `contract` and store the result. Async so it can
+    share the scan with other chain work; the DB half runs in a thread."""
+    balances = await fetch_cw20_balances_from_chain(contract, client=client)
+    stats = await sync_to_async(store_cw20_balances, thread_sensitive=True)(contract, balances)
+    logger.info(
+        "CW20 balances refreshed for %s: %s holders (+%s ~%s -%s)",
+        contract, stats['holders'], stats['created'], stats['updated'], stats['deleted'],
+    )
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# Readers (request path)
+# ---------------------------------------------------------------------------
+
+async def cw20_synced_at(contract: str) -> datetime | None:
+    """When `contract` was last refreshed, or None if it never was."""
+    return await (
+        Cw20BalanceSync.objects
+        .filter(contract=contract)
+        .values_list('synced_at', flat=True)
+        .afirst()
+    )
+
+
+async def cw20_holders(contract: str) -> list[tuple[str, int]] | None:
+    """[(address, raw amount)] for every non-zero holder, largest first."""
+    if await cw20_synced_at(contract) is None:
+        return None
+    holders = [
+        (address, _raw_amount(amount) or 0)
+        async for address, amount in
+        Cw20Balance.objects.filter(contract=contract).values_list('address', 'amount')
+    ]
+    holders.sort(key=lambda h: h[1], reverse=True)
+    return holders
+
+
+async def cw20_balance_of(contract: str, address: str) -> int | None:
+    if await cw20_synced_at(contract) is None:
+        return None
+    amount = await (
+        Cw20Balance.objects
+        .filter(contract=contract, address=address)
+        .values_list('amount', flat=True)
+        .afirst()
+    )
+    return _raw_amount(amount) or 0
+
+
+async def cw20_total_supply(contract: str) -> int | None:
+    """Sum of all CW20 balances — the circulating CW20 supply as the
+    contract-state scans used to compute it."""
+    total = await (
+        Cw20BalanceSync.objects
+        .filter(contract=contract)
+        .values_list('total_supply', flat=True)
+        .afirst()
+    )
+    return None if total is None else _raw_amount(total) or 0
+
+
+async def cw20_burned(contract: str, burn_addresses=(BURN_ADDRESS,)) -> int | None:
+    """Raw amount of `contract` held by the given burn addresses."""
+    if await cw20_synced_at(contract) is None:
+        return None
+    return sum([
+        _raw_amount(amount) or 0
+        async for amount in
+        Cw20Balance.objects
+        .filter(contract=contract, address__in=list(burn_addresses))
+        .values_list('amount', flat=True)
+    ])
+
+
+async def cw20_supply_and_burned(contract: str, burn_addresses=(BURN_ADDRESS,),
+                                 client=None) -> tuple[int, int]:
+    """(total supply, burned) in raw units. Read from the table; a contract
+    that was never refreshed is scanned on-chain once instead."""
+    total = await cw20_total_supply(contract)
+    if total is not None:
+        return total, await cw20_burned(contract, burn_addresses)
+    balances = await fetch_cw20_balances_from_chain(contract, client=client)
+    burned = sum(balances.get(address, 0) for address in set(burn_addresses))
+    return sum(balances.values()), burned
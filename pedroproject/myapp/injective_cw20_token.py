@@ -1,11 +1,7 @@
-import base64
-import orjson as json
 import asyncio
 from typing import List
 from datetime import datetime
-from pyinjective.core.network import Network
-from pyinjective.async_client import AsyncClient
-from pyinjective.client.model.pagination import PaginationOption
+from .injective_chain import chain_client, fetch_cw20_balance
 import aiohttp
 
 class InjectiveCw20:
@@ -18,41 +14,21 @@ class InjectiveCw20:
 
     def __init__(self, address):
         self.address = address
-        self.network = Network.mainnet()
-        self.client = AsyncClient(self.network)
+        self.client = chain_client()
         self.session = aiohttp.ClientSession()
         self.sem = asyncio.Semaphore(10)
 
     async def fetch_cw20_balance(self):
-        cw20_balances = []
-
         cw20_tokens = [token for token in self.memecoin if token['cw20'] != "none"]
-        print(cw20_tokens)
-
-        for token in cw20_tokens:
-            holders = await self.client.fetch_all_contracts_state(address=token['cw20'], pagination=PaginationOption(limit=1000))
 
-            first_fetch = holders
-            while holders['pagination']['nextKey']:
-                pagination = PaginationOption(limit=1000, encoded_page_key=holders['pagination']['nextKey'])
-                holders = await self.client.fetch_all_contracts_state(address=token['cw20'], pagination=pagination)
-                first_fetch['models'] += holders['models']
-                first_fetch['pagination'] = holders['pagination']
-
-            for model in first_fetch['models']:
-                try:
-                    value_decoded = base64.b64decode(model['value']).decode('utf-8').strip('"')
-
-                    if value_decoded.isdigit():
-                        amount_Coin = int(value_decoded) / 1e18
-                        inj_address = base64.b64decode(model['key']).decode('utf-8')[9:]
-                        
-                        if amount_Coin > 0:
-                            if inj_address == self.address:
-                                cw20_balances.append({'denom': token['native'], 'amount': amount_Coin})
-                except (ValueError, json.JSONDecodeError):
-                    continue
-        
-            return cw20_balances
-    
+        amounts = await asyncio.gather(*(
+            fetch_cw20_balance(self.client, token['cw20'], self.address)
+            for token in cw20_tokens
+        ))
 
+        cw20_balances = []
+        for token, amount in zip(cw20_tokens, amounts):
+            amount_Coin = amount / 1e18
+            if amount_Coin > 0:
+                cw20_balances.append({'denom': token['native'], 'amount': amount_Coin})
+        return cw20_balances
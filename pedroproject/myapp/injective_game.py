@@ -1,7 +1,16 @@
 import logging
 import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 
 import requests
+from django.db import close_old_connections
+
+from .injective_burn_index import indexed_burn_match
+from .injective_txs import TxFetchError, fetch_tx
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +23,21 @@ PEDRO_DECIMALS = 18
 ONE_PEDRO_WEI = "1" + "0" * PEDRO_DECIMALS
 # 0.1 $PEDRO in wei (1e17). The game charges a tenth of a PEDRO per action.
 TENTH_PEDRO_WEI = "1" + "0" * (PEDRO_DECIMALS - 1)
-INJECTIVE_LCD = "https://sentry.lcd.injective.network"
-MSG_SEND_TYPE = "/cosmos.bank.v1beta1.MsgSend"
 RECAPTCHA_VERIFY_URL = "https://www.google.com/recaptcha/api/siteverify"
+RECAPTCHA_TIMEOUT = 5  # seconds
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Total time a score submission may spend on its upstream checks (captcha +
+# burn lookup, run side by side). Previously each check had its own timeout
+# and they ran back to back, so a slow upstream could hold a worker for 15s.
+SUBMISSION_VERIFY_DEADLINE = _env_float("GAME_VERIFY_DEADLINE_SECONDS", 10.0)
 
 
 class GameVerifier:
@@ -32,6 +53,7 @@ class GameVerifier:
         expected_from: str,
         expected_amount_pedro: int = 1,
         expected_amount_wei: str | None = None,
+        timeout: float | None = None,
     ) -> tuple[bool, str]:
         """Verifies that `tx_hash` contains a `MsgSend` from `expected_from`
         to the burn address, transferring exactly the expected amount of PEDRO.
@@ -39,7 +61,8 @@ class GameVerifier:
         By default the amount is `expected_amount_pedro` whole PEDRO (defaults
         to 1, keeping existing call sites working). Pass `expected_amount_wei`
         to require an exact wei amount instead — this allows fractional burns
-        such as 0.1 PEDRO (TENTH_PEDRO_WEI), which the game uses."""
+        such as 0.1 PEDRO (TENTH_PEDRO_WEI), which the game uses.
+        `timeout` bounds the LCD lookup (default: TX_FETCH_TIMEOUT)."""
         if not tx_hash or not expected_from:
             return False, "Missing tx hash or address"
 
@@ -52,31 +75,22 @@ class GameVerifier:
             expected_wei = str(expected_amount_pedro) + "0" * PEDRO_DECIMALS
             amount_label = f"{expected_amount_pedro} $PEDRO"
 
-        url = f"{INJECTIVE_LCD}/cosmos/tx/v1beta1/txs/{tx_hash.upper()}"
-        try:
-            resp = requests.get(url, timeout=10)
-        except requests.RequestException as e:
-            logger.warning("LCD unreachable while verifying %s: %s", tx_hash, e)
-            return False, "Could not reach Injective LCD"
-
-        if resp.status_code != 200:
-            return False, f"Tx not found (status {resp.status_code})"
+        # The burn index answers without touching the LCD once the indexer
+        # has seen the tx; until then fall through to fetching it.
+        indexed = indexed_burn_match(tx_hash, expected_from, PEDRO_DENOM, expected_wei)
+        if indexed is not None:
+            if indexed:
+                return True, "OK"
+            return False, f"No matching {amount_label} burn message in tx"
 
         try:
-            data = resp.json()
-        except ValueError:
-            return False, "Invalid JSON from LCD"
-
-        tx_response = data.get("tx_response") or {}
-        if tx_response.get("code", -1) != 0:
+            tx = fetch_tx(tx_hash) if timeout is None else fetch_tx(tx_hash, timeout=timeout)
+        except TxFetchError as e:
+            return False, str(e)
+        if not tx.ok:
             return False, "Tx failed on chain"
 
-        body = (data.get("tx") or {}).get("body") or {}
-        for msg in body.get("messages", []):
-            if msg.get("@type") != MSG_SEND_TYPE:
-                continue
-            if msg.get("from_address") != expected_from:
-                continue
+        for msg in tx.sends_from(expected_from):
             if msg.get("to_address") != PEDRO_BURN_ADDRESS:
                 continue
             for coin in msg.get("amount", []):
@@ -89,7 +103,11 @@ class GameVerifier:
         return False, f"No matching {amount_label} burn message in tx"
 
     @staticmethod
-    def verify_captcha(token: str, remote_ip: str = "") -> tuple[bool, str]:
+    def verify_captcha(
+        token: str,
+        remote_ip: str = "",
+        timeout: float = RECAPTCHA_TIMEOUT,
+    ) -> tuple[bool, str]:
         """
         reCAPTCHA v3 verification. v3 always returns `success: true` for valid
         tokens — the real signal is the `score` (0.0 = bot, 1.0 = human) and
@@ -108,7 +126,7 @@ class GameVerifier:
         if remote_ip:
             payload["remoteip"] = remote_ip
         try:
-            resp = requests.post(RECAPTCHA_VERIFY_URL, data=payload, timeout=5)
+            resp = requests.post(RECAPTCHA_VERIFY_URL, data=payload, timeout=timeout)
         except requests.RequestException as e:
             logger.warning("reCAPTCHA siteverify unreachable: %s", e)
             return False, "Captcha verification unreachable"
@@ -128,12 +146,97 @@ class GameVerifier:
         if action and action != "submit_score":
             return False, f"Captcha action mismatch (got '{action}')"
 
-        try:
-            min_score = float(os.environ.get("RECAPTCHA_MIN_SCORE", "0.5"))
-        except ValueError:
-            min_score = 0.5
+        min_score = _env_float("RECAPTCHA_MIN_SCORE", 0.5)
         score = data.get("score")
         if isinstance(score, (int, float)) and score < min_score:
             return False, f"Captcha score too low ({score:.2f} < {min_score:.2f})"
 
         return True, "OK"
+
+
+# ---------------------------------------------------------------------------
+# Parallel submission checks
+# ---------------------------------------------------------------------------
+
+# Shared by every request in the worker. Two threads per in-flight submission
+# is enough; extra submissions queue briefly rather than spawning threads.
+_CHECK_POOL: ThreadPoolExecutor | None = None
+_CHECK_POOL_PID: int | None = None
+_CHECK_POOL_LOCK = threading.Lock()
+
+
+def _check_pool() -> ThreadPoolExecutor:
+    global _CHECK_POOL, _CHECK_POOL_PID
+    pid = os.getpid()
+    with _CHECK_POOL_LOCK:
+        if _CHECK_POOL is None or _CHECK_POOL_PID != pid:
+            _CHECK_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="game-verify")
+            _CHECK_POOL_PID = pid
+        return _CHECK_POOL
+
+
+@dataclass
+class SubmissionCheck:
+    ok: bool
+    reason: str = "OK"
+    # The check that failed ('captcha' / 'burn'), or '' when all passed.
+    failed: str = ""
+    # check name -> wall time in ms, for every check that finished in time.
+    timings: dict[str, float] = field(default_factory=dict)
+
+    def server_timing(self) -> str:
+        """Server-Timing header value, e.g. 'captcha;dur=212.4, burn;dur=88.0'."""
+        return ", ".join(f"{name};dur={ms:.1f}" for name, ms in self.timings.items())
+
+
+def verify_submission(
+    checks: dict[str, Callable[[float], tuple[bool, str]]],
+    deadline: float = SUBMISSION_VERIFY_DEADLINE,
+) -> SubmissionCheck:
+    """Run `checks` ({name: fn(timeout) -> (ok, reason)}) concurrently under
+    one shared deadline of `deadline` seconds.
+
+    Returns as soon as any check fails — the others are cancelled if they
+    haven't started, and otherwise left to finish in the background with
+    their result ignored (an in-flight HTTP request can't be interrupted, but
+    it is bounded by the same deadline). Returns success once all passed.
+    Worst-case latency is the slowest check, not the sum."""
+    started = time.monotonic()
+    ends_at = started + deadline
+    pool = _check_pool()
+    timings: dict[str, float] = {}
+
+    def timed(name, fn):
+        # Pool threads outlive requests and some checks hit the DB (burn
+        # index, cache), so drop connections past CONN_MAX_AGE or broken.
+        close_old_connections()
+        t0 = time.monotonic()
+        try:
+            return fn(max(0.1, ends_at - t0))
+        finally:
+            timings[name] = (time.monotonic() - t0) * 1000
+            close_old_connections()
+
+    pending = {pool.submit(timed, name, fn): name for name, fn in checks.items()}
+    try:
+        while pending:
+            remaining = ends_at - time.monotonic()
+            if remaining <= 0:
+                name = next(iter(pending.values()))
+                return SubmissionCheck(
+                    False, "Verification timed out", failed=name, timings=dict(timings),
+                )
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    ok, reason = future.result()
+                except Exception as e:
+                    logger.exception("%s check raised", name)
+                    ok, reason = False, "Internal verification error"
+                if not ok:
+                    return SubmissionCheck(False, reason, failed=name, timings=dict(timings))
+        return SubmissionCheck(True, timings=dict(timings))
+    finally:
+        for future in pending:
+            future.cancel()
@@ -1,11 +1,9 @@
 import logging
 
-import requests
+from .injective_txs import TxFetchError, fetch_tx
 
 logger = logging.getLogger(__name__)
 
-INJECTIVE_LCD = "https://sentry.lcd.injective.network"
-MSG_SEND_TYPE = "/cosmos.bank.v1beta1.MsgSend"
 VOTE_MEMO_PREFIX = "pedro-vote"
 SPECIAL_VOTE_MEMO_PREFIX = "pedro-special"
 VALID_CHOICES = {"liquidity", "buy_nfts", "giveaway"}
@@ -35,27 +33,14 @@ class GovernanceVerifier:
         if choice not in VALID_CHOICES:
             return False, f"Invalid choice (allowed: {sorted(VALID_CHOICES)})"
 
-        url = f"{INJECTIVE_LCD}/cosmos/tx/v1beta1/txs/{tx_hash.upper()}"
         try:
-            resp = requests.get(url, timeout=10)
-        except requests.RequestException as e:
-            logger.warning("LCD unreachable while verifying %s: %s", tx_hash, e)
-            return False, "Could not reach Injective LCD"
-
-        if resp.status_code != 200:
-            return False, f"Tx not found (status {resp.status_code})"
-
-        try:
-            data = resp.json()
-        except ValueError:
-            return False, "Invalid JSON from LCD"
-
-        tx_response = data.get("tx_response") or {}
-        if tx_response.get("code", -1) != 0:
+            tx = fetch_tx(tx_hash)
+        except TxFetchError as e:
+            return False, str(e)
+        if not tx.ok:
             return False, "Tx failed on chain"
 
-        body = (data.get("tx") or {}).get("body") or {}
-        memo = body.get("memo", "")
+        memo = tx.memo
         if memo != expected_memo(month, choice):
             return False, (
                 f"Memo mismatch (expected '{expected_memo(month, choice)}', "
@@ -65,11 +50,8 @@ class GovernanceVerifier:
         # At least one MsgSend from the claimed voter must exist. Self-send
         # is the recommended pattern but we don't enforce destination — the
         # signer is what matters.
-        for msg in body.get("messages", []):
-            if msg.get("@type") != MSG_SEND_TYPE:
-                continue
-            if msg.get("from_address") == expected_from:
-                return True, "OK"
+        if tx.sends_from(expected_from):
+            return True, "OK"
 
         return False, "No MsgSend from the claimed voter in this tx"
 
@@ -83,35 +65,19 @@ class GovernanceVerifier:
         if not (choice.isdigit() or choice in VALID_SPECIAL_CHOICES):
             return False, "Invalid choice"
 
-        url = f"{INJECTIVE_LCD}/cosmos/tx/v1beta1/txs/{tx_hash.upper()}"
         try:
-            resp = requests.get(url, timeout=10)
-        except requests.RequestException as e:
-            logger.warning("LCD unreachable while verifying %s: %s", tx_hash, e)
-            return False, "Could not reach Injective LCD"
-
-        if resp.status_code != 200:
-            return False, f"Tx not found (status {resp.status_code})"
-
-        try:
-            data = resp.json()
-        except ValueError:
-            return False, "Invalid JSON from LCD"
-
-        tx_response = data.get("tx_response") or {}
-        if tx_response.get("code", -1) != 0:
+            tx = fetch_tx(tx_hash)
+        except TxFetchError as e:
+            return False, str(e)
+        if not tx.ok:
             return False, "Tx failed on chain"
 
-        body = (data.get("tx") or {}).get("body") or {}
-        memo = body.get("memo", "")
+        memo = tx.memo
         expected = expected_special_memo(proposal_id, choice)
         if memo != expected:
             return False, f"Memo mismatch (expected '{expected}', got '{memo}')"
 
-        for msg in body.get("messages", []):
-            if msg.get("@type") != MSG_SEND_TYPE:
-                continue
-            if msg.get("from_address") == expected_from:
-                return True, "OK"
+        if tx.sends_from(expected_from):
+            return True, "OK"
 
         return False, "No MsgSend from the claimed voter in this tx"
@@ -1,10 +1,6 @@
 import asyncio
-import base64
-import json
 import backoff
-from pyinjective.core.network import Network
-from pyinjective.async_client import AsyncClient
-from pyinjective.client.model.pagination import PaginationOption
+from .injective_chain import chain_client, fetch_cw20_balance
 
 class InjectiveLogin:
 
@@ -18,8 +14,7 @@ class InjectiveLogin:
     
     def __init__(self, address):
         self.address = address
-        self.network = Network.mainnet()
-        self.client = AsyncClient(self.network)
+        self.client = chain_client()
 
     @backoff.on_exception(backoff.expo, Exception, max_tries=5)
     async def fetch_account_with_retry(self):
@@ -45,28 +40,8 @@ class InjectiveLogin:
 
         total_cw20_balance = 0.0
         for token in cw20_tokens:
-            holders = await self.client.fetch_all_contracts_state(address=token['cw20'], pagination=PaginationOption(limit=1000))
-
-            first_fetch = holders
-            while holders['pagination']['nextKey']:
-                pagination = PaginationOption(limit=1000, encoded_page_key=holders['pagination']['nextKey'])
-                holders = await self.client.fetch_all_contracts_state(address=token['cw20'], pagination=pagination)
-                first_fetch['models'] += holders['models']
-                first_fetch['pagination'] = holders['pagination']
-
-            for model in first_fetch['models']:
-                try:
-                    value_decoded = base64.b64decode(model['value']).decode('utf-8').strip('"')
-
-                    if value_decoded.isdigit():
-                        amount_Coin = int(value_decoded) / 1e18
-                        inj_address = base64.b64decode(model['key']).decode('utf-8')[9:]
-                        
-                        if amount_Coin > 0:
-                            if inj_address == self.address:
-                                total_cw20_balance += amount_Coin
-                except (ValueError, json.JSONDecodeError):
-                    continue
+            amount = await fetch_cw20_balance(self.client, token['cw20'], self.address)
+            total_cw20_balance += amount / 1e18
         return total_cw20_balance
 
     async def check_total_balance(self) -> str:
@@ -1,18 +1,15 @@
-import base64
 import msgpack
-import json
 import asyncio
 import pandas as pd
 from datetime import datetime
-from pyinjective.core.network import Network
-from pyinjective.async_client import AsyncClient
+from .injective_chain import chain_client
+from .injective_cw20_balances import cw20_holders, fetch_cw20_balances_from_chain
 from pyinjective.client.model.pagination import PaginationOption
 
 class InjectiveHolders:
 
     def __init__(self):
-        self.network = Network.mainnet()
-        self.client = AsyncClient(self.network)
+        self.client = chain_client()
 
     _SIX_DECIMAL_NATIVES = {
         "factory/inj127l5a2wmkyvucxdlupqyac3y0v6wqfhq03ka64/qunt",
@@ -21,10 +18,6 @@ class InjectiveHolders:
         "factory/inj178zy7myyxewek7ka7v9hru8ycpvfnen6xeps89/DRUGS",
         "factory/inj18flmwwaxxqj8m8l5zl8xhjrnah98fcjp3gcy3e/XIII",
     }
-    # base64-encoded CW20 storage prefix for the "balance" Map. Filtering on this
-    # lets us skip non-balance state (token_info, marketing_info, allowances, ...)
-    # without paying the cost of base64-decoding every value.
-    _CW20_BALANCE_KEY_PREFIX_B64 = "AAdiYWxhbmNl"
 
     async def fetch_holder_native_token(self, native_address):
         denom_owners = []
@@ -53,36 +46,19 @@ class InjectiveHolders:
         return pd.DataFrame(data_wallet)
 
     async def fetch_holders_cw20_token(self, cw20_address):
-        models = []
-        next_key = None
-        while True:
-            page = await self.client.fetch_all_contracts_state(
-                address=cw20_address,
-                pagination=PaginationOption(limit=1000, encoded_page_key=next_key),
-            )
-            if page is None:
-                break
-            models += page['models']
-            next_key = page.get('pagination', {}).get('nextKey')
-            if not next_key:
-                break
-
-        holders_cw20_wallet = []
-        for model in models:
-            # Cheap filter first: skip anything that isn't a "balance" entry.
-            if not model['key'].startswith(self._CW20_BALANCE_KEY_PREFIX_B64):
-                continue
-            try:
-                amount_coin = int(
-                    base64.b64decode(model['value']).decode('utf-8').strip('"')
-                ) / 1e18
-                if amount_coin == 0:
-                    continue
-                inj_address = base64.b64decode(model['key']).decode('utf-8')[9:]
-                holders_cw20_wallet.append({'key': inj_address, 'value': amount_coin})
-            except (ValueError, json.JSONDecodeError):
-                continue
-
+        # Served from the materialized Cw20Balance table (refresh_cw20_balances
+        # cron). Only a contract the refresh job has never seen is scanned
+        # on-chain here.
+        balances = await cw20_holders(cw20_address)
+        if balances is None:
+            balances = (
+                await fetch_cw20_balances_from_chain(cw20_address, client=self.client)
+            ).items()
+
+        holders_cw20_wallet = [
+            {'key': inj_address, 'value': amount / 1e18}
+            for inj_address, amount in balances
+        ]
         return pd.DataFrame(holders_cw20_wallet)
 
     async def fetch_holders(self, cw20_address, native_address):
@@ -1,56 +1,20 @@
 import pandas as pd
-import base64
-import json
 from datetime import datetime
 
-from pyinjective.async_client import AsyncClient
-from pyinjective.client.model.pagination import PaginationOption
-from pyinjective.core.network import Network
+from .injective_chain import chain_client, fetch_nft_owner_counts
 
 class InjectiveHolders2:
 
     def __init__(self):
-        self.network = Network.mainnet()
-        self.client = AsyncClient(self.network)
-
-    def remove_balance_prefix(self, key):
-        if isinstance(key, str) and key.startswith('balance'):
-            return key[9:]
-        return key
+        self.client = chain_client()
 
     async def fetch_holder_nft(self, cw20_address) -> None:
-        limit = 1000
-        pagination = PaginationOption(limit=limit)
-        
-        contract_history = await self.client.fetch_all_contracts_state(address=cw20_address, pagination=pagination)
-        A = contract_history
-        
-        total_models = len(contract_history['models'])
-        
-        while contract_history['pagination']['nextKey'] and total_models < 100000:
-            pagination = PaginationOption(limit=limit, encoded_page_key=contract_history['pagination']['nextKey'])
-            contract_history = await self.client.fetch_all_contracts_state(address=cw20_address, pagination=pagination)
-            A['models'] += contract_history['models']
-            A['pagination'] = contract_history['pagination']
-            
-            total_models += len(contract_history['models'])
-        
-
-        decoded_values = []
-        for item in A['models']:
-            try:
-                if isinstance(item['key'], str) and isinstance(item['value'], str):
-                    decoded_value = base64.b64decode(item['value']).decode('utf-8')
-                    decoded_dict = json.loads(decoded_value)
-                    decoded_dict['key'] = self.remove_balance_prefix(item['key'])
-                    decoded_values.append(decoded_dict)
-            except Exception as e:
-                continue
-
-        df = pd.DataFrame(decoded_values)    
-        df = df.dropna(subset=['token_id'])
-        df['total'] = df.groupby('owner')['owner'].transform('count')
-        df = df.drop_duplicates(subset=['owner'])        
+        owners = await fetch_nft_owner_counts(self.client, cw20_address)
+        df = pd.DataFrame(
+            [{'token_id': o['token_id'], 'owner': owner, 'total': o['total']}
+             for owner, o in owners.items()],
+            columns=['token_id', 'owner', 'total'],
+        )
         df['percentage'] = (df['total'] / df['total'].sum()) * 100
         
         df_filtered = df[['token_id', 'owner', 'total', 'percentage']]
@@ -1,10 +1,8 @@
 import asyncio
-import base64
 import aiohttp
 from datetime import datetime
-from pyinjective.client.model.pagination import PaginationOption
-from pyinjective.async_client import AsyncClient
-from pyinjective.core.network import Network
+from .injective_chain import chain_client
+from .injective_cw20_balances import BURN_ADDRESS, cw20_supply_and_burned
 
 class InjectiveTokenInfo:
 
@@ -94,8 +92,7 @@ class InjectiveTokenInfo:
     ]
 
     def __init__(self):
-        self.network = Network.mainnet()
-        self.client = AsyncClient(self.network)
+        self.client = chain_client()
 
 
     async def fetch_dex_info(self):
@@ -154,34 +151,11 @@ class InjectiveTokenInfo:
 
         async def fetch_one(token):
             try:
-                total_supply = 0
-                burn_coin = 0
-
-                holders = await self.client.fetch_all_contracts_state(
-                    address=token['cw20'], pagination=PaginationOption(limit=1000)
+                total_supply, burn_coin = await cw20_supply_and_burned(
+                    token['cw20'], (BURN_ADDRESS, token['cw20']), client=self.client,
                 )
-                models = list(holders['models'])
-                next_key = holders.get('pagination', {}).get('nextKey')
-                while next_key:
-                    page = await self.client.fetch_all_contracts_state(
-                        address=token['cw20'],
-                        pagination=PaginationOption(limit=1000, encoded_page_key=next_key),
-                    )
-                    models += page['models']
-                    next_key = page.get('pagination', {}).get('nextKey')
-
-                for model in models:
-                    value_decoded = base64.b64decode(model['value']).decode('utf-8').strip('"')
-                    if not value_decoded.isdigit():
-                        continue
-                    amount_coin = float(value_decoded) / 10 ** 18
-                    total_supply += amount_coin
-                    inj_address = base64.b64decode(model['key']).decode('utf-8')[9:]
-                    if inj_address == "inj1qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqe2hm49" or inj_address == token['cw20']:
-                        burn_coin += amount_coin
-
-                token['total_supply_cw20'] = total_supply
-                token['total_burn_cw20'] = burn_coin
+                token['total_supply_cw20'] = total_supply / 10 ** 18
+                token['total_burn_cw20'] = burn_coin / 10 ** 18
             except Exception:
                 token.setdefault('total_supply_cw20', 0)
                 token.setdefault('total_burn_cw20', 0)
@@ -0,0 +1,206 @@
+"""
+One place to fetch a transaction by hash from the Injective LCD.
+
+The burn, vote, special-vote and dashboard-log verifiers all need the same
+thing: GET /cosmos/tx/v1beta1/txs/{hash}, check it succeeded, then look at
+its memo and messages. `fetch_tx()` does that once per hash:
+
+  * requests go through the worker's LCD endpoint pool (lcd_pool.py);
+  * the response is parsed into a `ChainTx` (code, memo, messages, signers);
+  * an included tx is immutable (Injective has instant finality), so it is
+    cached with no expiry; a not-found hash is cached for a few seconds only,
+    because the tx may simply not be indexed yet;
+  * concurrent lookups of one hash share a single LCD request, within a
+    worker and — through a short marker in the shared cache — across
+    workers, so a retried submission or a double-click doesn't hit the LCD
+    twice.
+
+    try:
+        tx = fetch_tx(tx_hash)
+    except TxFetchError as e:
+        return False, str(e)
+    if not tx.ok:
+        return False, "Tx failed on chain"
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from dataclasses import dataclass
+
+import requests
+from django.core.cache import cache
+
+from .lcd_pool import lcd_get
+from .tiered_cache import TieredCache
+
+logger = logging.getLogger(__name__)
+
+MSG_SEND_TYPE = "/cosmos.bank.v1beta1.MsgSend"
+
+TX_FETCH_TIMEOUT = 10  # seconds
+# A hash the LCD doesn't know yet is usually a tx still being indexed.
+TX_NOT_FOUND_TTL = 10  # seconds
+# A committed tx never changes, but it is only looked up again while its
+# submission is being processed or retried — a day covers that.
+TX_FOUND_TTL = 24 * 60 * 60  # seconds
+# How long another worker's in-flight fetch is waited on before fetching
+# ourselves anyway.
+TX_INFLIGHT_TTL = TX_FETCH_TIMEOUT + 2
+
+
+class TxFetchError(Exception):
+    """The tx could not be fetched. The message is user-facing and matches
+    what the verifiers returned before, e.g. 'Tx not found (status 404)'."""
+
+
+@dataclass(frozen=True)
+class ChainTx:
+    hash: str
+    code: int
+    height: int
+    timestamp: str
+    memo: str
+    messages: tuple[dict, ...]
+    # Message-level senders (from_address / sender / MsgMultiSend inputs), in
+    # order of appearance. The tx can only include them if they signed it.
+    signers: tuple[str, ...]
+
+    @property
+    def ok(self) -> bool:
+        return self.code == 0
+
+    def sends_from(self, address: str):
+        """MsgSend messages whose from_address is `address`."""
+        return [
+            msg for msg in self.messages
+            if msg.get("@type") == MSG_SEND_TYPE and msg.get("from_address") == address
+        ]
+
+    @classmethod
+    def from_lcd(cls, tx_hash: str, data: dict) -> "ChainTx":
+        tx_response = data.get("tx_response") or {}
+        body = (data.get("tx") or {}).get("body") or {}
+        messages = tuple(body.get("messages") or ())
+        signers: list[str] = []
+        for msg in messages:
+            sender = msg.get("from_address") or msg.get("sender")
+            if sender and sender not in signers:
+                signers.append(sender)
+            for inp in msg.get("inputs") or ():
+                addr = inp.get("address")
+                if addr and addr not in signers:
+                    signers.append(addr)
+        try:
+            height = int(tx_response.get("height") or 0)
+        except (TypeError, ValueError):
+            height = 0
+        return cls(
+            hash=tx_hash,
+            code=tx_response.get("code", -1),
+            height=height,
+            timestamp=tx_response.get("timestamp") or "",
+            memo=body.get("memo", "") or "",
+            messages=messages,
+            signers=tuple(signers),
+        )
+
+
+_FOUND = TieredCache('chain_tx', ttl=TX_FOUND_TTL, max_entries=512, alias='chain_tx')
+_NOT_FOUND = TieredCache(
+    'chain_tx_missing', ttl=TX_NOT_FOUND_TTL, max_entries=256, alias='chain_tx',
+)
+
+_INFLIGHT: dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def normalize_tx_hash(tx_hash: str) -> str:
+    return (tx_hash or "").strip().upper()
+
+
+def _cached(tx_hash: str) -> ChainTx | None:
+    tx = _FOUND.get(tx_hash)
+    if tx is not None:
+        return tx
+    status = _NOT_FOUND.get(tx_hash)
+    if status is not None:
+        raise TxFetchError(f"Tx not found (status {status})")
+    return None
+
+
+def _request_tx(tx_hash: str, timeout: float) -> ChainTx:
+    try:
+        resp = lcd_get(f"/cosmos/tx/v1beta1/txs/{tx_hash}", timeout=timeout)
+    except requests.RequestException as e:
+        logger.warning("LCD unreachable while fetching %s: %s", tx_hash, e)
+        raise TxFetchError("Could not reach Injective LCD") from e
+
+    if resp.status_code != 200:
+        if resp.status_code in (400, 404):
+            _NOT_FOUND.set(tx_hash, resp.status_code)
+        raise TxFetchError(f"Tx not found (status {resp.status_code})")
+
+    try:
+        data = resp.json()
+    except ValueError as e:
+        raise TxFetchError("Invalid JSON from LCD") from e
+
+    tx = ChainTx.from_lcd(tx_hash, data)
+    if tx.height > 0:
+        _FOUND.set(tx_hash, tx)
+    return tx
+
+
+def _fetch_shared(tx_hash: str, timeout: float) -> ChainTx:
+    """Fetch once across workers: the first to claim the in-flight marker
+    asks the LCD; the rest poll the shared cache for its result."""
+    marker = f"chain_tx_inflight:{tx_hash}"
+    if not cache.add(marker, 1, TX_INFLIGHT_TTL):
+        deadline = time.monotonic() + min(timeout, TX_INFLIGHT_TTL)
+        while time.monotonic() < deadline:
+            time.sleep(0.2)
+            tx = _cached(tx_hash)
+            if tx is not None:
+                return tx
+            if cache.get(marker) is None:
+                break  # the other worker finished without a cacheable result
+    try:
+        return _request_tx(tx_hash, timeout)
+    finally:
+        cache.delete(marker)
+
+
+def fetch_tx(tx_hash: str, timeout: float = TX_FETCH_TIMEOUT) -> ChainTx:
+    """The parsed tx for `tx_hash`, from cache when possible. Raises
+    TxFetchError when it can't be fetched."""
+    tx_hash = normalize_tx_hash(tx_hash)
+    if not tx_hash:
+        raise TxFetchError("Missing tx hash")
+    tx = _cached(tx_hash)
+    if tx is not None:
+        return tx
+
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(tx_hash)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT[tx_hash] = Future()
+    if not leader:
+        try:
+            return future.result(timeout=timeout + 1)
+        except FutureTimeout as e:
+            raise TxFetchError("Could not reach Injective LCD") from e
+
+    try:
+        tx = _fetch_shared(tx_hash, timeout)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(tx)
+        return tx
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(tx_hash, None)
@@ -0,0 +1,264 @@
+"""
+A pool of Injective LCD endpoints shared by every LCD caller in the worker.
+
+The tx verifiers, the burn indexer and the NFT holder scan all used to GET
+one hard-coded sentry node, so a single slow node degraded every burn-gated
+endpoint. `lcd_get(path, params)` instead:
+
+  * routes each request to the healthiest endpoint, scored by an EWMA of its
+    latency weighted by an EWMA of its error rate;
+  * hedges: if the first endpoint hasn't answered after its p95 latency, the
+    same GET goes to the next-best endpoint and whichever answers first wins
+    (only for GETs, which are idempotent);
+  * circuit-breaks: after `breaker_failures` consecutive failures an endpoint
+    is skipped for a cooldown, then gets a single probe request; a good
+    answer closes the breaker again.
+
+A 5xx, 429 or transport error counts as a failure of the endpoint; a 4xx is
+the endpoint answering correctly (e.g. "tx not found") and is returned to
+the caller. When no endpoint produces an answer `LcdUnavailable` is raised;
+it subclasses `requests.RequestException`, so existing handlers still apply.
+
+Endpoints come from settings.INJECTIVE_LCD_ENDPOINTS. Tests and scripts can
+build their own `LcdPool([...])` against local stub servers.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LCD_ENDPOINTS = ("https://sentry.lcd.injective.network",)
+
+EWMA_ALPHA = 0.2
+LATENCY_WINDOW = 200  # samples kept per endpoint for the p95
+DEFAULT_HEDGE_DELAY = 0.5  # seconds, until an endpoint has enough samples
+MIN_HEDGE_DELAY = 0.05  # seconds
+MIN_SAMPLES_FOR_P95 = 20
+# Share of requests sent to the runner-up instead of the best endpoint, so an
+# endpoint that recovered gets fresh samples and can win back traffic.
+EXPLORE_RATE = 0.05
+
+
+class LcdUnavailable(requests.RequestException):
+    """No endpoint in the pool produced a response."""
+
+
+@dataclass
+class EndpointStats:
+    url: str
+    ewma_ms: float | None = None
+    error_rate: float = 0.0  # EWMA of 0/1 failure outcomes
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    open_until: float = 0.0  # breaker open while monotonic() < open_until
+    probing: bool = False  # a half-open probe is in flight
+    latencies: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def p95(self) -> float | None:
+        if len(self.latencies) < MIN_SAMPLES_FOR_P95:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    def score(self) -> float:
+        # Unmeasured endpoints look average-fast so they get tried.
+        latency = self.ewma_ms if self.ewma_ms is not None else 100.0
+        return latency * (1 + 10 * self.error_rate)
+
+    def snapshot(self, now: float) -> dict:
+        return {
+            'url': self.url,
+            'ewma_ms': round(self.ewma_ms, 1) if self.ewma_ms is not None else None,
+            'p95_ms': round(self.p95() * 1000, 1) if self.p95() is not None else None,
+            'error_rate': round(self.error_rate, 3),
+            'requests': self.requests,
+            'failures': self.failures,
+            'circuit': 'open' if now < self.open_until else ('half-open' if self.open_until else 'closed'),
+        }
+
+
+class LcdPool:
+    def __init__(self, endpoints, hedge: bool = True,
+                 breaker_failures: int = 5, breaker_cooldown: float = 30.0,
+                 max_workers: int = 16):
+        endpoints = [e.rstrip('/') for e in endpoints if e and e.strip()]
+        if not endpoints:
+            raise ValueError("LcdPool needs at least one endpoint")
+        self.hedge = hedge
+        self.breaker_failures = breaker_failures
+        self.breaker_cooldown = breaker_cooldown
+        self._stats = {url: EndpointStats(url) for url in endpoints}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lcd")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(endpoints) * 2, pool_maxsize=32)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @property
+    def endpoints(self) -> list[str]:
+        return list(self._stats)
+
+    # -- health bookkeeping --------------------------------------------------
+
+    def _ranked(self) -> list[EndpointStats]:
+        """Usable endpoints, best first (bar the occasional exploration
+        swap). An open breaker past its cooldown is listed while no probe
+        is in flight (the probe itself is claimed in `_claim_probe`); if
+        every breaker is open the least recently opened one is tried anyway
+        rather than failing outright."""
+        now = time.monotonic()
+        with self._lock:
+            usable = []
+            for stats in self._stats.values():
+                if now >= stats.open_until:
+                    if stats.open_until and stats.probing:
+                        continue
+                    usable.append(stats)
+            usable.sort(key=EndpointStats.score)
+            if len(usable) > 1 and random.random() < EXPLORE_RATE:
+                usable[0], usable[1] = usable[1], usable[0]
+            if not usable:
+                usable = sorted(self._stats.values(), key=lambda s: s.open_until)[:1]
+            return usable
+
+    def _claim_probe(self, stats: EndpointStats) -> bool:
+        """Whether a request about to go to `stats` is its half-open probe.
+        Checked and claimed under the lock, so of several callers that all
+        ranked the endpoint one probes and the rest are turned away with
+        LcdUnavailable (and fail over to the next endpoint)."""
+        with self._lock:
+            if not stats.open_until:
+                return False
+            if stats.probing:
+                raise LcdUnavailable(f"{stats.url} is half-open with a probe in flight")
+            stats.probing = True
+            return True
+
+    def _record(self, stats: EndpointStats, elapsed: float, ok: bool, probe: bool = False) -> None:
+        with self._lock:
+            stats.requests += 1
+            if probe:
+                stats.probing = False
+            stats.error_rate += EWMA_ALPHA * ((0.0 if ok else 1.0) - stats.error_rate)
+            if ok:
+                ms = elapsed * 1000
+                stats.ewma_ms = ms if stats.ewma_ms is None else stats.ewma_ms + EWMA_ALPHA * (ms - stats.ewma_ms)
+                stats.latencies.append(elapsed)
+                stats.consecutive_failures = 0
+                stats.open_until = 0.0
+                return
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            if stats.open_until or stats.consecutive_failures >= self.breaker_failures:
+                # Tripped, or a half-open probe failed: (re)open.
+                stats.open_until = time.monotonic() + self.breaker_cooldown
+                logger.warning("LCD endpoint %s circuit opened for %ss", stats.url, self.breaker_cooldown)
+
+    def _hedge_delay(self, stats: EndpointStats) -> float:
+        p95 = stats.p95()
+        return DEFAULT_HEDGE_DELAY if p95 is None else max(MIN_HEDGE_DELAY, p95)
+
+    def stats(self) -> list[dict]:
+        now = time.monotonic()
+        with self._lock:
+            return [s.snapshot(now) for s in self._stats.values()]
+
+    # -- requests ------------------------------------------------------------
+
+    def _attempt(self, stats: EndpointStats, path: str, params, timeout: float):
+        probe = self._claim_probe(stats)
+        started = time.monotonic()
+        try:
+            resp = self.session.get(f"{stats.url}{path}", params=params, timeout=timeout)
+        except requests.RequestException:
+            self._record(stats, time.monotonic() - started, ok=False, probe=probe)
+            raise
+        ok = resp.status_code < 500 and resp.status_code != 429
+        self._record(stats, time.monotonic() - started, ok=ok, probe=probe)
+        if not ok:
+            raise LcdUnavailable(f"{stats.url} answered {resp.status_code}", response=resp)
+        return resp
+
+    def get(self, path: str, params=None, timeout: float = 10) -> requests.Response:
+        """GET `path` (e.g. '/cosmos/tx/v1beta1/txs/ABC') from the pool."""
+        ranked = self._ranked()
+        deadline = time.monotonic() + timeout
+        pending = {}
+        last_error: Exception | None = None
+
+        def launch():
+            stats = ranked.pop(0)
+            remaining = max(0.1, deadline - time.monotonic())
+            pending[self._executor.submit(self._attempt, stats, path, params, remaining)] = stats
+            return stats
+
+        current = launch()
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                wait_for = remaining
+                if self.hedge and ranked:
+                    wait_for = min(remaining, self._hedge_delay(current))
+                done, _ = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+                if not done:
+                    # Slower than its p95: race the next endpoint against it.
+                    if self.hedge and ranked:
+                        current = launch()
+                    continue
+                for future in done:
+                    pending.pop(future)
+                    try:
+                        return future.result()
+                    except requests.RequestException as e:
+                        last_error = e
+                if not pending and ranked:
+                    # Everything in flight failed: fail over immediately.
+                    current = launch()
+        finally:
+            for future in pending:
+                future.cancel()
+        if getattr(last_error, 'response', None) is not None:
+            # Every endpoint answered with an error status; hand the last one
+            # back so callers report it as before.
+            return last_error.response
+        raise LcdUnavailable(f"No LCD endpoint answered {path}: {last_error or 'timed out'}")
+
+
+_POOL: LcdPool | None = None
+_POOL_PID: int | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def lcd_pool() -> LcdPool:
+    """The worker's shared pool, built from settings on first use."""
+    global _POOL, _POOL_PID
+    pid = os.getpid()
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_PID != pid:
+            _POOL = LcdPool(
+                getattr(settings, 'INJECTIVE_LCD_ENDPOINTS', None) or DEFAULT_LCD_ENDPOINTS,
+                hedge=getattr(settings, 'INJECTIVE_LCD_HEDGE', True),
+                breaker_failures=getattr(settings, 'INJECTIVE_LCD_BREAKER_FAILURES', 5),
+                breaker_cooldown=getattr(settings, 'INJECTIVE_LCD_BREAKER_COOLDOWN', 30.0),
+            )
+            _POOL_PID = pid
+        return _POOL
+
+
+def lcd_get(path: str, params=None, timeout: float = 10) -> requests.Response:
+    return lcd_pool().get(path, params=params, timeout=timeout)
@@ -0,0 +1,118 @@
+"""
+Database-backed leases: at most one holder per name across every worker and
+host that shares the database.
+
+A thread lock only de-duplicates work inside one gunicorn worker; with N
+workers a stale cache could start N identical contract scans. A lease is a
+row in `Lease` claimed with a single conditional UPDATE, so exactly one
+caller wins:
+
+    lease = acquire_lease('nft_holders_scan', ttl=300)
+    if lease is None:
+        return              # someone else is on it — keep serving stale data
+    try:
+        ...                 # long job; renew_lease(lease, 300) as it goes
+        if not lease_is_current(lease):
+            return          # lease lapsed and was taken over — don't publish
+        publish()
+    finally:
+        release_lease(lease)
+
+Leases expire on their own, so a crashed holder never blocks the job for
+longer than its TTL. Each acquire increments the fencing token; a holder
+checks it with `lease_is_current` before writing results.
+"""
+
+import contextlib
+import os
+import socket
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from django.db import IntegrityError
+from django.db.models import F
+
+from .models import Lease
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class HeldLease:
+    name: str
+    owner: str
+    token: int
+
+
+def _new_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def acquire_lease(name: str, ttl: float) -> HeldLease | None:
+    """Claim `name` for `ttl` seconds. Returns the held lease, or None if
+    another owner holds an unexpired one."""
+    now = datetime.now(timezone.utc)
+    owner = _new_owner()
+    try:
+        Lease.objects.get_or_create(name=name, defaults={'expires_at': _EPOCH})
+    except IntegrityError:
+        pass  # created concurrently by another worker — fine
+    claimed = (
+        Lease.objects
+        .filter(name=name, expires_at__lte=now)
+        .update(
+            owner=owner,
+            token=F('token') + 1,
+            acquired_at=now,
+            expires_at=now + timedelta(seconds=ttl),
+        )
+    )
+    if not claimed:
+        return None
+    token = Lease.objects.filter(name=name, owner=owner).values_list('token', flat=True).first()
+    if token is None:
+        return None
+    return HeldLease(name=name, owner=owner, token=token)
+
+
+def renew_lease(lease: HeldLease, ttl: float) -> bool:
+    """Push the expiry out to now + `ttl`. False if the lease was lost."""
+    expires = datetime.now(timezone.utc) + timedelta(seconds=ttl)
+    return bool(
+        Lease.objects
+        .filter(name=lease.name, owner=lease.owner, token=lease.token)
+        .update(expires_at=expires)
+    )
+
+
+def lease_is_current(lease: HeldLease) -> bool:
+    """True while `lease` is still held and unexpired — check it right
+    before publishing results so a holder that stalled past its TTL (and
+    was superseded) doesn't overwrite the newer holder's work."""
+    now = datetime.now(timezone.utc)
+    return (
+        Lease.objects
+        .filter(name=lease.name, owner=lease.owner, token=lease.token, expires_at__gt=now)
+        .exists()
+    )
+
+
+def release_lease(lease: HeldLease) -> None:
+    (
+        Lease.objects
+        .filter(name=lease.name, owner=lease.owner, token=lease.token)
+        .update(expires_at=datetime.now(timezone.utc))
+    )
+
+
+@contextlib.contextmanager
+def hold_lease(name: str, ttl: float):
+    """`with hold_lease(name, ttl) as lease:` — `lease` is None when another
+    owner holds it. Released on exit."""
+    lease = acquire_lease(name, ttl)
+    try:
+        yield lease
+    finally:
+        if lease is not None:
+            release_lease(lease)
@@ -0,0 +1,131 @@
+import random
+import threading
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection
+from django.db.models import Sum
+
+from myapp.models import GameLeaderboardEntry, GameMonthBest, GameStealLog, GameUpgradeState
+from myapp.views import _current_month, _execute_steal
+
+BENCH_PREFIX = 'inj1benchsteal'
+
+
+class Command(BaseCommand):
+    help = (
+        "Hammer the steal path from many threads against a small set of "
+        "throw-away players, then check that no update was lost: every "
+        "player's score, leaderboard entry and month-best must equal its "
+        "starting score plus what the steal log says it gained and lost. "
+        "Reports steals/sec. Writes to the configured database (rows use the "
+        f"'{BENCH_PREFIX}' address prefix and are removed afterwards), so run "
+        "it against a staging copy. The cooldown is disabled for the run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--players', type=int, default=10,
+                            help="Players stealing from each other (default 10).")
+        parser.add_argument('--threads', type=int, default=8,
+                            help="Concurrent stealing threads (default 8).")
+        parser.add_argument('--steals', type=int, default=2000,
+                            help="Total steal attempts (default 2000).")
+        parser.add_argument('--keep', action='store_true',
+                            help="Leave the benchmark rows in place for inspection.")
+
+    def handle(self, *args, **options):
+        month = _current_month()
+        players = [f'{BENCH_PREFIX}{i:04d}' for i in range(max(2, options['players']))]
+        initial = 10 ** 9
+        self._cleanup()
+        GameUpgradeState.objects.bulk_create([
+            GameUpgradeState(address=a, score_base=initial, current_month=month) for a in players
+        ])
+        GameLeaderboardEntry.objects.bulk_create([
+            GameLeaderboardEntry(address=a, name=a[-8:], score=initial, tx_hash=f'bench-{a}', month=month)
+            for a in players
+        ])
+        entries = {e.address: e for e in GameLeaderboardEntry.objects.filter(address__in=players)}
+        GameMonthBest.objects.bulk_create([
+            GameMonthBest(month=month, address=a, best_score=initial, best_tx=e.tx_hash,
+                          name=e.name, best_at=e.submitted_at)
+            for a, e in entries.items()
+        ])
+
+        outcomes = Counter()
+        outcomes_lock = threading.Lock()
+        remaining = [options['steals']]
+
+        def worker():
+            local = Counter()
+            try:
+                while True:
+                    with outcomes_lock:
+                        if remaining[0] <= 0:
+                            break
+                        remaining[0] -= 1
+                    attacker, target = random.sample(players, 2)
+                    try:
+                        status, _ = _execute_steal(attacker, target, cooldown_seconds=0)
+                        local[status] += 1
+                    except OperationalError:
+                        # e.g. "database is locked": a request would have
+                        # answered 500, so it counts against the run.
+                        local['db_error'] += 1
+            finally:
+                connection.close()
+                with outcomes_lock:
+                    outcomes.update(local)
+
+        started = time.monotonic()
+        threads = [threading.Thread(target=worker) for _ in range(max(1, options['threads']))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.monotonic() - started
+
+        lost = self._verify(players, initial, month)
+        applied = outcomes.get(200, 0)
+        self.stdout.write(
+            f"{applied} steals applied in {elapsed:.2f}s = {applied / elapsed:.1f} steals/sec "
+            f"({options['threads']} threads, {len(players)} players, {connection.vendor}); "
+            f"outcomes: {dict(outcomes)}"
+        )
+        if not options['keep']:
+            self._cleanup()
+        if outcomes.get('db_error'):
+            lost.append(f"{outcomes['db_error']} steals failed with a database error")
+        if lost:
+            for line in lost:
+                self.stderr.write(self.style.ERROR(line))
+            raise SystemExit(1)
+        self.stdout.write(self.style.SUCCESS("No lost updates: every balance matches the steal log."))
+
+    def _verify(self, players, initial, month) -> list[str]:
+        logs = GameStealLog.objects.filter(attacker__startswith=BENCH_PREFIX)
+        gained = dict(logs.values('attacker').annotate(total=Sum('amount')).values_list('attacker', 'total'))
+        taken = dict(logs.values('target').annotate(total=Sum('amount')).values_list('target', 'total'))
+        scores = dict(GameUpgradeState.objects.filter(address__in=players).values_list('address', 'score_base'))
+        board = dict(
+            GameLeaderboardEntry.objects.filter(address__in=players, month=month).values_list('address', 'score')
+        )
+        best = dict(
+            GameMonthBest.objects.filter(address__in=players, month=month).values_list('address', 'best_score')
+        )
+        problems = []
+        for address in players:
+            expected = initial + gained.get(address, 0) - taken.get(address, 0)
+            for label, table in (('score', scores), ('leaderboard', board), ('month best', best)):
+                if table.get(address) != expected:
+                    problems.append(
+                        f"{address} {label} is {table.get(address)}, steal log says {expected}"
+                    )
+        return problems
+
+    def _cleanup(self):
+        GameStealLog.objects.filter(attacker__startswith=BENCH_PREFIX).delete()
+        GameMonthBest.objects.filter(address__startswith=BENCH_PREFIX).delete()
+        GameLeaderboardEntry.objects.filter(address__startswith=BENCH_PREFIX).delete()
+        GameUpgradeState.objects.filter(address__startswith=BENCH_PREFIX).delete()
@@ -0,0 +1,189 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+from pyinjective.client.model.pagination import PaginationOption
+
+from myapp.chain_standin import (
+    PRESETS,
+    ChainDataset,
+    RecordingGateway,
+    StandinBehaviour,
+    lcd_key,
+    serve_http,
+)
+from myapp.ADpedro_scam_checker_web import ScamScannerChecker
+from myapp.injective_chain import ChainClient, get_chain_gateway, scan_contract_state
+from myapp.lcd_pool import lcd_get
+
+
+class _RecordingScamChecker(ScamScannerChecker):
+    """The scam checker's own block-range walk over the explorer API, with
+    every response stored in the dataset as the stand-in's server would
+    answer it."""
+
+    def __init__(self, address, dataset):
+        super().__init__(address)
+        self.dataset = dataset
+
+    def _fetch_batch(self, from_block, to_block):
+        params = {"from_number": from_block, "to_number": to_block}
+        response = requests.get(
+            self.base_url,
+            params=params,
+            timeout=30,
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+        )
+        self.dataset.lcd[lcd_key(urlsplit(self.base_url).path, params)] = {
+            'status': response.status_code, 'body': response.json(),
+        }
+        response.raise_for_status()
+        return response.json().get("data", [])
+
+
+def _pairs(values, kind):
+    out = {}
+    for value in values or ():
+        name, _, count = value.rpartition('=')
+        if not name or not count.isdigit():
+            raise CommandError(f"--{kind} expects NAME=COUNT, got {value!r}")
+        out[name] = int(count)
+    return out
+
+
+class Command(BaseCommand):
+    help = (
+        "Build and serve the offline Injective chain stand-in used for load "
+        "tests (myapp/chain_standin.py). `synthesize` writes a dataset spec "
+        "(large CW20 / CW721 / denom holder sets, burn txs, explorer txs), "
+        "`record` captures real mainnet responses into a dataset, and `serve` "
+        "answers LCD and explorer HTTP requests from one. Set "
+        "INJECTIVE_CHAIN_STANDIN to the dataset path for the gRPC side."
+    )
+
+    def add_arguments(self, parser):
+        sub = parser.add_subparsers(dest='action', required=True)
+
+        synth = sub.add_parser('synthesize', help="Write a synthetic dataset spec.")
+        synth.add_argument('out', help="Dataset file to write.")
+        synth.add_argument('--preset', choices=sorted(PRESETS), help="Start from a preset.")
+        synth.add_argument('--seed', type=int, default=1)
+        synth.add_argument('--cw20', action='append', metavar='CONTRACT=HOLDERS')
+        synth.add_argument('--cw721', action='append', metavar='CONTRACT=TOKENS')
+        synth.add_argument('--denom', action='append', metavar='DENOM=HOLDERS')
+        synth.add_argument('--account-txs', action='append', metavar='ADDRESS=TXS')
+        synth.add_argument('--burn-txs', type=int, default=None)
+
+        record = sub.add_parser('record', help="Record mainnet responses into a dataset.")
+        record.add_argument('out', help="Dataset file to write (extended if it exists).")
+        record.add_argument('--address', action='append', default=[],
+                            help="Record bank balances and account (gRPC), and the explorer "
+                                 "accountTxs ranges the scam checker reads.")
+        record.add_argument('--denom', action='append', default=[],
+                            help="Record all owners, supply and metadata.")
+        record.add_argument('--contract', action='append', default=[],
+                            help="Record the full contract state (gRPC and LCD pages).")
+        record.add_argument('--tx', action='append', default=[], help="Record an LCD tx by hash.")
+
+        serve = sub.add_parser('serve', help="Serve LCD / explorer HTTP from a dataset.")
+        serve.add_argument('dataset')
+        serve.add_argument('--host', default='127.0.0.1')
+        serve.add_argument('--port', type=int, default=8787)
+        serve.add_argument('--latency-ms', type=float, default=None)
+        serve.add_argument('--jitter-ms', type=float, default=None)
+        serve.add_argument('--failure-rate', type=float, default=None)
+
+    def handle(self, *args, **options):
+        getattr(self, f"_{options['action']}")(options)
+
+    # -- synthesize ----------------------------------------------------------
+
+    def _synthesize(self, options):
+        spec = {k: (dict(v) if isinstance(v, dict) else v)
+                for k, v in PRESETS.get(options['preset'], {}).items()}
+        spec['seed'] = options['seed']
+        spec.setdefault('cw20', {}).update(_pairs(options['cw20'], 'cw20'))
+        spec.setdefault('cw721', {}).update(
+            {c: {'tokens': n} for c, n in _pairs(options['cw721'], 'cw721').items()}
+        )
+        spec.setdefault('denoms', {}).update(_pairs(options['denom'], 'denom'))
+        spec.setdefault('account_txs', {}).update(_pairs(options['account_txs'], 'account-txs'))
+        if options['burn_txs'] is not None:
+            spec['burn_txs'] = options['burn_txs']
+        ChainDataset(synthetic=spec).save(options['out'])
+        self.stdout.write(self.style.SUCCESS(f"Wrote dataset spec to {options['out']}: {spec}"))
+
+    # -- record --------------------------------------------------------------
+
+    def _record(self, options):
+        try:
+            dataset = ChainDataset.load(options['out'])
+        except FileNotFoundError:
+            dataset = ChainDataset()
+        client = ChainClient(RecordingGateway(get_chain_gateway(), dataset))
+        asyncio.run(self._record_grpc(client, options))
+
+        for address in options['address']:
+            _RecordingScamChecker(address, dataset).fetch_sequential_ranges()
+        for tx_hash in options['tx']:
+            self._record_lcd(dataset, f"/cosmos/tx/v1beta1/txs/{tx_hash.upper()}", {})
+        for contract in options['contract']:
+            params = {'pagination.limit': 1000}
+            while True:
+                body = self._record_lcd(dataset, f"/cosmwasm/wasm/v1/contract/{contract}/state", params)
+                next_key = (body.get('pagination') or {}).get('next_key')
+                if not next_key:
+                    break
+                params = {'pagination.limit': 1000, 'pagination.key': next_key}
+
+        dataset.save(options['out'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Recorded {len(dataset.grpc)} gRPC and {len(dataset.lcd)} LCD / explorer "
+            f"responses to {options['out']}."
+        ))
+
+    async def _record_grpc(self, client, options):
+        for address in options['address']:
+            await client.fetch_bank_balances(address=address)
+            await client.fetch_account(address=address)
+        for denom in options['denom']:
+            await client.fetch_supply_of(denom=denom)
+            await client.fetch_denom_metadata(denom=denom)
+            key = None
+            while True:
+                page = await client.fetch_denom_owners(
+                    denom=denom, pagination=PaginationOption(limit=1000, encoded_page_key=key),
+                )
+                key = (page.get('pagination') or {}).get('nextKey') or None
+                if not key:
+                    break
+        for contract in options['contract']:
+            async for _ in scan_contract_state(client, contract, decode=bytes):
+                pass
+
+    def _record_lcd(self, dataset, path, params):
+        resp = lcd_get(path, params=params, timeout=30)
+        body = resp.json()
+        dataset.lcd[lcd_key(path, params)] = {'status': resp.status_code, 'body': body}
+        return body
+
+    # -- serve ---------------------------------------------------------------
+
+    def _serve(self, options):
+        behaviour = StandinBehaviour.from_settings()
+        for field in ('latency_ms', 'jitter_ms', 'failure_rate'):
+            if options[field] is not None:
+                setattr(behaviour, field, options[field])
+        server = serve_http(ChainDataset.load(options['dataset']), options['host'], options['port'], behaviour)
+        host, port = server.server_address[:2]
+        self.stdout.write(self.style.SUCCESS(
+            f"Chain stand-in listening on http://{host}:{port} ({behaviour}); "
+            f"set INJECTIVE_LCD_ENDPOINTS and INJECTIVE_EXPLORER_API to it. Ctrl-C to stop."
+        ))
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.shutdown()
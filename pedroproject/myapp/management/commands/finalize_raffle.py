@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+
+from myapp.views import finalize_raffle_weeks
+
+
+class Command(BaseCommand):
+    help = (
+        "Draw the winner of every finished raffle week that has tickets but "
+        "no RaffleResult yet, then delete the drawn weeks' ticket ranges and "
+        "per-wallet counters in short batched transactions. Runs under a "
+        "cluster-wide lease, so overlapping runs are harmless. Schedule it "
+        "just after Monday 00:00 UTC and then every few minutes; the raffle "
+        "endpoints only read the RaffleResult rows it writes. Draw and "
+        "cleanup timings are stored on each RaffleResult."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help="Rows deleted per transaction (default: settings.RAFFLE_CLEANUP_BATCH_SIZE).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            metrics = finalize_raffle_weeks(batch_size=options['batch_size'])
+        except Exception as e:
+            self.stderr.write(self.style.ERROR(f"Raffle finalizer failed: {e}"))
+            raise SystemExit(1)
+        if metrics is None:
+            self.stdout.write("Another worker is already finalizing; nothing to do.")
+            return
+
+        for d in metrics['drawn']:
+            self.stdout.write(
+                f"{d['week']}: ticket #{d['winning_ticket_number']} of {d['ticket_count']} "
+                f"-> {d['winning_address']} (draw {d['draw_ms']} ms)"
+            )
+        for c in metrics['cleaned']:
+            self.stdout.write(
+                f"{c['week']}: deleted {c['rows_deleted']} rows in {c['batches']} batches "
+                f"({c['cleanup_ms']} ms)"
+            )
+        msg = (
+            f"Drew {len(metrics['drawn'])} week(s), cleaned {len(metrics['cleaned'])} "
+            f"in {metrics['total_ms']} ms."
+        )
+        if metrics['complete']:
+            self.stdout.write(self.style.SUCCESS(msg))
+        else:
+            self.stdout.write(self.style.WARNING(msg + " Lease lost mid-cleanup; the next run continues."))
@@ -4,6 +4,7 @@ import pandas as pd
 from django.core.management.base import BaseCommand
 
 from myapp.models import GameLeaderboardEntry
+from myapp.views import _bump_game_board_generation, _rebuild_game_month_best
 
 
 class Command(BaseCommand):
@@ -84,6 +85,10 @@ class Command(BaseCommand):
                 batch_size=500,
             )
 
+        # The per-month best table is only maintained on submit; re-derive it.
+        _rebuild_game_month_best()
+        _bump_game_board_generation()
+
         total = GameLeaderboardEntry.objects.count()
         self.stdout.write(
             self.style.SUCCESS(
@@ -3,6 +3,7 @@ import os
 
 from django.core.management.base import BaseCommand
 
+from myapp.ACpedro_show_token_burn_web import VERIFIED_TOKENS_CACHE
 from myapp.models import VerifiedToken
 
 
@@ -75,6 +76,8 @@ class Command(BaseCommand):
         VerifiedToken.objects.bulk_create(
             objs, ignore_conflicts=True, batch_size=500,
         )
+        # Workers cache the token list; make them reload it.
+        VERIFIED_TOKENS_CACHE.invalidate('all')
 
         total = VerifiedToken.objects.count()
         self.stdout.write(self.style.SUCCESS(
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+from myapp.injective_burn_index import BurnIndexError, index_burns
+
+
+class Command(BaseCommand):
+    help = (
+        "Follow transfers into the $PEDRO burn address from the stored cursor "
+        "and record them in the BurnEvent table. Run on a short cron (every "
+        "minute) so burn verification and the burn page read the local index "
+        "instead of the LCD. The first run backfills the whole history."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-pages',
+            type=int,
+            default=None,
+            help="Tx search pages (100 txs each) to read this run (default: until caught up).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            stats = index_burns(max_pages=options['max_pages'])
+        except BurnIndexError as e:
+            self.stderr.write(self.style.ERROR(f"Burn index failed: {e}"))
+            raise SystemExit(1)
+        if stats is None:
+            self.stdout.write("Another worker is already indexing; nothing to do.")
+            return
+        msg = (
+            f"Indexed {stats['txs']} txs / {stats['events']} burns in {stats['pages']} pages; "
+            f"next height {stats['next_height']}."
+        )
+        if stats['caught_up']:
+            self.stdout.write(self.style.SUCCESS(msg + " Caught up."))
+        else:
+            self.stdout.write(self.style.WARNING(msg + " More to go; the next run continues."))
@@ -1,7 +1,8 @@
 """
 Picks the winner for a completed raffle week. By default the most recently
 completed week (i.e. last week relative to UTC now). Pass --week 2026-W18
-to pick a specific week.
+to pick a specific week. The running week is refused: its tickets are still
+being sold.
 
 Usage:
     python manage.py pick_raffle_winner
@@ -10,24 +11,19 @@ Usage:
 
 Idempotent: refuses to overwrite an existing RaffleResult unless --force.
 """
-import secrets
 from datetime import datetime, timezone, timedelta
 
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 
-from myapp.models import GameLeaderboardEntry, RaffleResult, RaffleTicket
+from myapp.models import GameLeaderboardEntry, RaffleResult
+from myapp.views import _current_week, _draw_raffle_ticket
 
 
 def _last_completed_week() -> str:
-    """ISO week of yesterday (close enough to 'last completed week' for our
-    purposes — if you call this on Monday it returns last week, on any other
-    day it returns the current ISO week, which is fine because we only use
-    this as a default and the user can override with --week)."""
-    now = datetime.now(timezone.utc)
-    # Step back 1 day so a Monday call after week rollover lands on Sunday
-    # of the just-finished week.
-    target = now - timedelta(days=1)
+    """ISO week before the current one — the most recently completed week,
+    whichever day this runs."""
+    target = datetime.now(timezone.utc) - timedelta(days=7)
     iso_year, iso_week, _ = target.isocalendar()
     return f"{iso_year}-W{iso_week:02d}"
 
@@ -61,6 +57,9 @@ class Command(BaseCommand):
     @transaction.atomic
     def handle(self, *args, week=None, force=False, **options):
         target_week = week or _last_completed_week()
+        # 'YYYY-Www' strings sort chronologically.
+        if target_week >= _current_week():
+            raise CommandError(f"{target_week} has not finished yet; its tickets are still on sale.")
         self.stdout.write(f"Drawing winner for week {target_week}")
 
         existing = RaffleResult.objects.filter(week=target_week).first()
@@ -71,38 +70,36 @@ class Command(BaseCommand):
                 f"Pass --force to overwrite."
             )
 
-        ticket_ids = list(
-            RaffleTicket.objects
-            .filter(week=target_week)
-            .values_list('id', 'address')
-        )
-        if not ticket_ids:
+        # A cryptographically random ticket number (secrets.randbelow) —
+        # leaves no doubt that the team used a fair source of entropy.
+        drawn = _draw_raffle_ticket(target_week)
+        if drawn is None:
             raise CommandError(f"No tickets found for {target_week}")
-
-        # secrets.choice for a cryptographically random pick — leaves no
-        # doubt that the team used a fair source of entropy.
-        winning_id, winning_address = secrets.choice(ticket_ids)
+        winning_range, winning_number, ticket_count = drawn
+        winning_address = winning_range.address
         winning_name = _canonical_name_for(winning_address)
 
         if existing:
             existing.winning_address = winning_address
-            existing.winning_ticket_id = winning_id
+            existing.winning_ticket_id = winning_range.id
+            existing.winning_ticket_number = winning_number
             existing.winning_name = winning_name
-            existing.ticket_count = len(ticket_ids)
+            existing.ticket_count = ticket_count
             existing.save(update_fields=[
-                'winning_address', 'winning_ticket_id',
+                'winning_address', 'winning_ticket_id', 'winning_ticket_number',
                 'winning_name', 'ticket_count', 'picked_at',
             ])
         else:
             RaffleResult.objects.create(
                 week=target_week,
                 winning_address=winning_address,
-                winning_ticket_id=winning_id,
+                winning_ticket_id=winning_range.id,
+                winning_ticket_number=winning_number,
                 winning_name=winning_name,
-                ticket_count=len(ticket_ids),
+                ticket_count=ticket_count,
             )
 
         self.stdout.write(self.style.SUCCESS(
-            f"Winner: {winning_address} (#{winning_id}) "
-            f"out of {len(ticket_ids)} tickets"
+            f"Winner: {winning_address} (ticket #{winning_number}) "
+            f"out of {ticket_count} tickets"
         ))
@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+# Importing views registers the per-endpoint processors.
+import myapp.views  # noqa: F401
+from myapp.submissions import process_due_submissions
+
+
+class Command(BaseCommand):
+    help = (
+        "Verify and apply accepted burn-gated submissions (PendingSubmission). "
+        "A tx the LCD can't return yet is retried with backoff; verified ones "
+        "are applied exactly once and their outcome stored for the "
+        "/submissions/<id>/ status endpoint. Runs as a long-lived worker by "
+        "default; use --once from cron instead."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help="Process one batch of due submissions and exit.",
+        )
+        parser.add_argument(
+            '--batch',
+            type=int,
+            default=50,
+            help="Submissions claimed per batch (default 50).",
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1.0,
+            help="Seconds to sleep when nothing is due (default 1).",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            outcomes = process_due_submissions(limit=options['batch'])
+            if outcomes:
+                self.stdout.write(
+                    ", ".join(f"{outcome}: {n}" for outcome, n in sorted(outcomes.items()))
+                )
+            if options['once']:
+                return
+            if not outcomes:
+                time.sleep(options['interval'])
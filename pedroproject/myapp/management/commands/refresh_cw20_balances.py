@@ -0,0 +1,43 @@
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from myapp.injective_cw20_balances import TRACKED_CW20_CONTRACTS, refresh_cw20_balances
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh the materialized Cw20Balance table (Pedro, Shroom, Nonja) from "
+        "the on-chain contract state. Only rows whose balance changed are "
+        "rewritten. Run on a short cron (every ~5 minutes) so the holder, "
+        "supply, burn and wallet views never page the chain themselves."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--contract',
+            action='append',
+            help='CW20 contract to refresh (repeatable). Defaults to all tracked tokens.',
+        )
+
+    def handle(self, *args, **options):
+        contracts = options['contract'] or list(TRACKED_CW20_CONTRACTS)
+
+        async def _run():
+            return await asyncio.gather(
+                *(refresh_cw20_balances(c) for c in contracts),
+                return_exceptions=True,
+            )
+
+        failed = False
+        for contract, result in zip(contracts, asyncio.run(_run())):
+            if isinstance(result, Exception):
+                failed = True
+                self.stderr.write(self.style.ERROR(f"{contract}: refresh failed: {result}"))
+                continue
+            self.stdout.write(self.style.SUCCESS(
+                f"{contract}: {result['holders']} holders "
+                f"(+{result['created']} ~{result['updated']} -{result['deleted']})"
+            ))
+        if failed:
+            raise SystemExit(1)
@@ -1,25 +1,66 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
-from myapp.views import _refresh_nft_holders
+from myapp.models import ContractScanCheckpoint
+from myapp.views import _NFT_HOLDERS_SCAN_NAME, _refresh_nft_holders_leased
 
 
 class Command(BaseCommand):
     help = (
-        "Rebuild the Pedro NFT holder cache (address -> NFT count) by scanning "
-        "the full contract state, and write it to the shared cache. Run on a "
-        "short cron (every ~5 minutes) so the raffle / eligibility endpoints "
-        "always read a warm cache and never block a user request on the scan."
+        "Rebuild the Pedro NFT holder snapshot (address -> NFT count) by "
+        "scanning the full contract state, and publish it to the "
+        "PedroNftHolding table. Run on a short cron (every ~5 minutes) so the "
+        "raffle / eligibility endpoints always read a fresh snapshot and never "
+        "block a user request on the scan. "
+        "A scan that hits an LCD error or its page budget is checkpointed and "
+        "resumed by the next run."
     )
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-pages',
+            type=int,
+            default=None,
+            help="Pages to read this run (default: settings.NFT_HOLDERS_SCAN_PAGES_PER_RUN).",
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help="Drop any saved checkpoint and scan from page 1.",
+        )
+
     def handle(self, *args, **options):
-        self.stdout.write("Refreshing Pedro NFT holder cache…")
+        if options['restart']:
+            ContractScanCheckpoint.objects.filter(name=_NFT_HOLDERS_SCAN_NAME).update(
+                next_key='', partial={}, pages=0,
+            )
+
+        self.stdout.write("Refreshing Pedro NFT holder snapshot…")
         try:
-            counts = _refresh_nft_holders()
+            counts = _refresh_nft_holders_leased(max_pages=options['max_pages'])
         except Exception as e:
             self.stderr.write(self.style.ERROR(f"Refresh failed: {e}"))
             raise SystemExit(1)
+        if counts is None:
+            self.stdout.write("Another worker is already scanning; nothing to do.")
+            return
+
+        checkpoint = ContractScanCheckpoint.objects.get(name=_NFT_HOLDERS_SCAN_NAME)
+        if checkpoint.last_error and not checkpoint.in_progress():
+            # Failed on the first page of a fresh pass: there is no pagination
+            # key to resume from, and nothing was stored.
+            raise CommandError(
+                f"Scan failed before reading any page: {checkpoint.last_error}"
+            )
+        if checkpoint.in_progress():
+            msg = f"Scan paused at page {checkpoint.pages}; the next run resumes there."
+            if checkpoint.last_error:
+                self.stderr.write(self.style.WARNING(f"{msg} Last error: {checkpoint.last_error}"))
+                raise SystemExit(1)
+            self.stdout.write(self.style.WARNING(msg))
+            return
         self.stdout.write(
             self.style.SUCCESS(
-                f"Cached {len(counts)} holders, {sum(counts.values())} NFTs."
+                f"Stored {len(counts)} holders, {sum(counts.values())} NFTs "
+                f"({checkpoint.pages} pages)."
             )
         )
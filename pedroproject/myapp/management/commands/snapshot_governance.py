@@ -1,21 +1,9 @@
-import asyncio
 from datetime import datetime, timezone
 
 from django.core.management.base import BaseCommand
-from django.db import transaction
 
-from myapp.injective_nft_holders import InjectiveHolders2
-from myapp.models import GovernanceVoterSnapshot
-
-PEDRO_NFT_CONTRACT = 'inj1uq453kp4yda7ruc0axpmd9vzfm0fj62padhe0p'
-
-# Addresses excluded from voting power: burn + project pools/marketplaces.
-# Mirrors the lists used by injective_nft_holders.py so creators / contracts
-# can't vote on community proposals.
-EXCLUDED_ADDRESSES = {
-    'inj1qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqe2hm49',  # burn
-    'inj1l9nh9wv24fktjvclc4zgrgyzees7rwdtx45f54',  # Talis Marketplace
-}
+from myapp.models import GovernanceSnapshotJob
+from myapp.views import build_governance_snapshot
 
 
 def _current_month():
@@ -26,7 +14,12 @@ class Command(BaseCommand):
     help = (
         "Snapshot Pedro NFT holders into the GovernanceVoterSnapshot table. "
         "Run on the 1st of each month (UTC) — each address's NFT count at the "
-        "moment of snapshot becomes their voting power for that month."
+        "moment of snapshot becomes their voting power for that month. Copies "
+        "the current NFT holder snapshot (kept fresh by refresh_nft_holders) "
+        "rather than scanning the chain again. Builds through the month's "
+        "GovernanceSnapshotJob under the same lease as the background build "
+        "the governance endpoints start, so only one runs at a time; state, "
+        "progress and duration are recorded on the job."
     )
 
     def add_arguments(self, parser):
@@ -35,74 +28,41 @@ class Command(BaseCommand):
             default=None,
             help='Override target month (YYYY-MM). Defaults to current UTC month.',
         )
-        parser.add_argument(
-            '--contract',
-            default=PEDRO_NFT_CONTRACT,
-            help='NFT contract address to snapshot (default: Pedro NFT).',
-        )
         parser.add_argument(
             '--replace',
             action='store_true',
-            help='Delete existing snapshot rows for this month before writing.',
+            help='Rebuild the snapshot even if this month\'s is already ready.',
         )
 
     def handle(self, *args, **options):
         month = options['month'] or _current_month()
-        contract = options['contract']
-        replace = options['replace']
 
-        existing = GovernanceVoterSnapshot.objects.filter(month=month).count()
-        if existing and not replace:
+        existing = GovernanceSnapshotJob.objects.filter(
+            month=month, state=GovernanceSnapshotJob.STATE_READY,
+        ).first()
+        if existing and not options['replace']:
             self.stdout.write(
                 self.style.WARNING(
-                    f"Snapshot for {month} already has {existing} rows. "
+                    f"Snapshot for {month} is already ready with {existing.voters} voters. "
                     f"Pass --replace to overwrite."
                 )
             )
             return
 
-        self.stdout.write(f"Fetching {contract} holders…")
-        try:
-            data = asyncio.run(InjectiveHolders2().fetch_holder_nft(contract))
-        except Exception as e:
-            self.stderr.write(self.style.ERROR(f"Failed to fetch holders: {e}"))
-            return
-
-        holders = data.get('holders') or []
-        rows = []
-        for h in holders:
-            owner = h.get('owner')
-            total = h.get('total')
-            if not owner or not total:
-                continue
-            if owner in EXCLUDED_ADDRESSES:
-                continue
-            try:
-                count = int(total)
-            except (TypeError, ValueError):
-                continue
-            if count <= 0:
-                continue
-            rows.append(GovernanceVoterSnapshot(
-                month=month,
-                address=owner,
-                nft_count=count,
+        self.stdout.write(f"Building {month} snapshot from the NFT holder snapshot…")
+        job = build_governance_snapshot(month, replace=options['replace'])
+        if job is None:
+            self.stdout.write(self.style.WARNING(
+                f"Another worker is building the {month} snapshot; nothing to do."
             ))
-
-        with transaction.atomic():
-            if replace:
-                GovernanceVoterSnapshot.objects.filter(month=month).delete()
-            GovernanceVoterSnapshot.objects.bulk_create(
-                rows,
-                ignore_conflicts=True,
-                batch_size=500,
-            )
-
-        total = GovernanceVoterSnapshot.objects.filter(month=month).count()
-        total_power = sum(r.nft_count for r in rows)
+            return
+        if job.state == GovernanceSnapshotJob.STATE_FAILED:
+            self.stderr.write(self.style.ERROR(f"Snapshot for {month} failed: {job.error}"))
+            raise SystemExit(1)
         self.stdout.write(
             self.style.SUCCESS(
-                f"Snapshot for {month}: {total} eligible voters, "
-                f"{total_power} total voting points."
+                f"Snapshot for {month}: {job.voters} eligible voters, "
+                f"{job.voting_power} total voting points, frozen from NFT holder "
+                f"snapshot #{job.nft_snapshot_id} ({job.duration_ms} ms)."
             )
         )
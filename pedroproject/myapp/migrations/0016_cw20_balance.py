@@ -0,0 +1,36 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0015_special_proposal_options'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Cw20Balance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('contract', models.CharField(db_index=True, max_length=64)),
+                ('address', models.CharField(db_index=True, max_length=64)),
+                ('amount', models.DecimalField(decimal_places=0, max_digits=40)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['contract', '-amount'],
+                'unique_together': {('contract', 'address')},
+            },
+        ),
+        migrations.CreateModel(
+            name='Cw20BalanceSync',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('contract', models.CharField(db_index=True, max_length=64, unique=True)),
+                ('holders', models.IntegerField(default=0)),
+                ('total_supply', models.DecimalField(decimal_places=0, default=0, max_digits=40)),
+                ('rows_changed', models.IntegerField(default=0)),
+                ('synced_at', models.DateTimeField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0016_cw20_balance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContractScanCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(db_index=True, max_length=64, unique=True)),
+                ('next_key', models.TextField(blank=True, default='')),
+                ('pages', models.IntegerField(default=0)),
+                ('partial', models.JSONField(blank=True, default=dict)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
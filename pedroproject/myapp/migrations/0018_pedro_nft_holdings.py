@@ -0,0 +1,34 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0017_contract_scan_checkpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PedroNftSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('holders', models.IntegerField(default=0)),
+                ('tokens', models.IntegerField(default=0)),
+                ('pages', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PedroNftHolding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('address', models.CharField(max_length=64)),
+                ('count', models.IntegerField()),
+                ('snapshot', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='holdings', to='myapp.pedronftsnapshot')),
+            ],
+            options={
+                'unique_together': {('snapshot', 'address')},
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0019_lease'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingSubmission',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('game_score', 'Game score'), ('raffle_buy', 'Raffle purchase'), ('raffle_free', 'Raffle free claim'), ('governance_vote', 'Governance vote'), ('special_vote', 'Special proposal vote'), ('special_create', 'Special proposal creation'), ('dashboard_log', 'Dashboard tx log')], max_length=32)),
+                ('address', models.CharField(db_index=True, max_length=64)),
+                ('tx_hash', models.CharField(max_length=128)),
+                ('payload', models.JSONField(default=dict)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('applied', 'Applied'), ('failed', 'Failed')], default='pending', max_length=16)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField()),
+                ('claimed_by', models.CharField(blank=True, max_length=128)),
+                ('claimed_until', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('http_status', models.IntegerField(blank=True, null=True)),
+                ('result', models.JSONField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'unique_together': {('kind', 'tx_hash')},
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='myapp_pendsub_due_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0020_pending_submission'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BurnEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tx_hash', models.CharField(db_index=True, max_length=128)),
+                ('seq', models.IntegerField(default=0)),
+                ('from_address', models.CharField(db_index=True, max_length=64)),
+                ('denom', models.CharField(db_index=True, max_length=255)),
+                ('amount_wei', models.DecimalField(decimal_places=0, max_digits=40)),
+                ('memo', models.CharField(blank=True, max_length=256)),
+                ('height', models.BigIntegerField(db_index=True)),
+                ('block_time', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'unique_together': {('tx_hash', 'seq')},
+            },
+        ),
+        migrations.CreateModel(
+            name='BurnIndexCursor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('address', models.CharField(db_index=True, max_length=64, unique=True)),
+                ('next_height', models.BigIntegerField(default=0)),
+                ('events', models.IntegerField(default=0)),
+                ('caught_up_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
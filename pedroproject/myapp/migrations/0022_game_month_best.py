@@ -0,0 +1,46 @@
+from django.db import migrations, models
+
+
+def backfill_month_best(apps, schema_editor):
+    GameLeaderboardEntry = apps.get_model('myapp', 'GameLeaderboardEntry')
+    GameMonthBest = apps.get_model('myapp', 'GameMonthBest')
+    best = {}
+    entries = (
+        GameLeaderboardEntry.objects
+        .order_by('-score', 'submitted_at', 'id')
+        .values_list('month', 'address', 'score', 'tx_hash', 'name', 'submitted_at')
+        .iterator()
+    )
+    for month, address, score, tx_hash, name, submitted_at in entries:
+        best.setdefault((month, address), GameMonthBest(
+            month=month, address=address, best_score=score,
+            best_tx=tx_hash, name=name, best_at=submitted_at,
+        ))
+    GameMonthBest.objects.bulk_create(best.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0021_burn_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GameMonthBest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.CharField(max_length=7)),
+                ('address', models.CharField(max_length=64)),
+                ('best_score', models.BigIntegerField()),
+                ('best_tx', models.CharField(max_length=128)),
+                ('name', models.CharField(max_length=64)),
+                ('best_at', models.DateTimeField()),
+            ],
+            options={
+                'unique_together': {('month', 'address')},
+                'indexes': [models.Index(fields=['month', '-best_score', 'best_at'], name='myapp_gamebest_rank_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_month_best, migrations.RunPython.noop),
+    ]
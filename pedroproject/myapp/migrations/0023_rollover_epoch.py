@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0022_game_month_best'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RolloverEpoch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job', models.CharField(max_length=64, unique=True)),
+                ('period', models.CharField(max_length=16)),
+                ('completed_at', models.DateTimeField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0023_rollover_epoch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameupgradestate',
+            name='sync_seq',
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def start_accrual(apps, schema_editor):
+    # Until now the client pushed its auto-mined score itself; from here on
+    # the server accrues it, starting now for everyone with an auto level.
+    GameUpgradeState = apps.get_model('myapp', 'GameUpgradeState')
+    GameUpgradeState.objects.filter(auto_level__gt=0).update(accrual_started_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0024_gameupgradestate_sync_seq'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='gameupgradestate',
+            old_name='score',
+            new_name='score_base',
+        ),
+        migrations.AddField(
+            model_name='gameupgradestate',
+            name='accrual_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(start_accrual, migrations.RunPython.noop),
+    ]
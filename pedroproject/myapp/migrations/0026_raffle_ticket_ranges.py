@@ -0,0 +1,60 @@
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def pack_ticket_ranges(apps, schema_editor):
+    """Collapse the one-row-per-ticket rows into one range per purchase /
+    claim, numbering each week's tickets 1..N in the order they were entered."""
+    RaffleTicket = apps.get_model('myapp', 'RaffleTicket')
+    # order_by() drops the model's -created_at ordering, which would
+    # otherwise make DISTINCT list a week once per entry time.
+    weeks = list(RaffleTicket.objects.order_by().values_list('week', flat=True).distinct())
+    for week in weeks:
+        groups = list(
+            RaffleTicket.objects
+            .filter(week=week)
+            .values('address', 'source', 'tx_hash')
+            .annotate(keep=Min('id'), n=Count('id'))
+            .order_by('keep')
+        )
+        next_no = 1
+        for g in groups:
+            RaffleTicket.objects.filter(pk=g['keep']).update(first_no=next_no, count=g['n'])
+            (
+                RaffleTicket.objects
+                .filter(week=week, address=g['address'], source=g['source'], tx_hash=g['tx_hash'])
+                .exclude(pk=g['keep'])
+                .delete()
+            )
+            next_no += g['n']
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0025_game_idle_accrual'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='raffleticket',
+            name='first_no',
+            field=models.BigIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='raffleticket',
+            name='count',
+            field=models.IntegerField(default=1),
+            preserve_default=False,
+        ),
+        migrations.RunPython(pack_ticket_ranges, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='raffleticket',
+            name='first_no',
+            field=models.BigIntegerField(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='raffleticket',
+            unique_together={('week', 'first_no')},
+        ),
+    ]
@@ -0,0 +1,61 @@
+from django.db import migrations, models
+from django.db.models import F, Max, Sum
+
+
+def backfill_counters(apps, schema_editor):
+    RaffleTicket = apps.get_model('myapp', 'RaffleTicket')
+    RaffleFreeClaim = apps.get_model('myapp', 'RaffleFreeClaim')
+    RaffleWeekStats = apps.get_model('myapp', 'RaffleWeekStats')
+    RaffleEntrant = apps.get_model('myapp', 'RaffleEntrant')
+    # Without order_by() the model's -created_at ordering makes DISTINCT
+    # list a week once per entry time.
+    weeks = list(RaffleTicket.objects.order_by().values_list('week', flat=True).distinct())
+    for week in weeks:
+        per_address = list(
+            RaffleTicket.objects
+            .filter(week=week)
+            .values('address')
+            .annotate(tickets=Sum('count'))
+            .order_by('address')
+        )
+        free = set(RaffleFreeClaim.objects.filter(week=week).values_list('address', flat=True))
+        RaffleEntrant.objects.bulk_create([
+            RaffleEntrant(week=week, address=row['address'], tickets=row['tickets'],
+                          free_claimed=row['address'] in free)
+            for row in per_address
+        ])
+        end = RaffleTicket.objects.filter(week=week).aggregate(end=Max(F('first_no') + F('count') - 1))['end']
+        RaffleWeekStats.objects.create(week=week, total_tickets=end or 0, participants=len(per_address))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0026_raffle_ticket_ranges'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RaffleWeekStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('week', models.CharField(max_length=10, unique=True)),
+                ('total_tickets', models.BigIntegerField(default=0)),
+                ('participants', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RaffleEntrant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('week', models.CharField(max_length=10)),
+                ('address', models.CharField(max_length=64)),
+                ('tickets', models.BigIntegerField(default=0)),
+                ('free_claimed', models.BooleanField(default=False)),
+            ],
+            options={
+                'unique_together': {('week', 'address')},
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
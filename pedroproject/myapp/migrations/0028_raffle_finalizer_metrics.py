@@ -0,0 +1,36 @@
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_existing_cleaned(apps, schema_editor):
+    # Draws made before the finalizer deleted their tickets on the spot.
+    RaffleResult = apps.get_model('myapp', 'RaffleResult')
+    RaffleTicket = apps.get_model('myapp', 'RaffleTicket')
+    pending = RaffleTicket.objects.values('week')
+    RaffleResult.objects.exclude(week__in=pending).update(cleaned_up_at=F('picked_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0027_raffle_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='raffleresult',
+            name='draw_ms',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='raffleresult',
+            name='cleanup_ms',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='raffleresult',
+            name='cleaned_up_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_existing_cleaned, migrations.RunPython.noop),
+    ]
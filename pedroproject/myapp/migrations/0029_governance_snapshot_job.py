@@ -0,0 +1,51 @@
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_jobs(apps, schema_editor):
+    # Months snapshotted before jobs existed are ready as they stand.
+    GovernanceVoterSnapshot = apps.get_model('myapp', 'GovernanceVoterSnapshot')
+    GovernanceSnapshotJob = apps.get_model('myapp', 'GovernanceSnapshotJob')
+    months = (
+        GovernanceVoterSnapshot.objects
+        .values('month')
+        .annotate(voters=Count('id'), power=Sum('nft_count'))
+        .order_by('month')
+    )
+    GovernanceSnapshotJob.objects.bulk_create([
+        GovernanceSnapshotJob(
+            month=m['month'], state='ready',
+            rows_written=m['voters'], rows_total=m['voters'],
+            voters=m['voters'], voting_power=m['power'] or 0,
+        )
+        for m in months
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0028_raffle_finalizer_metrics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GovernanceSnapshotJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.CharField(max_length=7, unique=True)),
+                ('state', models.CharField(choices=[('pending', 'Pending'), ('building', 'Building'), ('ready', 'Ready'), ('failed', 'Failed')], default='pending', max_length=16)),
+                ('rows_written', models.IntegerField(default=0)),
+                ('rows_total', models.IntegerField(blank=True, null=True)),
+                ('voters', models.IntegerField(default=0)),
+                ('voting_power', models.BigIntegerField(default=0)),
+                ('attempts', models.IntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('duration_ms', models.IntegerField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_jobs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0029_governance_snapshot_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='governancesnapshotjob',
+            name='nft_snapshot_id',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='governancesnapshotjob',
+            name='nft_snapshot_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
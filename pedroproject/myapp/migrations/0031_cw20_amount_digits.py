@@ -0,0 +1,43 @@
+from decimal import Decimal, InvalidOperation
+
+from django.db import migrations, models
+
+
+def normalise_amounts(apps, schema_editor):
+    # Values copied over from the numeric column may read back as "1E+26" or
+    # "123.0"; store plain digits. Amounts SQLite already rounded stay wrong
+    # until the next refresh_cw20_balances, which rewrites them.
+    for name, field in (('Cw20Balance', 'amount'), ('Cw20BalanceSync', 'total_supply')):
+        model = apps.get_model('myapp', name)
+        for pk, value in model.objects.values_list('pk', field):
+            try:
+                digits = str(int(Decimal(str(value))))
+            except (InvalidOperation, ValueError):
+                digits = '0'
+            if digits != value:
+                model.objects.filter(pk=pk).update(**{field: digits})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0030_governance_snapshot_source'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='cw20balance',
+            options={'ordering': ['contract']},
+        ),
+        migrations.AlterField(
+            model_name='cw20balance',
+            name='amount',
+            field=models.CharField(max_length=80),
+        ),
+        migrations.AlterField(
+            model_name='cw20balancesync',
+            name='total_supply',
+            field=models.CharField(default='0', max_length=80),
+        ),
+        migrations.RunPython(normalise_amounts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0031_cw20_amount_digits'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GameSyncBuffer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('address', models.CharField(max_length=64, unique=True)),
+                ('month', models.CharField(max_length=7)),
+                ('seq', models.BigIntegerField(default=0)),
+                ('score', models.BigIntegerField(default=0)),
+                ('click_level', models.IntegerField(default=0)),
+                ('auto_level', models.IntegerField(default=0)),
+                ('steal_level', models.IntegerField(default=0)),
+                ('dirty_since', models.DateTimeField(blank=True, db_index=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
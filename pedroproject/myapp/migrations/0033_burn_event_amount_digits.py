@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+def reindex_burns(apps, schema_editor):
+    # Amounts stored by the numeric column were kept as REALs, so anything
+    # past ~15 significant digits was rounded and can't be told apart from
+    # an exact value. Drop the rows and rewind the cursor; the next
+    # index_burns run rebuilds them, and until then verification asks the
+    # LCD as it does for any tx that isn't indexed.
+    apps.get_model('myapp', 'BurnEvent').objects.all().delete()
+    apps.get_model('myapp', 'BurnIndexCursor').objects.update(
+        next_height=0, events=0, caught_up_at=None,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0032_game_sync_buffer'),
+    ]
+
+    operations = [
+        migrations.RunPython(reindex_burns, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='burnevent',
+            name='amount_wei',
+            field=models.CharField(max_length=80),
+        ),
+    ]
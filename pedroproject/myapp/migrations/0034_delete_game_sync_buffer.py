@@ -0,0 +1,40 @@
+from django.db import migrations
+
+# Caps from views (GAME_MAX_SCORE, GAME_MAX_LEVEL, STEAL_MAX_LEVEL) as of
+# this migration.
+MAX_SCORE = 9_223_372_036_854_775_807
+LEVEL_CAPS = {'click_level': 1000, 'auto_level': 1000, 'steal_level': 12}
+
+
+def flush_buffers(apps, schema_editor):
+    # Sync buffers now live in each worker's memory. Write what is still
+    # pending in the table to the state rows before dropping it. Adding the
+    # score delta to score_base keeps accrual_started_at, so the live score
+    # moves by exactly the delta.
+    GameSyncBuffer = apps.get_model('myapp', 'GameSyncBuffer')
+    GameUpgradeState = apps.get_model('myapp', 'GameUpgradeState')
+    for buf in GameSyncBuffer.objects.filter(dirty_since__isnull=False):
+        state, _ = GameUpgradeState.objects.get_or_create(
+            address=buf.address, defaults={'current_month': buf.month},
+        )
+        if state.current_month != buf.month:
+            continue  # reset for a new month since; the deltas are void
+        state.score_base = min(MAX_SCORE, max(0, state.score_base + buf.score))
+        for field, cap in LEVEL_CAPS.items():
+            setattr(state, field, min(cap, getattr(state, field) + getattr(buf, field)))
+        state.sync_seq = max(state.sync_seq, buf.seq)
+        state.save()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0033_burn_event_amount_digits'),
+    ]
+
+    operations = [
+        migrations.RunPython(flush_buffers, migrations.RunPython.noop),
+        migrations.DeleteModel(
+            name='GameSyncBuffer',
+        ),
+    ]
@@ -16,12 +16,41 @@ class GameLeaderboardEntry(models.Model):
         return f"{self.name} - {self.score} ({self.month})"
 
 
+class GameMonthBest(models.Model):
+    """Each wallet's best leaderboard entry for a month, kept in step with
+    GameLeaderboardEntry on submit and steal. The leaderboard, rank lookups
+    and the rollover winner read this one row per player instead of
+    de-duplicating every submission of the month."""
+    month = models.CharField(max_length=7)
+    address = models.CharField(max_length=64)
+    best_score = models.BigIntegerField()
+    best_tx = models.CharField(max_length=128)
+    # Submitted name of the best entry; readers prefer the wallet's locked name.
+    name = models.CharField(max_length=64)
+    # submitted_at of the best entry — ties rank the earlier one first.
+    best_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = [('month', 'address')]
+        indexes = [
+            models.Index(fields=['month', '-best_score', 'best_at'], name='myapp_gamebest_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.month} {self.address} ({self.best_score})"
+
+
 class GameUpgradeState(models.Model):
     address = models.CharField(max_length=64, unique=True, db_index=True)
     click_level = models.IntegerField(default=0)
     auto_level = models.IntegerField(default=0)
     steal_level = models.IntegerField(default=0)
-    score = models.BigIntegerField(default=0)
+    # Score as of `accrual_started_at`. Idle income from `auto_level` accrues
+    # on top of it and is computed on read (views._live_score); the row is
+    # only rewritten ("rebased") when levels change, a steal lands or a score
+    # is submitted.
+    score_base = models.BigIntegerField(default=0)
+    accrual_started_at = models.DateTimeField(null=True, blank=True)
     last_steal_at = models.DateTimeField(null=True, blank=True)
     # Canonical display name for this wallet — set on first leaderboard submit
     # and preserved across month resets so identity is stable forever.
@@ -29,6 +58,9 @@ class GameUpgradeState(models.Model):
     # Which YYYY-MM month these levels/score are valid for. When this differs
     # from the live current month, the row is reset to zeros on next access.
     current_month = models.CharField(max_length=7, blank=True, default='')
+    # Highest client sequence number flushed here from /game/upgrades/sync/,
+    # so a retried batch that arrives after its flush is ignored.
+    sync_seq = models.BigIntegerField(default=0)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
@@ -36,8 +68,11 @@ class GameUpgradeState(models.Model):
 
 
 class RaffleTicket(models.Model):
-    """One row per ticket entered in a given week. Free tickets come from
-    NFT holdings, paid tickets come from a $PEDRO burn."""
+    """One row per purchase or free claim, holding tickets `first_no` ..
+    `last_no` of `week`. A week's tickets are numbered 1..N without gaps in
+    the order they were entered, so the draw picks a number and looks up the
+    one range that covers it. Free tickets come from NFT holdings, paid
+    tickets come from a $PEDRO burn."""
     SOURCE_FREE = 'free'
     SOURCE_PAID = 'paid'
     SOURCE_CHOICES = [
@@ -48,18 +83,26 @@ class RaffleTicket(models.Model):
     week = models.CharField(max_length=10, db_index=True)
     address = models.CharField(max_length=64, db_index=True)
     source = models.CharField(max_length=16, choices=SOURCE_CHOICES)
-    # Multiple paid tickets share the same tx_hash when bought together,
-    # so this is indexed but NOT unique. Replay protection lives in
-    # `RafflePurchase.tx_hash` (which IS unique).
+    # The purchase / claim burn. Replay protection lives in
+    # `RafflePurchase.tx_hash` and `RaffleFreeClaim.tx_hash` (which ARE unique).
     tx_hash = models.CharField(max_length=128, blank=True, db_index=True)
+    first_no = models.BigIntegerField()
+    count = models.IntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['-created_at']
-        indexes = [models.Index(fields=['week', 'address'])]
+        # Also the draw's lookup index: the range covering ticket n is the
+        # last one with first_no <= n.
+        unique_together = [('week', 'first_no')]
+        indexes = [models.Index(fields=['week', 'address'], name='myapp_raffl_week_addr_idx')]
+
+    @property
+    def last_no(self) -> int:
+        return self.first_no + self.count - 1
 
     def __str__(self):
-        return f"#{self.id} {self.week} {self.address} ({self.source})"
+        return f"{self.week} #{self.first_no}-{self.last_no} {self.address} ({self.source})"
 
 
 class RaffleFreeClaim(models.Model):
@@ -104,17 +147,53 @@ class RaffleResult(models.Model):
     claim 1 INJ; `payout_tx_hash` is filled by the team after payout."""
     week = models.CharField(max_length=10, unique=True, db_index=True)
     winning_address = models.CharField(max_length=64, db_index=True)
+    # The RaffleTicket range that held the winning ticket, and the winning
+    # ticket's number within the week (1..ticket_count).
     winning_ticket_id = models.BigIntegerField()
+    winning_ticket_number = models.IntegerField(default=0)
     winning_name = models.CharField(max_length=64, blank=True)
     ticket_count = models.IntegerField()
     picked_at = models.DateTimeField(auto_now_add=True)
     payout_tx_hash = models.CharField(max_length=128, blank=True)
+    # Timings recorded by the finalize_raffle job: how long the draw took,
+    # and when / how long deleting the week's tickets took.
+    draw_ms = models.IntegerField(null=True, blank=True)
+    cleanup_ms = models.IntegerField(null=True, blank=True)
+    cleaned_up_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         ordering = ['-week']
 
     def __str__(self):
-        return f"{self.week} -> {self.winning_address} (#{self.winning_ticket_id})"
+        return f"{self.week} -> {self.winning_address} (#{self.winning_ticket_number})"
+
+
+class RaffleWeekStats(models.Model):
+    """Running totals for one raffle week, updated in the same transaction
+    as every purchase / free claim. `total_tickets` doubles as the ticket
+    number allocator: a new range starts right after it."""
+    week = models.CharField(max_length=10, unique=True)
+    total_tickets = models.BigIntegerField(default=0)
+    participants = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.week}: {self.total_tickets} tickets, {self.participants} wallets"
+
+
+class RaffleEntrant(models.Model):
+    """One wallet's standing in one raffle week — its ticket count and
+    whether it used its free claim — kept in step with RaffleTicket so the
+    raffle page reads it with a single lookup."""
+    week = models.CharField(max_length=10)
+    address = models.CharField(max_length=64)
+    tickets = models.BigIntegerField(default=0)
+    free_claimed = models.BooleanField(default=False)
+
+    class Meta:
+        unique_together = [('week', 'address')]
+
+    def __str__(self):
+        return f"{self.week} {self.address}: {self.tickets} tickets"
 
 
 class GameStealLog(models.Model):
@@ -147,6 +226,46 @@ class GovernanceVoterSnapshot(models.Model):
         return f"{self.month} {self.address} ({self.nft_count})"
 
 
+class GovernanceSnapshotJob(models.Model):
+    """Build status of one month's GovernanceVoterSnapshot. The snapshot is
+    built by one worker under a lease, off the request path, by freezing the
+    current PedroNftSnapshot; endpoints read this row to report
+    `snapshot_state` and only trust the snapshot rows once it is `ready`."""
+    STATE_PENDING = 'pending'
+    STATE_BUILDING = 'building'
+    STATE_READY = 'ready'
+    STATE_FAILED = 'failed'
+    STATE_CHOICES = [
+        (STATE_PENDING, 'Pending'),
+        (STATE_BUILDING, 'Building'),
+        (STATE_READY, 'Ready'),
+        (STATE_FAILED, 'Failed'),
+    ]
+
+    month = models.CharField(max_length=7, unique=True)
+    state = models.CharField(max_length=16, choices=STATE_CHOICES, default=STATE_PENDING)
+    # Progress of the current / last build: snapshot rows written out of the
+    # eligible holders found (null until the source snapshot is read).
+    rows_written = models.IntegerField(default=0)
+    rows_total = models.IntegerField(null=True, blank=True)
+    # The PedroNftSnapshot this month's voting power was frozen from — a plain
+    # id, since superseded holder snapshots are deleted.
+    nft_snapshot_id = models.BigIntegerField(null=True, blank=True)
+    nft_snapshot_at = models.DateTimeField(null=True, blank=True)
+    # Totals of a ready snapshot, so readers don't COUNT / SUM the rows.
+    voters = models.IntegerField(default=0)
+    voting_power = models.BigIntegerField(default=0)
+    attempts = models.IntegerField(default=0)
+    error = models.TextField(blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration_ms = models.IntegerField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.month} snapshot: {self.state}"
+
+
 class GovernanceVote(models.Model):
     address = models.CharField(max_length=64, db_index=True)
     month = models.CharField(max_length=7, db_index=True)
@@ -273,6 +392,217 @@ class GameMonthPayout(models.Model):
         return f"{self.month} payout={'paid' if self.is_fully_paid() else 'pending'}"
 
 
+class Cw20Balance(models.Model):
+    """Materialized CW20 `balance` map: one row per (contract, holder) with a
+    non-zero balance. Filled by the `refresh_cw20_balances` command so the
+    holder / supply / burn / wallet views read SQL instead of paging the
+    contract state on every request. `amount` is the raw integer balance
+    (no decimals applied) as a decimal digit string: 1e9 tokens at 18
+    decimals overflows a BigInt, and SQLite keeps a DecimalField as a REAL,
+    which rounds it. Compare and sum it as Python ints."""
+    contract = models.CharField(max_length=64, db_index=True)
+    address = models.CharField(max_length=64, db_index=True)
+    amount = models.CharField(max_length=80)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = [('contract', 'address')]
+        ordering = ['contract']
+
+    def __str__(self):
+        return f"{self.contract} {self.address} ({self.amount})"
+
+
+class Cw20BalanceSync(models.Model):
+    """Freshness stamp for `Cw20Balance`, one row per contract. Readers use
+    `synced_at` to tell how old the materialized balances are; a contract
+    with no row here has never been refreshed."""
+    contract = models.CharField(max_length=64, unique=True, db_index=True)
+    holders = models.IntegerField(default=0)
+    # Raw integer digit string, like Cw20Balance.amount.
+    total_supply = models.CharField(max_length=80, default='0')
+    rows_changed = models.IntegerField(default=0)
+    synced_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.contract} @ {self.synced_at:%Y-%m-%d %H:%M}"
+
+
+class ContractScanCheckpoint(models.Model):
+    """Progress of a long contract-state scan that may span several runs.
+    `next_key` is the pagination key of the first page not yet read (empty
+    once a pass has finished) and `partial` holds the aggregates collected
+    so far, so a scan cut short by an LCD error or by its page budget picks
+    up where it stopped instead of starting again from page 1."""
+    name = models.CharField(max_length=64, unique=True, db_index=True)
+    next_key = models.TextField(blank=True, default='')
+    pages = models.IntegerField(default=0)
+    partial = models.JSONField(default=dict, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def in_progress(self) -> bool:
+        return bool(self.next_key)
+
+    def __str__(self):
+        state = f"page {self.pages}" if self.in_progress() else "idle"
+        return f"{self.name} ({state})"
+
+
+class PedroNftSnapshot(models.Model):
+    """One complete pass of the Pedro NFT holder scan. The newest row is the
+    current snapshot. Its PedroNftHolding rows are inserted in the same
+    transaction as the row itself, so every worker switches to the new
+    holdings at the moment it commits and never sees a half-written one."""
+    holders = models.IntegerField(default=0)
+    tokens = models.IntegerField(default=0)
+    pages = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"NFT snapshot #{self.pk}: {self.holders} holders @ {self.created_at:%Y-%m-%d %H:%M}"
+
+
+class PedroNftHolding(models.Model):
+    """Pedro NFT count per holder within one snapshot. (snapshot, address) is
+    unique, which doubles as the index for single-address lookups."""
+    snapshot = models.ForeignKey(
+        PedroNftSnapshot, on_delete=models.CASCADE, related_name='holdings',
+    )
+    address = models.CharField(max_length=64)
+    count = models.IntegerField()
+
+    class Meta:
+        unique_together = [('snapshot', 'address')]
+
+    def __str__(self):
+        return f"{self.address}: {self.count} (snapshot #{self.snapshot_id})"
+
+
+class Lease(models.Model):
+    """Cluster-wide mutual exclusion for background jobs (see leases.py).
+    A lease is held by `owner` until `expires_at`; every successful acquire
+    bumps `token`, the fencing token, so a holder whose lease lapsed and was
+    taken over can tell its writes would be stale."""
+    name = models.CharField(max_length=64, unique=True, db_index=True)
+    owner = models.CharField(max_length=128, blank=True)
+    token = models.BigIntegerField(default=0)
+    acquired_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.name} held by {self.owner or '-'} until {self.expires_at:%Y-%m-%d %H:%M:%S}"
+
+
+class RolloverEpoch(models.Model):
+    """The last period (e.g. '2026-05', '2026-W18') a periodic rollover job
+    completed for — see rollover_epochs.py. Written in the same transaction
+    as the rollover itself."""
+    job = models.CharField(max_length=64, unique=True)
+    period = models.CharField(max_length=16)
+    completed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.job} @ {self.period}"
+
+
+class PendingSubmission(models.Model):
+    """A burn-gated submission accepted before its tx was verified (see
+    submissions.py). The process_submissions worker verifies the tx with
+    backoff, applies the effect and stores the response the synchronous
+    endpoint would have returned in `result` / `http_status`."""
+    KIND_GAME_SCORE = 'game_score'
+    KIND_RAFFLE_BUY = 'raffle_buy'
+    KIND_RAFFLE_FREE = 'raffle_free'
+    KIND_GOVERNANCE_VOTE = 'governance_vote'
+    KIND_SPECIAL_VOTE = 'special_vote'
+    KIND_SPECIAL_CREATE = 'special_create'
+    KIND_DASHBOARD_LOG = 'dashboard_log'
+    KIND_CHOICES = [
+        (KIND_GAME_SCORE, 'Game score'),
+        (KIND_RAFFLE_BUY, 'Raffle purchase'),
+        (KIND_RAFFLE_FREE, 'Raffle free claim'),
+        (KIND_GOVERNANCE_VOTE, 'Governance vote'),
+        (KIND_SPECIAL_VOTE, 'Special proposal vote'),
+        (KIND_SPECIAL_CREATE, 'Special proposal creation'),
+        (KIND_DASHBOARD_LOG, 'Dashboard tx log'),
+    ]
+
+    STATUS_PENDING = 'pending'
+    STATUS_APPLIED = 'applied'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_APPLIED, 'Applied'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    kind = models.CharField(max_length=32, choices=KIND_CHOICES)
+    address = models.CharField(max_length=64, db_index=True)
+    tx_hash = models.CharField(max_length=128)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField()
+    # Set while a worker is processing the row so two workers never run it
+    # at once; a crashed worker's claim simply expires.
+    claimed_by = models.CharField(max_length=128, blank=True)
+    claimed_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    http_status = models.IntegerField(null=True, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = [('kind', 'tx_hash')]
+        indexes = [models.Index(fields=['status', 'next_attempt_at'], name='myapp_pendsub_due_idx')]
+
+    def __str__(self):
+        return f"{self.kind} {self.address} {self.tx_hash[:12]} ({self.status})"
+
+
+class BurnEvent(models.Model):
+    """One coin transferred to the burn address, from the burn indexer
+    (injective_burn_index.py). A tx that burns several coins, or burns in
+    several messages, gets one row each; `seq` numbers them within the tx.
+    `amount_wei` is a decimal digit string, like Cw20Balance.amount: SQLite
+    would keep a DecimalField as a REAL and round it. Compare it as an int."""
+    tx_hash = models.CharField(max_length=128, db_index=True)
+    seq = models.IntegerField(default=0)
+    from_address = models.CharField(max_length=64, db_index=True)
+    denom = models.CharField(max_length=255, db_index=True)
+    amount_wei = models.CharField(max_length=80)
+    memo = models.CharField(max_length=256, blank=True)
+    height = models.BigIntegerField(db_index=True)
+    block_time = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = [('tx_hash', 'seq')]
+
+    def __str__(self):
+        return f"{self.from_address} burned {self.amount_wei} {self.denom} ({self.tx_hash[:12]})"
+
+
+class BurnIndexCursor(models.Model):
+    """Where the burn indexer resumes: every tx into `address` below
+    `next_height` is in BurnEvent. `caught_up_at` is set once a run reaches
+    the chain tip. Verification only trusts the index for txs it holds and
+    asks the LCD about the rest, so a lagging index is never wrong, only
+    slower."""
+    address = models.CharField(max_length=64, unique=True, db_index=True)
+    next_height = models.BigIntegerField(default=0)
+    events = models.IntegerField(default=0)
+    caught_up_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"burn index {self.address} @ {self.next_height}"
+
+
 class TokenHolder(models.Model):
     address = models.CharField(max_length=255, unique=True)
     native_value = models.FloatField(default=0)
@@ -0,0 +1,124 @@
+"""
+Registry of the last period each lazy rollover job has completed for.
+
+The month rollover and the governance finalization run lazily from the
+request path, and each used to ask the database "is there anything left
+over from a past period?" on every request — a DISTINCT or EXISTS query
+answered "no" millions of times for each time it said "yes". (The raffle
+draw has since moved to the scheduled finalize_raffle command.)
+
+Instead each job records the period it last completed for (`RolloverEpoch`,
+one row per job). The answer is kept at three levels:
+
+    this worker's dict  ->  shared cache  ->  RolloverEpoch row
+
+so once a period is done the common case is a dict lookup and a string
+comparison, with no SQL and no cache round trip:
+
+    run_once_per_period('game_month_rollover', month, roll_over)
+
+When the period is not yet recorded, the job takes the cluster-wide lease
+of the same name, re-reads the row, and runs the rollover and the epoch
+write in one transaction. So each job runs once per period, and a failed or
+superseded run commits neither. Periods are compared as strings, which
+orders 'YYYY-MM' and 'YYYY-Www' correctly.
+
+A straggler — a row written for the old period by a request that started
+just before the boundary and landed after the rollover — is picked up by
+the next period's run, since each rollover handles every past period it
+finds.
+"""
+
+import logging
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .leases import hold_lease, lease_is_current
+from .models import RolloverEpoch
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROLLOVER_LEASE_SECONDS = 300
+
+_LOCAL: dict[str, str] = {}
+
+
+class RolloverLeaseLost(Exception):
+    """The lease lapsed while the rollover ran; its writes are rolled back."""
+
+
+def _shared_key(job: str) -> str:
+    return f'rollover_epoch:{job}'
+
+
+def _remember(job: str, period: str) -> None:
+    _LOCAL[job] = period
+    cache.set(_shared_key(job), period, None)
+
+
+def epoch_is_current(job: str, period: str, local: bool = True) -> bool:
+    """True when `job` is known to have completed for `period` (or later).
+    Never touches the database; a False only means "go and check". Jobs
+    whose epoch can be withdrawn (`clear_epoch`) pass `local=False`: another
+    worker's clear can't reach this worker's dict, only the shared cache."""
+    memo = _LOCAL.get(job) if local else None
+    if memo is not None and memo >= period:
+        return True
+    shared = cache.get(_shared_key(job))
+    if shared is not None and shared >= period:
+        _LOCAL[job] = shared
+        return True
+    return False
+
+
+def _recorded(job: str, period: str) -> bool:
+    done = RolloverEpoch.objects.filter(job=job).values_list('period', flat=True).first()
+    if done is not None and done >= period:
+        _remember(job, done)
+        return True
+    return False
+
+
+def mark_epoch(job: str, period: str) -> None:
+    """Record that `job` is done for `period`, for jobs that complete outside
+    `run_once_per_period`."""
+    RolloverEpoch.objects.update_or_create(
+        job=job, defaults={'period': period, 'completed_at': datetime.now(timezone.utc)},
+    )
+    _remember(job, period)
+
+
+def clear_epoch(job: str, period: str) -> None:
+    """Withdraw `job`'s completion for `period` (and later), before the job
+    is redone. See `epoch_is_current(local=False)`."""
+    RolloverEpoch.objects.filter(job=job, period__gte=period).delete()
+    cache.delete(_shared_key(job))
+    _LOCAL.pop(job, None)
+
+
+def run_once_per_period(job: str, period: str, rollover: Callable[[], None],
+                        lease_seconds: float = DEFAULT_ROLLOVER_LEASE_SECONDS) -> bool:
+    """Run `rollover()` once for `period` across the cluster. Returns True
+    when `job` is done for `period` (now or earlier), False when another
+    worker holds the lease and is presumably running it."""
+    if epoch_is_current(job, period) or _recorded(job, period):
+        return True
+    with hold_lease(job, lease_seconds) as lease:
+        if lease is None:
+            return False
+        # Re-check: the previous holder may have just finished it.
+        if _recorded(job, period):
+            return True
+        with transaction.atomic():
+            rollover()
+            if not lease_is_current(lease):
+                raise RolloverLeaseLost(f"{job} lease lost during the {period} rollover")
+            RolloverEpoch.objects.update_or_create(
+                job=job, defaults={'period': period, 'completed_at': datetime.now(timezone.utc)},
+            )
+    _remember(job, period)
+    logger.info("Rollover %s completed for %s", job, period)
+    return True
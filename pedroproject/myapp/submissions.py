@@ -0,0 +1,278 @@
+"""
+Accept-then-verify for the burn-gated endpoints.
+
+Right after broadcast a tx is often not indexed by the LCD yet, so verifying
+it inside the request fails with "Tx not found" and the user retries. In
+accept-then-verify mode an endpoint only validates the request shape, stores
+a `PendingSubmission` and answers 202 with its id:
+
+    {"ok": true, "pending": true, "id": 42, "status": "pending",
+     "status_url": "/submissions/42/"}
+
+The `process_submissions` worker then, for each due row:
+
+  1. skips straight to "applied" if the effect already exists (a worker
+     that crashed after applying, or the same tx submitted synchronously);
+  2. fetches the tx (`fetch_tx`); while the LCD can't return it the row is
+     rescheduled with exponential backoff, for up to SUBMISSION_VERIFY_WINDOW;
+  3. runs the endpoint's processor — the same code the synchronous path
+     runs — and stores its (status, body) as the outcome. An answer the
+     processor marks as "not yet" (`retry_when`, e.g. the governance voter
+     snapshot still building) is rescheduled with the same backoff instead,
+     for up to SUBMISSION_NOT_READY_WINDOW.
+
+The payload is stamped with the month and week it was accepted in, and
+processors count it for that period rather than the one it is processed in.
+
+Every effect is keyed by its tx hash under a unique constraint, so a
+processor that runs twice applies once. The status endpoint reports the
+stored outcome. Processors are registered by views.py with
+`register_processor(kind, process, applied, retry_when=None)`.
+
+The mode is on for every request when settings.SUBMISSIONS_ACCEPT_THEN_VERIFY
+is set; otherwise a client opts in per request with `Prefer: respond-async`.
+"""
+
+import logging
+import os
+import random
+import socket
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.urls import reverse
+
+from .injective_txs import TxFetchError, fetch_tx
+from .models import PendingSubmission
+
+logger = logging.getLogger(__name__)
+
+# Backoff between attempts: 5s, 10s, 20s, 40s, then every 60s.
+SUBMISSION_RETRY_BASE = 5  # seconds
+SUBMISSION_RETRY_MAX = 60  # seconds
+# How long after acceptance a tx may still be missing from the LCD before the
+# submission is failed with the verifier's own "not found" message.
+SUBMISSION_VERIFY_WINDOW = 10 * 60  # seconds
+# How long a verified submission keeps being retried while its processor
+# answers "not yet". Covers a voter snapshot build that fails and is retried.
+SUBMISSION_NOT_READY_WINDOW = 60 * 60  # seconds
+# How long a worker owns a claimed row. Processing is a few LCD / DB calls.
+SUBMISSION_CLAIM_SECONDS = 120
+
+
+@dataclass(frozen=True)
+class SubmissionProcessor:
+    # payload -> (http status, response body), exactly what the synchronous
+    # endpoint returns. Statuses >= 400 mark the submission failed.
+    process: Callable[[dict], tuple[int, dict]]
+    # payload -> True when the effect for this tx already exists.
+    applied: Callable[[dict], bool]
+    # (status, body) -> True when the answer means "not yet" and the
+    # submission should be tried again later rather than failed.
+    retry_when: Callable[[int, dict], bool] | None = None
+
+
+_PROCESSORS: dict[str, SubmissionProcessor] = {}
+
+
+def register_processor(kind: str, process, applied, retry_when=None) -> None:
+    _PROCESSORS[kind] = SubmissionProcessor(process=process, applied=applied, retry_when=retry_when)
+
+
+def wants_async(request) -> bool:
+    if getattr(settings, 'SUBMISSIONS_ACCEPT_THEN_VERIFY', False):
+        return True
+    prefer = request.META.get('HTTP_PREFER', '')
+    return any(token.strip() == 'respond-async' for token in prefer.split(','))
+
+
+def accept_submission(kind: str, address: str, tx_hash: str, payload: dict) -> tuple[int, dict]:
+    """Record a submission for the worker. Resubmitting the same tx returns
+    the existing submission instead of queueing it twice; if that one
+    failed, it is queued again as a fresh attempt with the new payload."""
+    now = datetime.now(timezone.utc)
+    payload = _stamp_periods(payload, now)
+    try:
+        submission, created = PendingSubmission.objects.get_or_create(
+            kind=kind,
+            tx_hash=tx_hash,
+            defaults={'address': address, 'payload': payload, 'next_attempt_at': now},
+        )
+    except IntegrityError:
+        submission, created = PendingSubmission.objects.get(kind=kind, tx_hash=tx_hash), False
+    if submission.address != address:
+        return 409, {'error': 'Tx hash already used'}
+    if not created and submission.status == PendingSubmission.STATUS_FAILED:
+        _requeue_failed(submission, payload, now)
+        submission.refresh_from_db()
+    return 202, {'ok': True, 'pending': True, **submission_status(submission)}
+
+
+def _stamp_periods(payload: dict, now: datetime) -> dict:
+    """`payload` plus the game month and raffle week it was accepted in, in
+    the format of views._current_month / _current_week. Processors read the
+    period from here, so a submission accepted just before a boundary and
+    processed after it still counts for the period it was made in."""
+    iso_year, iso_week, _ = now.isocalendar()
+    return {**payload, 'month': now.strftime('%Y-%m'), 'week': f'{iso_year}-W{iso_week:02d}'}
+
+
+def _requeue_failed(submission: PendingSubmission, payload: dict, now: datetime) -> None:
+    """Reset a failed submission to pending. created_at restarts too, so the
+    retry gets a full verification window. Conditional on the row still
+    being failed, so concurrent resubmissions requeue it once."""
+    (
+        PendingSubmission.objects
+        .filter(id=submission.id, status=PendingSubmission.STATUS_FAILED)
+        .update(
+            status=PendingSubmission.STATUS_PENDING,
+            payload=payload,
+            attempts=0,
+            next_attempt_at=now,
+            claimed_by='',
+            claimed_until=None,
+            last_error='',
+            http_status=None,
+            result=None,
+            created_at=now,
+            completed_at=None,
+        )
+    )
+
+
+def submission_status(submission: PendingSubmission) -> dict:
+    data = {
+        'id': submission.id,
+        'kind': submission.kind,
+        'status': submission.status,
+        'attempts': submission.attempts,
+        'created_at': submission.created_at.isoformat(),
+        'status_url': reverse('submission_status', args=[submission.id]),
+    }
+    if submission.status == PendingSubmission.STATUS_PENDING:
+        data['last_error'] = submission.last_error or None
+    else:
+        data['completed_at'] = submission.completed_at.isoformat() if submission.completed_at else None
+        data['http_status'] = submission.http_status
+        data['result'] = submission.result
+    return data
+
+
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+
+def _retry_delay(attempts: int) -> float:
+    delay = min(SUBMISSION_RETRY_BASE * 2 ** max(attempts - 1, 0), SUBMISSION_RETRY_MAX)
+    return delay * random.uniform(0.8, 1.2)
+
+
+def _new_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def claim_due_submissions(limit: int, owner: str | None = None) -> list[PendingSubmission]:
+    """Claim up to `limit` due submissions for this worker. Each row is
+    claimed with its own conditional UPDATE, so concurrent workers split the
+    queue instead of processing a row twice."""
+    owner = owner or _new_owner()
+    now = datetime.now(timezone.utc)
+    candidates = list(
+        PendingSubmission.objects
+        .filter(status=PendingSubmission.STATUS_PENDING, next_attempt_at__lte=now)
+        .exclude(claimed_until__gt=now)
+        .order_by('next_attempt_at')
+        .values_list('id', flat=True)[:limit]
+    )
+    claimed = []
+    for pk in candidates:
+        taken = (
+            PendingSubmission.objects
+            .filter(id=pk, status=PendingSubmission.STATUS_PENDING)
+            .exclude(claimed_until__gt=now)
+            .update(
+                claimed_by=owner,
+                claimed_until=now + timedelta(seconds=SUBMISSION_CLAIM_SECONDS),
+            )
+        )
+        if taken:
+            claimed.append(PendingSubmission.objects.get(id=pk))
+    return claimed
+
+
+def _finish(submission: PendingSubmission, status: int, body: dict) -> str:
+    outcome = PendingSubmission.STATUS_APPLIED if status < 400 else PendingSubmission.STATUS_FAILED
+    (
+        PendingSubmission.objects
+        .filter(id=submission.id, claimed_by=submission.claimed_by)
+        .update(
+            status=outcome,
+            attempts=submission.attempts + 1,
+            http_status=status,
+            result=body,
+            completed_at=datetime.now(timezone.utc),
+            claimed_until=None,
+        )
+    )
+    return outcome
+
+
+def _reschedule(submission: PendingSubmission, error: str) -> str:
+    attempts = submission.attempts + 1
+    (
+        PendingSubmission.objects
+        .filter(id=submission.id, claimed_by=submission.claimed_by)
+        .update(
+            attempts=attempts,
+            last_error=error[:500],
+            next_attempt_at=datetime.now(timezone.utc) + timedelta(seconds=_retry_delay(attempts)),
+            claimed_until=None,
+        )
+    )
+    return 'retry'
+
+
+def process_submission(submission: PendingSubmission) -> str:
+    """One attempt at `submission`. Returns 'applied', 'failed' or 'retry'."""
+    processor = _PROCESSORS.get(submission.kind)
+    if processor is None:
+        return _finish(submission, 500, {'error': f'Unknown submission kind {submission.kind}'})
+
+    if processor.applied(submission.payload):
+        return _finish(submission, 200, {'ok': True, 'already_applied': True})
+
+    age = (datetime.now(timezone.utc) - submission.created_at).total_seconds()
+    try:
+        fetch_tx(submission.tx_hash)
+    except TxFetchError as e:
+        if age < SUBMISSION_VERIFY_WINDOW:
+            return _reschedule(submission, str(e))
+        # Out of time: let the processor fail it with its usual message.
+
+    try:
+        status, body = processor.process(submission.payload)
+    except Exception as e:
+        logger.exception("Submission %s (%s) raised", submission.id, submission.kind)
+        if age < SUBMISSION_VERIFY_WINDOW:
+            return _reschedule(submission, f"{type(e).__name__}: {e}")
+        return _finish(submission, 500, {'error': 'Internal error while applying submission'})
+    if (
+        processor.retry_when is not None
+        and processor.retry_when(status, body)
+        and age < SUBMISSION_NOT_READY_WINDOW
+    ):
+        return _reschedule(submission, body.get('error') or f'HTTP {status}')
+    return _finish(submission, status, body)
+
+
+def process_due_submissions(limit: int = 50) -> Counter:
+    """Claim and process one batch. Returns a Counter of outcomes."""
+    outcomes = Counter()
+    for submission in claim_due_submissions(limit):
+        outcomes[process_submission(submission)] += 1
+    return outcomes
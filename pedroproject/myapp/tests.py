@@ -1,3 +1,938 @@
-from django.test import TestCase
+import importlib
+import io
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import async_to_sync
+from django.apps import apps
+from django.core.cache import cache, caches
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from myapp import lcd_pool, rollover_epochs, submissions, views
+from myapp.chain_standin import (
+    BURN_ADDRESS,
+    CW721_TOKENS_NAMESPACE,
+    PEDRO_NFT_CONTRACT,
+    ChainDataset,
+    StandinBehaviour,
+    StandinGateway,
+    StandinMissingData,
+    lcd_key,
+    lcd_response,
+    serve_http,
+)
+from myapp.injective_burn_index import burn_events_from_tx, index_burns, indexed_burn_match
+from myapp.injective_chain import CW20_BALANCE_NAMESPACE, ChainClient
+from myapp.injective_cw20_balances import (
+    PEDRO_CW20,
+    cw20_balance_of,
+    cw20_holders,
+    cw20_total_supply,
+    refresh_cw20_balances,
+)
+from myapp.injective_game import PEDRO_DENOM, GameVerifier
+from myapp.management.commands.chain_standin import _RecordingScamChecker
+from myapp.leases import acquire_lease, hold_lease, lease_is_current, release_lease, renew_lease
+from myapp.rollover_epochs import epoch_is_current
+from myapp.tiered_cache import TieredCache, tiered_cache_stats
+from myapp.models import (
+    BurnEvent,
+    Cw20Balance,
+    GameStealLog,
+    GameLeaderboardEntry,
+    GameMonthPayout,
+    GameUpgradeState,
+    GovernanceMonthResult,
+    GovernanceSnapshotJob,
+    GovernanceVoterSnapshot,
+    Lease,
+    PendingSubmission,
+    PedroNftHolding,
+    PedroNftSnapshot,
+    RaffleEntrant,
+    RaffleResult,
+    RaffleTicket,
+    RaffleWeekStats,
+)
+
+WALLET = 'inj1standinwallet'
+SYNTHETIC = {
+    'seed': 7,
+    'cw721': {PEDRO_NFT_CONTRACT: {'tokens': 2_500}},
+    'burn_txs': 40,
+    'account_txs': {WALLET: 5},
+}
+
+
+class ChainStandinMixin:
+    """Runs the chain stand-in's HTTP server for the test class and points
+    the worker's LCD pool at it."""
+
+    behaviour = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.dataset = ChainDataset(synthetic=dict(SYNTHETIC))
+        cls.server = serve_http(cls.dataset, port=0, behaviour=cls.behaviour or StandinBehaviour())
+        host, port = cls.server.server_address[:2]
+        cls.url = f'http://{host}:{port}'
+        cls.pool = lcd_pool.LcdPool([cls.url], hedge=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.multiple(lcd_pool, _POOL=self.pool, _POOL_PID=os.getpid())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def burn_tx(self, n=0):
+        tx_hash, (tx, _) = list(self.dataset.txs().items())[n]
+        return tx_hash, tx['body']['messages'][0]
+
+
+class LcdPoolTests(SimpleTestCase):
+    """LcdPool against stand-in LCD servers with injected latency and 503s."""
+
+    TX_PATH = '/cosmos/tx/v1beta1/txs/' + 'AB' * 32  # unknown tx: a 404
+
+    def setUp(self):
+        patcher = mock.patch.object(lcd_pool, 'EXPLORE_RATE', 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def server(self, **behaviour):
+        """(url, behaviour, dataset) of a new stand-in; `behaviour` can be
+        changed while it runs."""
+        dataset = ChainDataset(synthetic={'seed': 1})
+        behaviour = StandinBehaviour(**behaviour)
+        server = serve_http(dataset, port=0, behaviour=behaviour)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        host, port = server.server_address[:2]
+        return f'http://{host}:{port}', behaviour, dataset
+
+    def pool(self, urls, **options):
+        pool = lcd_pool.LcdPool(urls, **options)
+        self.addCleanup(pool._executor.shutdown, wait=False)
+        return pool
+
+    def stats(self, pool):
+        return {s['url']: s for s in pool.stats()}
+
+    def test_traffic_moves_to_the_faster_endpoint(self):
+        slow, _, _ = self.server(latency_ms=150)
+        fast, _, _ = self.server()
+        pool = self.pool([slow, fast], hedge=False)
+        for _ in range(10):
+            self.assertEqual(pool.get(self.TX_PATH).status_code, 404)
+        stats = self.stats(pool)
+        self.assertEqual(stats[slow]['requests'], 1)
+        self.assertEqual(stats[fast]['requests'], 9)
+        self.assertEqual(pool._ranked()[0].url, fast)
+
+    def test_a_get_slower_than_its_p95_is_hedged(self):
+        slow, _, _ = self.server(latency_ms=400)
+        fast, _, _ = self.server()
+        pool = self.pool([slow, fast])
+        # History says `slow` answers in ~10ms: rank it first, p95 10ms.
+        history = pool._stats[slow]
+        history.ewma_ms = 10.0
+        history.latencies.extend([0.01] * lcd_pool.MIN_SAMPLES_FOR_P95)
+        self.assertEqual(pool._hedge_delay(history), lcd_pool.MIN_HEDGE_DELAY)
+
+        started = time.monotonic()
+        resp = pool.get(self.TX_PATH)
+        self.assertLess(time.monotonic() - started, 0.3)
+        self.assertTrue(resp.url.startswith(fast))
+
+    def test_4xx_is_an_answer_but_5xx_and_429_are_failures(self):
+        url, _, dataset = self.server()
+        dataset.lcd[lcd_key('/throttled', {})] = {'status': 429, 'body': {}}
+        pool = self.pool([url], hedge=False, breaker_failures=3)
+        for _ in range(5):
+            self.assertEqual(pool.get(self.TX_PATH).status_code, 404)
+        self.assertEqual((self.stats(pool)[url]['failures'], self.stats(pool)[url]['circuit']), (0, 'closed'))
+
+        for _ in range(3):
+            self.assertEqual(pool.get('/throttled').status_code, 429)
+        self.assertEqual(self.stats(pool)[url]['failures'], 3)
+        self.assertEqual(self.stats(pool)[url]['circuit'], 'open')
+
+    def test_breaker_opens_probes_once_half_open_and_closes(self):
+        url, behaviour, _ = self.server(failure_rate=1.0)
+        pool = self.pool([url], hedge=False, breaker_failures=2, breaker_cooldown=0.2)
+
+        for _ in range(2):
+            self.assertEqual(pool.get(self.TX_PATH).status_code, 503)
+        self.assertEqual(self.stats(pool)[url]['circuit'], 'open')
+
+        # A probe that fails opens the breaker again.
+        time.sleep(0.25)
+        self.assertEqual(self.stats(pool)[url]['circuit'], 'half-open')
+        self.assertEqual(pool.get(self.TX_PATH).status_code, 503)
+        self.assertEqual(self.stats(pool)[url]['circuit'], 'open')
+
+        # A probe that succeeds closes it.
+        behaviour.failure_rate = 0.0
+        time.sleep(0.25)
+        self.assertEqual(pool.get(self.TX_PATH).status_code, 404)
+        self.assertEqual(self.stats(pool)[url]['circuit'], 'closed')
+
+    def test_concurrent_callers_send_one_half_open_probe(self):
+        url, behaviour, _ = self.server(failure_rate=1.0)
+        pool = self.pool([url], hedge=False, breaker_failures=1, breaker_cooldown=0.1)
+        self.assertEqual(pool.get(self.TX_PATH).status_code, 503)
+        behaviour.failure_rate, behaviour.latency_ms = 0.0, 300
+        time.sleep(0.15)
+        requests_before = self.stats(pool)[url]['requests']
+
+        outcomes = []
+        start = threading.Barrier(6)
+
+        def call():
+            start.wait()
+            try:
+                outcomes.append(pool.get(self.TX_PATH).status_code)
+            except lcd_pool.LcdUnavailable:
+                outcomes.append('refused')
+
+        threads = [threading.Thread(target=call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(outcomes, key=str), [404] + ['refused'] * 5)
+        self.assertEqual(self.stats(pool)[url]['requests'] - requests_before, 1)
+        self.assertEqual(self.stats(pool)[url]['circuit'], 'closed')
+
+
+class BurnVerificationTests(ChainStandinMixin, TestCase):
+
+    def test_matching_burn_is_verified_from_the_lcd(self):
+        tx_hash, msg = self.burn_tx()
+        ok, reason = GameVerifier.verify_pedro_burn(
+            tx_hash, msg['from_address'], expected_amount_wei=msg['amount'][0]['amount'],
+        )
+        self.assertTrue(ok, reason)
+
+    def test_wrong_amount_or_sender_is_rejected(self):
+        tx_hash, msg = self.burn_tx(1)
+        amount = int(msg['amount'][0]['amount'])
+        ok, _ = GameVerifier.verify_pedro_burn(
+            tx_hash, msg['from_address'], expected_amount_wei=str(amount + 1),
+        )
+        self.assertFalse(ok)
+        ok, _ = GameVerifier.verify_pedro_burn(
+            tx_hash, BURN_ADDRESS, expected_amount_wei=str(amount),
+        )
+        self.assertFalse(ok)
+
+    def test_unknown_tx_is_rejected(self):
+        ok, reason = GameVerifier.verify_pedro_burn('AB' * 32, 'inj1nobody')
+        self.assertFalse(ok)
+        self.assertIn('not found', reason.lower())
+
+    def test_indexer_records_every_burn(self):
+        stats = index_burns()
+        self.assertTrue(stats['caught_up'])
+        self.assertEqual(BurnEvent.objects.count(), len(self.dataset.txs()))
+        tx_hash, msg = self.burn_tx(2)
+        amount = msg['amount'][0]['amount']
+        self.assertIs(indexed_burn_match(tx_hash, msg['from_address'], PEDRO_DENOM, amount), True)
+        self.assertIs(indexed_burn_match(tx_hash, msg['from_address'], PEDRO_DENOM, amount + '0'), False)
+        self.assertIsNone(indexed_burn_match('CD' * 32, msg['from_address'], PEDRO_DENOM, amount))
+
+
+class StandinGatewayTests(SimpleTestCase):
+
+    def test_unknown_calls_name_what_is_missing(self):
+        client = ChainClient(StandinGateway(ChainDataset(synthetic={'cw20': {PEDRO_CW20: 5}})))
+        with self.assertRaisesRegex(StandinMissingData, 'fetch_smart_contract_state.*token_info'):
+            async_to_sync(client.fetch_smart_contract_state)(
+                address=PEDRO_CW20, query_data=json.dumps({'token_info': {}}),
+            )
+        with self.assertRaisesRegex(StandinMissingData, 'fetch_chain_id'):
+            async_to_sync(client.fetch_chain_id)()
+
+
+class Cw20BalanceTests(TestCase):
+    # 26 digits: no float (and so no SQLite REAL) holds it exactly.
+    WHALE = 'inj1whale'
+    AMOUNT = 12_345_678_901_234_567_890_123_457
+
+    def setUp(self):
+        self.dataset = ChainDataset(synthetic={'seed': 3, 'cw20': {PEDRO_CW20: 50}})
+        self.set_whale(self.AMOUNT)
+        self.client = ChainClient(StandinGateway(self.dataset))
+
+    def set_whale(self, amount):
+        state = self.dataset.contract_state(PEDRO_CW20)
+        key = CW20_BALANCE_NAMESPACE + self.WHALE.encode()
+        state[:] = [(k, v) for k, v in state if k != key] + [(key, f'"{amount}"'.encode())]
+        state.sort()
+
+    def refresh(self):
+        return async_to_sync(refresh_cw20_balances)(PEDRO_CW20, client=self.client)
+
+    def test_large_balances_round_trip_exactly(self):
+        self.refresh()
+        self.assertEqual(async_to_sync(cw20_balance_of)(PEDRO_CW20, self.WHALE), self.AMOUNT)
+        holders = async_to_sync(cw20_holders)(PEDRO_CW20)
+        self.assertEqual(holders[0], (self.WHALE, self.AMOUNT))
+        supply = sum(
+            self.dataset.cw20_balance(PEDRO_CW20, key[len(CW20_BALANCE_NAMESPACE):].decode())
+            for key, _ in self.dataset.contract_state(PEDRO_CW20)
+            if key.startswith(CW20_BALANCE_NAMESPACE)
+        )
+        self.assertEqual(async_to_sync(cw20_total_supply)(PEDRO_CW20), supply)
+
+    def test_a_one_wei_change_is_written(self):
+        self.refresh()
+        self.set_whale(self.AMOUNT + 1)
+        stats = self.refresh()
+        self.assertEqual((stats['created'], stats['updated'], stats['deleted']), (0, 1, 0))
+        self.assertEqual(
+            Cw20Balance.objects.get(contract=PEDRO_CW20, address=self.WHALE).amount,
+            str(self.AMOUNT + 1),
+        )
+        self.assertEqual(self.refresh()['updated'], 0)
+
+
+class BurnIndexPrecisionTests(TestCase):
+
+    def test_amounts_beyond_float_precision_match_exactly(self):
+        amount = '12345678901234567891'
+        sender = 'inj1burner'
+        tx_hash = 'EF' * 32
+        BurnEvent.objects.bulk_create(burn_events_from_tx({
+            'txhash': tx_hash, 'height': '1', 'code': 0,
+            'events': [{'type': 'transfer', 'attributes': [
+                {'key': 'recipient', 'value': BURN_ADDRESS},
+                {'key': 'sender', 'value': sender},
+                {'key': 'amount', 'value': f'{amount}{PEDRO_DENOM}'},
+            ]}],
+        }, None))
+        self.assertEqual(BurnEvent.objects.get().amount_wei, amount)
+        self.assertIs(indexed_burn_match(tx_hash, sender, PEDRO_DENOM, amount), True)
+        for near in (int(amount) - 1, 12345678901234600000):
+            self.assertIs(indexed_burn_match(tx_hash, sender, PEDRO_DENOM, str(near)), False)
+
+
+class NftHolderScanTests(ChainStandinMixin, TestCase):
+
+    def expected_counts(self):
+        counts = {}
+        for key, value in self.dataset.contract_state(PEDRO_NFT_CONTRACT):
+            if key.startswith(CW721_TOKENS_NAMESPACE):
+                owner = json.loads(value)['owner']
+                counts[owner] = counts.get(owner, 0) + 1
+        return counts
+
+    def test_full_scan_publishes_a_snapshot(self):
+        counts = views._refresh_nft_holders(max_pages=100)
+        self.assertEqual(counts, self.expected_counts())
+        snapshot = PedroNftSnapshot.objects.get()
+        self.assertEqual(snapshot.tokens, 2_500)
+        self.assertEqual(PedroNftHolding.objects.filter(snapshot=snapshot).count(), len(counts))
+        address, count = max(counts.items(), key=lambda item: item[1])
+        self.assertEqual(views._fetch_pedro_nft_count(address), count)
+
+    def test_scan_resumes_from_its_checkpoint(self):
+        views._refresh_nft_holders(max_pages=1)
+        self.assertFalse(PedroNftSnapshot.objects.exists())
+        views._refresh_nft_holders(max_pages=100)
+        self.assertEqual(PedroNftSnapshot.objects.get().tokens, 2_500)
+
+
+class FailingNftHolderScanTests(ChainStandinMixin, TestCase):
+    behaviour = StandinBehaviour(failure_rate=1.0)
+
+    def test_command_fails_when_the_first_page_errors(self):
+        with self.assertRaises(CommandError):
+            call_command('refresh_nft_holders', '--restart', stdout=io.StringIO())
+        self.assertFalse(PedroNftSnapshot.objects.exists())
+
+
+class RecordExplorerTests(ChainStandinMixin, TestCase):
+
+    def test_records_the_requests_the_scam_checker_makes(self):
+        recorded = ChainDataset()
+        with override_settings(INJECTIVE_EXPLORER_API=self.url):
+            _RecordingScamChecker(WALLET, recorded).fetch_sequential_ranges()
+        self.assertTrue(recorded.lcd)
+        # Replays as the stand-in server parses the query string.
+        path = f'/api/explorer/v1/accountTxs/{WALLET}'
+        params = {'from_number': '0', 'to_number': '99'}
+        self.assertEqual(lcd_response(recorded, path, params), lcd_response(self.dataset, path, params))
+
+
+class StealTests(TestCase):
+
+    def setUp(self):
+        month = views._current_month()
+        self.attacker = GameUpgradeState.objects.create(
+            address='inj1attacker', current_month=month, score_base=50,
+        )
+        self.target = GameUpgradeState.objects.create(
+            address='inj1target', current_month=month, score_base=1_000,
+        )
+
+    def test_steal_moves_points_and_starts_the_cooldown(self):
+        status, body = views._execute_steal('inj1attacker', 'inj1target')
+        self.assertEqual(status, 200, body)
+        self.attacker.refresh_from_db()
+        self.target.refresh_from_db()
+        self.assertEqual(self.attacker.score_base, 50 + views.STEAL_BASE_AMOUNT)
+        self.assertEqual(self.target.score_base, 1_000 - views.STEAL_BASE_AMOUNT)
+        self.assertEqual(GameStealLog.objects.count(), 1)
+
+        status, _ = views._execute_steal('inj1attacker', 'inj1target')
+        self.assertEqual(status, 429)
+
+    def test_steal_never_takes_more_than_the_target_has(self):
+        GameUpgradeState.objects.filter(address='inj1target').update(score_base=30)
+        status, _ = views._execute_steal('inj1attacker', 'inj1target')
+        self.assertEqual(status, 200)
+        self.target.refresh_from_db()
+        self.assertEqual(self.target.score_base, 0)
+
+    def test_unknown_target(self):
+        status, _ = views._execute_steal('inj1attacker', 'inj1ghost')
+        self.assertEqual(status, 404)
+
+
+class GameBoardCacheTests(TestCase):
+
+    def setUp(self):
+        for patcher in (
+            mock.patch.object(views, '_GAME_BOARD_CACHE', TieredCache('game_board_test', ttl=60)),
+            mock.patch.object(views, '_game_board_gen_local', (None, 0.0)),
+            mock.patch.object(views, '_fetch_pedro_nft_count', return_value=0),
+            mock.patch.object(views, 'verify_submission', return_value=mock.Mock(
+                ok=True, **{'server_timing.return_value': ''},
+            )),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def leaderboard(self, etag=None, **params):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return self.client.get('/game/leaderboard/', params, **headers)
+
+    def post(self, path, body):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(path, json.dumps(body), content_type='application/json')
+        self.assertEqual(response.status_code, 200, response.content)
+        return response
+
+    def submit(self, address, score, tx_hash):
+        return self.post('/game/score/', {
+            'address': address, 'name': address[-5:], 'score': score,
+            'tx_hash': tx_hash, 'captcha_token': 'ok',
+        })
+
+    def test_same_etag_gets_a_304(self):
+        first = self.leaderboard()
+        self.assertEqual(first.status_code, 200)
+        etag = first['ETag']
+        again = self.leaderboard(etag)
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again['ETag'], etag)
+        self.assertEqual(self.leaderboard('"other", ' + etag).status_code, 304)
+        self.assertEqual(self.leaderboard('"other"').status_code, 200)
+
+    def test_submit_and_steal_change_the_etag(self):
+        self.submit('inj1alice', 500, 'A1' * 32)
+        etag = self.leaderboard()['ETag']
+
+        self.submit('inj1bob', 300, 'B1' * 32)
+        after_submit = self.leaderboard(etag)
+        self.assertEqual(after_submit.status_code, 200)
+        self.assertIn('inj1bob', after_submit.content.decode())
+        etag = after_submit['ETag']
+
+        self.post('/game/steal/', {'attacker': 'inj1bob', 'target': 'inj1alice'})
+        after_steal = self.leaderboard(etag)
+        self.assertEqual(after_steal.status_code, 200)
+        self.assertNotEqual(after_steal['ETag'], etag)
+
+    def test_admin_payout_changes_the_hall_of_fame_etag(self):
+        GameMonthPayout.objects.create(month='2000-01', winning_address='inj1alice', winning_score=1)
+        etag = self.client.get('/game/hall_of_fame/')['ETag']
+        self.post('/game/admin/set_payout/', {
+            'admin_address': views.PEDRO_ADMIN_ADDRESS, 'month': '2000-01', 'payout_tx_hash': 'X',
+        })
+        response = self.client.get('/game/hall_of_fame/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_per_wallet_variant_is_not_cached(self):
+        self.submit('inj1alice', 500, 'A1' * 32)
+        etag = self.leaderboard()['ETag']
+        mine = self.leaderboard(etag, address='inj1alice')
+        self.assertEqual(mine.status_code, 200)
+        self.assertNotIn('ETag', mine)
+        self.assertEqual(mine.json()['me']['score'], 500)
+        with mock.patch.object(views._GAME_BOARD_CACHE, 'set') as cache_set:
+            self.leaderboard(address='inj1alice')
+        cache_set.assert_not_called()
+
+
+class GameSyncTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch.dict(views._SYNC_BUFFERS, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_buffered_deltas_reach_the_row_on_flush(self):
+        views._apply_game_sync('inj1player', 1, {'score': 40})
+        views._apply_game_sync('inj1player', 2, {'score': 2})
+        self.assertFalse(GameUpgradeState.objects.filter(address='inj1player').exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(views.flush_due_game_syncs(force=True), 1)
+        state = GameUpgradeState.objects.get(address='inj1player')
+        self.assertEqual((state.score_base, state.sync_seq), (42, 2))
+        self.assertEqual(views._SYNC_BUFFERS, {})
+
+    def test_retried_batch_is_applied_once(self):
+        views._apply_game_sync('inj1player', 1, {'score': 40})
+        body = views._apply_game_sync('inj1player', 1, {'score': 40})
+        self.assertFalse(body['applied'])
+        self.assertEqual(body['score'], 40)
+
+    def test_retry_after_the_flush_is_ignored(self):
+        views._apply_game_sync('inj1player', 1, {'score': 40})
+        with self.captureOnCommitCallbacks(execute=True):
+            views.flush_due_game_syncs(force=True)
+        body = views._apply_game_sync('inj1player', 1, {'score': 40})
+        self.assertFalse(body['applied'])
+        self.assertEqual(GameUpgradeState.objects.get(address='inj1player').score_base, 40)
+
+    def test_syncs_between_flushes_write_nothing(self):
+        views._apply_game_sync('inj1player', 1, {'score': 1})
+        with CaptureQueriesContext(connection) as queries:
+            for seq in range(2, 22):
+                views._apply_game_sync('inj1player', seq, {'score': 1})
+            views._apply_game_sync('inj1player', 21, {'score': 1})  # a retry
+        writes = [
+            q['sql'] for q in queries
+            if q['sql'].lstrip().upper().startswith(('INSERT', 'UPDATE', 'DELETE'))
+        ]
+        self.assertEqual(writes, [])
+        self.assertEqual(len(queries), 21)  # one cached-row read per sync
+        self.assertEqual(views._SYNC_BUFFERS['inj1player'].score, 21)
+
+    def test_flush_invalidates_the_cached_row_on_commit(self):
+        views._apply_game_sync('inj1player', 1, {'score': 40})
+        with self.captureOnCommitCallbacks() as callbacks:
+            body = views._apply_game_sync('inj1player', 2, {'click_level': 1})
+            self.assertTrue(body['flushed'])
+            self.assertEqual((body['score'], body['click_level']), (40, 1))
+        self.assertEqual(len(callbacks), 1)
+        self.assertIsNotNone(cache.get(views._sync_key('base', 'inj1player')))
+        callbacks[0]()
+        self.assertIsNone(cache.get(views._sync_key('base', 'inj1player')))
+
+
+class RaffleFinalizeTests(TestCase):
+
+    def enter(self, week, address, count):
+        views._credit_raffle_tickets(
+            week, address, RaffleTicket.SOURCE_PAID, f'{week}:{address}', count, lambda: None,
+        )
+
+    def test_finished_week_is_drawn_and_cleaned_up(self):
+        last_week = (datetime.now(timezone.utc) - timedelta(days=7)).isocalendar()
+        week = f"{last_week[0]}-W{last_week[1]:02d}"
+        self.enter(week, 'inj1alice', 3)
+        self.enter(week, 'inj1bob', 2)
+        current = views._current_week()
+        self.enter(current, 'inj1carol', 1)
+
+        metrics = views.finalize_raffle_weeks(batch_size=1)
+
+        result = RaffleResult.objects.get(week=week)
+        self.assertEqual(result.ticket_count, 5)
+        self.assertIn(result.winning_address, ('inj1alice', 'inj1bob'))
+        self.assertTrue(1 <= result.winning_ticket_number <= 5)
+        self.assertIsNotNone(result.cleaned_up_at)
+        self.assertEqual([d['week'] for d in metrics['drawn']], [week])
+        self.assertFalse(RaffleTicket.objects.filter(week=week).exists())
+        self.assertFalse(RaffleEntrant.objects.filter(week=week).exists())
+        self.assertEqual(RaffleWeekStats.objects.get(week=week).total_tickets, 5)
+
+        self.assertFalse(RaffleResult.objects.filter(week=current).exists())
+        self.assertTrue(RaffleTicket.objects.filter(week=current).exists())
+
+        self.assertEqual(views.finalize_raffle_weeks()['drawn'], [])
+
+    def test_running_week_is_never_drawn_or_cleaned_up(self):
+        current = views._current_week()
+        self.enter(current, 'inj1carol', 2)
+        with self.assertRaises(CommandError):
+            call_command('pick_raffle_winner', '--week', current, stdout=io.StringIO())
+
+        RaffleResult.objects.create(
+            week=current, winning_address='inj1carol', winning_ticket_id=0, ticket_count=2,
+        )
+        self.assertEqual(views.finalize_raffle_weeks()['cleaned'], [])
+        self.assertEqual(RaffleTicket.objects.filter(week=current).count(), 1)
+
+
+class RaffleTicketRangeTests(TestCase):
+    week = '2000-W01'
+
+    def credit(self, address, count, source=RaffleTicket.SOURCE_PAID):
+        views._credit_raffle_tickets(
+            self.week, address, source, f'{address}:{count}:{source}', count, lambda: None,
+        )
+
+    def draw(self, number):
+        with mock.patch.object(views._raffle_secrets, 'randbelow', return_value=number - 1):
+            owner, drawn, total = views._draw_raffle_ticket(self.week)
+        self.assertEqual(drawn, number)
+        return owner.address, total
+
+    def test_ranges_are_contiguous_across_purchases_and_free_claims(self):
+        self.credit('inj1alice', 3)
+        self.credit('inj1bob', 1, RaffleTicket.SOURCE_FREE)
+        self.credit('inj1alice', 5)
+        self.credit('inj1carol', 2, RaffleTicket.SOURCE_FREE)
+
+        ranges = list(
+            RaffleTicket.objects.filter(week=self.week)
+            .order_by('first_no').values_list('address', 'first_no', 'count')
+        )
+        self.assertEqual(ranges, [
+            ('inj1alice', 1, 3), ('inj1bob', 4, 1), ('inj1alice', 5, 5), ('inj1carol', 10, 2),
+        ])
+        self.assertEqual(RaffleWeekStats.objects.get(week=self.week).total_tickets, 11)
+        self.assertEqual(views._raffle_ticket_total(self.week), 11)
+
+    def test_draw_maps_range_edges_to_their_owner(self):
+        self.credit('inj1alice', 3)
+        self.credit('inj1bob', 1, RaffleTicket.SOURCE_FREE)
+        self.credit('inj1carol', 4)
+        for number, owner in [
+            (1, 'inj1alice'), (3, 'inj1alice'),
+            (4, 'inj1bob'),
+            (5, 'inj1carol'), (8, 'inj1carol'),
+        ]:
+            self.assertEqual(self.draw(number), (owner, 8))
+
+    def test_migration_packs_one_row_per_ticket_into_ranges(self):
+        pack = importlib.import_module('myapp.migrations.0026_raffle_ticket_ranges').pack_ticket_ranges
+        # Rows as they stood before 0026: one per ticket, in entry order.
+        # Negative placeholders keep (week, first_no) unique until packed.
+        entries = [
+            ('inj1alice', 'paid', 'TX1'), ('inj1alice', 'paid', 'TX1'),
+            ('inj1bob', 'free', 'TX2'),
+            ('inj1alice', 'paid', 'TX1'),
+            ('inj1carol', 'paid', 'TX3'), ('inj1carol', 'paid', 'TX3'),
+        ]
+        for i, (address, source, tx_hash) in enumerate(entries):
+            ticket = RaffleTicket.objects.create(
+                week=self.week, address=address, source=source, tx_hash=tx_hash,
+                first_no=-(i + 1), count=1,
+            )
+            # Distinct entry times, as real rows have.
+            RaffleTicket.objects.filter(pk=ticket.pk).update(
+                created_at=datetime(2000, 1, 3, tzinfo=timezone.utc) + timedelta(minutes=i),
+            )
+        RaffleTicket.objects.create(
+            week='2000-W02', address='inj1dave', source='paid', tx_hash='TX4', first_no=-1, count=1,
+        )
+
+        pack(apps, None)
+
+        self.assertEqual(
+            list(
+                RaffleTicket.objects.filter(week=self.week)
+                .order_by('first_no').values_list('address', 'tx_hash', 'first_no', 'count')
+            ),
+            [('inj1alice', 'TX1', 1, 3), ('inj1bob', 'TX2', 4, 1), ('inj1carol', 'TX3', 5, 2)],
+        )
+        self.assertEqual(
+            list(RaffleTicket.objects.filter(week='2000-W02').values_list('first_no', 'count')),
+            [(1, 1)],
+        )
+
+
+    def test_counter_backfill_counts_each_week_once(self):
+        backfill = importlib.import_module('myapp.migrations.0027_raffle_counters').backfill_counters
+        for i, (address, count) in enumerate([('inj1alice', 3), ('inj1bob', 1), ('inj1alice', 2)]):
+            ticket = RaffleTicket.objects.create(
+                week=self.week, address=address, source='paid', tx_hash=f'TX{i}',
+                first_no=[1, 4, 5][i], count=count,
+            )
+            RaffleTicket.objects.filter(pk=ticket.pk).update(
+                created_at=datetime(2000, 1, 3, tzinfo=timezone.utc) + timedelta(minutes=i),
+            )
+
+        backfill(apps, None)
+
+        stats = RaffleWeekStats.objects.get(week=self.week)
+        self.assertEqual((stats.total_tickets, stats.participants), (6, 2))
+        self.assertEqual(
+            dict(RaffleEntrant.objects.filter(week=self.week).values_list('address', 'tickets')),
+            {'inj1alice': 5, 'inj1bob': 1},
+        )
+
+class SubmissionPeriodTests(TestCase):
+    """Async submissions count for the month / week they were accepted in,
+    however late the worker gets to them."""
+
+    def setUp(self):
+        now = datetime.now(timezone.utc)
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        week_start = (now - timedelta(days=now.weekday())).replace(
+            hour=0, minute=0, second=0, microsecond=0,
+        )
+        self.month_end = month_start - timedelta(minutes=1)
+        self.week_end = week_start - timedelta(minutes=1)
+        self.last_month = self.month_end.strftime('%Y-%m')
+        iso_year, iso_week, _ = self.week_end.isocalendar()
+        self.last_week = f'{iso_year}-W{iso_week:02d}'
+        for patcher in (
+            mock.patch.object(submissions, 'fetch_tx'),
+            mock.patch.object(GameVerifier, 'verify_pedro_burn', return_value=(True, '')),
+            mock.patch.object(views, '_ticket_cost_for', return_value=1),
+            # The month rollover must not be remembered from earlier tests.
+            mock.patch.dict(rollover_epochs._LOCAL, clear=True),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def accept_at(self, at, kind, payload):
+        class Clock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return at
+
+        with mock.patch.object(submissions, 'datetime', Clock):
+            status, body = submissions.accept_submission(kind, payload['address'], payload['tx_hash'], payload)
+        self.assertEqual(status, 202)
+        return PendingSubmission.objects.get(id=body['id'])
+
+    def process(self, submission):
+        submission.refresh_from_db()
+        return submissions.process_submission(submission)
+
+    def test_score_accepted_before_month_end_stays_in_that_month(self):
+        submission = self.accept_at(self.month_end, PendingSubmission.KIND_GAME_SCORE, {
+            'address': 'inj1late', 'name': 'late', 'score': 500, 'tx_hash': 'A1' * 32,
+        })
+        self.assertEqual(submission.payload['month'], self.last_month)
+        self.assertEqual(self.process(submission), PendingSubmission.STATUS_APPLIED)
+        # The new month's rollover ran right after it and crowned it.
+        payout = GameMonthPayout.objects.get(month=self.last_month)
+        self.assertEqual((payout.winning_address, payout.winning_score), ('inj1late', 500))
+        self.assertFalse(GameLeaderboardEntry.objects.exists())
+        state = GameUpgradeState.objects.get(address='inj1late')
+        self.assertEqual((state.current_month, state.score_base), (views._current_month(), 0))
+
+    def test_raffle_purchase_lands_in_the_week_it_was_accepted(self):
+        submission = self.accept_at(self.week_end, PendingSubmission.KIND_RAFFLE_BUY, {
+            'address': 'inj1late', 'tickets': 3, 'tx_hash': 'B1' * 32,
+        })
+        self.assertEqual(self.process(submission), PendingSubmission.STATUS_APPLIED)
+        self.assertEqual(RaffleTicket.objects.get().week, self.last_week)
+
+    def test_raffle_purchase_for_a_drawn_week_goes_into_the_running_week(self):
+        RaffleResult.objects.create(
+            week=self.last_week, winning_address='inj1alice', winning_ticket_id=0, ticket_count=1,
+        )
+        submission = self.accept_at(self.week_end, PendingSubmission.KIND_RAFFLE_BUY, {
+            'address': 'inj1late', 'tickets': 3, 'tx_hash': 'B2' * 32,
+        })
+        self.assertEqual(self.process(submission), PendingSubmission.STATUS_APPLIED)
+        self.assertEqual(RaffleTicket.objects.get().week, views._current_week())
+
+    def test_vote_for_a_finalized_month_is_rejected(self):
+        GovernanceMonthResult.objects.create(month=self.last_month)
+        submission = self.accept_at(self.month_end, PendingSubmission.KIND_GOVERNANCE_VOTE, {
+            'address': 'inj1late', 'choice': 'liquidity', 'tx_hash': 'C1' * 32,
+        })
+        self.assertEqual(self.process(submission), PendingSubmission.STATUS_FAILED)
+        submission.refresh_from_db()
+        self.assertIn(self.last_month, submission.result['error'])
+
+
+class GovernanceSnapshotTests(TestCase):
+
+    def setUp(self):
+        self.month = views._current_month()
+        views._store_nft_snapshot({'inj1alice': 2, 'inj1bob': 1}, pages=1)
+
+    def test_rebuild_withdraws_the_epoch_until_it_commits(self):
+        views.build_governance_snapshot(self.month)
+        self.assertTrue(epoch_is_current('governance_snapshot', self.month, local=False))
+
+        seen = {}
+        take = views._take_governance_snapshot
+
+        def observe(month):
+            seen['epoch'] = epoch_is_current('governance_snapshot', month, local=False)
+            seen['state'] = views._ensure_snapshot(month)
+            return take(month)
+
+        with mock.patch.object(views, '_take_governance_snapshot', side_effect=observe):
+            job = views.build_governance_snapshot(self.month, replace=True)
+        self.assertEqual(seen, {'epoch': False, 'state': GovernanceSnapshotJob.STATE_BUILDING})
+        self.assertEqual(job.state, GovernanceSnapshotJob.STATE_READY)
+        self.assertEqual(GovernanceVoterSnapshot.objects.filter(month=self.month).count(), 2)
+        self.assertTrue(epoch_is_current('governance_snapshot', self.month, local=False))
+
+    def test_stale_holder_snapshot_fails_the_build(self):
+        PedroNftSnapshot.objects.update(created_at=datetime.now(timezone.utc) - timedelta(hours=1))
+        with mock.patch.object(views, '_trigger_async_holder_refresh') as refresh:
+            job = views.build_governance_snapshot(self.month)
+        refresh.assert_called_once()
+        self.assertEqual(job.state, GovernanceSnapshotJob.STATE_FAILED)
+        self.assertIn('stale', job.error)
+        self.assertFalse(GovernanceVoterSnapshot.objects.filter(month=self.month).exists())
+        self.assertFalse(epoch_is_current('governance_snapshot', self.month, local=False))
+
+    def test_async_vote_waits_for_the_snapshot(self):
+        submission = PendingSubmission.objects.create(
+            kind=PendingSubmission.KIND_GOVERNANCE_VOTE, address='inj1alice', tx_hash='AA' * 32,
+            next_attempt_at=datetime.now(timezone.utc),
+        )
+        processor = submissions.SubmissionProcessor(
+            process=lambda payload: views._snapshot_not_ready(GovernanceSnapshotJob.STATE_BUILDING),
+            applied=lambda payload: False,
+            retry_when=views._is_snapshot_not_ready,
+        )
+        with mock.patch.dict(submissions._PROCESSORS, {submission.kind: processor}), \
+                mock.patch.object(submissions, 'fetch_tx'):
+            self.assertEqual(submissions.process_submission(submission), 'retry')
+        submission.refresh_from_db()
+        self.assertEqual(submission.status, PendingSubmission.STATUS_PENDING)
+        self.assertGreater(submission.next_attempt_at, datetime.now(timezone.utc))
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'tiered'},
+})
+class TieredCacheTests(SimpleTestCase):
+    """Two TieredCache objects of one family stand in for two workers: each
+    has its own L1, and they share the L2 backend."""
+
+    def setUp(self):
+        caches['default'].clear()
+        self.family = f'test_{self._testMethodName}'
+
+    def worker(self, **kwargs):
+        return TieredCache(self.family, ttl=60, **kwargs)
+
+    def counts(self):
+        return tiered_cache_stats().get(self.family, {})
+
+    def test_l1_hit_skips_the_shared_cache_within_the_check_interval(self):
+        a = self.worker(check_interval=60)
+        a.set('k', {'n': 1})
+        with mock.patch.object(caches['default'], 'get') as shared_get:
+            self.assertEqual(a.get('k'), {'n': 1})
+        shared_get.assert_not_called()
+        self.assertEqual(self.counts().get('l1_hits'), 1)
+        self.assertNotIn('version_checks', self.counts())
+
+    def test_unchanged_version_is_served_from_l1(self):
+        a, b = self.worker(), self.worker()
+        a.set('k', 'v1')
+        self.assertEqual(b.get('k'), 'v1')  # fetched from L2
+        self.assertEqual(b.get('k'), 'v1')  # version matches: L1
+        self.assertEqual(self.counts()['l2_hits'], 1)
+        self.assertEqual(self.counts()['l1_hits'], 1)
+
+    def test_a_write_elsewhere_is_picked_up_on_the_next_version_check(self):
+        a, b = self.worker(), self.worker(check_interval=60)
+        a.set('k', 'v1')
+        self.assertEqual(b.get('k'), 'v1')
+        a.set('k', 'v2')
+        self.assertEqual(b.get('k'), 'v1')  # inside b's check interval
+        b.check_interval = 0
+        self.assertEqual(b.get('k'), 'v2')
+
+    def test_invalidate_is_seen_by_every_worker(self):
+        a, b = self.worker(), self.worker()
+        a.set('k', 'v1')
+        self.assertEqual(b.get('k'), 'v1')
+        a.invalidate('k')
+        self.assertIsNone(b.get('k'))
+        self.assertIsNone(a.peek('k'))
+
+    def test_peek_survives_the_shared_version_being_evicted(self):
+        a = self.worker()
+        a.set('k', 'v1')
+        caches['default'].delete(f'tc:{self.family}:k:ver')
+        self.assertIsNone(a.get('k'))
+        self.assertEqual(a.peek('k'), 'v1')
+        self.assertEqual(a.get('k', 'fallback'), 'fallback')
+
+    def test_l1_is_bounded(self):
+        a = self.worker(max_entries=2)
+        for key in ('k1', 'k2', 'k3'):
+            a.set(key, key)
+        self.assertIsNone(a.peek('k1'))
+        self.assertEqual(a.get('k1'), 'k1')  # still in L2
+
+
+class LeaseTests(TestCase):
+
+    def expire(self, name):
+        Lease.objects.filter(name=name).update(
+            expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+        )
+
+    def test_one_holder_at_a_time(self):
+        first = acquire_lease('job', ttl=60)
+        self.assertIsNotNone(first)
+        self.assertIsNone(acquire_lease('job', ttl=60))
+        self.assertIsNotNone(acquire_lease('other_job', ttl=60))
+        release_lease(first)
+        self.assertIsNotNone(acquire_lease('job', ttl=60))
+
+    def test_expired_lease_is_taken_over_and_fenced(self):
+        stale = acquire_lease('job', ttl=60)
+        self.assertTrue(renew_lease(stale, 60))
+        self.expire('job')
+        self.assertFalse(lease_is_current(stale))
+
+        fresh = acquire_lease('job', ttl=60)
+        self.assertIsNotNone(fresh)
+        self.assertEqual(fresh.token, stale.token + 1)
+        self.assertFalse(renew_lease(stale, 60))
+        self.assertFalse(lease_is_current(stale))
+        release_lease(stale)
+        self.assertTrue(lease_is_current(fresh))
+
+    def test_hold_lease_releases_only_its_own_token(self):
+        with hold_lease('job', ttl=60) as held:
+            self.assertIsNotNone(held)
+            with hold_lease('job', ttl=60) as contender:
+                self.assertIsNone(contender)
+            self.expire('job')
+            successor = acquire_lease('job', ttl=60)
+        self.assertTrue(lease_is_current(successor))
+        self.assertIsNone(acquire_lease('job', ttl=60))
+
+        release_lease(successor)
+        with hold_lease('job', ttl=60) as held:
+            self.assertIsNotNone(held)
+        self.assertIsNotNone(acquire_lease('job', ttl=60))
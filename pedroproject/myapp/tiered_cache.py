@@ -0,0 +1,157 @@
+"""
+Two-tier cache for hot, read-mostly values.
+
+Shared state goes through Django's cache (the DatabaseCache in production),
+where every `cache.get` is a SQL round trip plus an unpickle of the whole
+value. `TieredCache` keeps a bounded per-worker copy (L1) of each entry next
+to the shared one (L2). L2 holds two keys per entry:
+
+    tc:<family>:<key>:ver   a short version token, cheap to read
+    tc:<family>:<key>:val   (version, value)
+
+A read compares the L1 copy's version with the `:ver` key and only fetches
+and unpickles `:val` when another worker has written a newer one. Families
+with a `check_interval` skip even that check for a few seconds after the
+last one, trading that much staleness for a pure in-memory hit.
+
+    _TOKEN_INFO = TieredCache('token_info', ttl=60)
+    info = _TOKEN_INFO.get('all')
+    if info is None:
+        info = build()
+        _TOKEN_INFO.set('all', info)
+
+Nothing here depends on the backend, so it runs the same against the DB
+cache, Redis or LocMemCache. Hit/miss counters are kept per family and per
+process; `tiered_cache_stats()` returns them.
+"""
+
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+
+DEFAULT_L1_MAX_ENTRIES = 128
+
+_STATS: dict[str, Counter] = {}
+_STATS_LOCK = threading.Lock()
+
+
+def _count(family: str, event: str) -> None:
+    with _STATS_LOCK:
+        _STATS.setdefault(family, Counter())[event] += 1
+
+
+def tiered_cache_stats() -> dict[str, dict[str, int]]:
+    """{family: {'l1_hits', 'l2_hits', 'misses', 'version_checks', 'sets'}}
+    for this worker process."""
+    with _STATS_LOCK:
+        return {family: dict(counter) for family, counter in _STATS.items()}
+
+
+class TieredCache:
+    """One key family (e.g. 'token_info') with its own TTL and L1 bound.
+    Values must be picklable and should be treated as read-only by callers,
+    since the L1 copy is shared by every thread of the worker."""
+
+    def __init__(self, family: str, ttl: int | None,
+                 max_entries: int = DEFAULT_L1_MAX_ENTRIES,
+                 check_interval: float = 0.0,
+                 alias: str = 'default'):
+        self.family = family
+        self.ttl = ttl
+        self.max_entries = max(1, int(max_entries))
+        self.check_interval = check_interval
+        self.alias = alias
+        # key -> (version, value, last_checked)
+        self._l1: OrderedDict[str, tuple[str, object, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def _l2(self):
+        return caches[self.alias]
+
+    def _key(self, key: str, part: str) -> str:
+        return f'tc:{self.family}:{key}:{part}'
+
+    def _remember(self, key: str, version: str, value, checked: float) -> None:
+        with self._lock:
+            self._l1[key] = (version, value, checked)
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.max_entries:
+                self._l1.popitem(last=False)
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            self._l1.pop(key, None)
+
+    # -- sync API ------------------------------------------------------------
+
+    def get(self, key: str, default=None):
+        now = time.monotonic()
+        with self._lock:
+            local = self._l1.get(key)
+            if local is not None:
+                self._l1.move_to_end(key)
+
+        if local is not None and now - local[2] < self.check_interval:
+            _count(self.family, 'l1_hits')
+            return local[1]
+
+        _count(self.family, 'version_checks')
+        version = self._l2.get(self._key(key, 'ver'))
+        if version is None:
+            # Expired or never written: a miss. The L1 copy stays in place
+            # (its last check is already past the interval, so it won't be
+            # served from here again) for `peek()` to fall back on.
+            _count(self.family, 'misses')
+            return default
+
+        if local is not None and local[0] == version:
+            self._remember(key, version, local[1], now)
+            _count(self.family, 'l1_hits')
+            return local[1]
+
+        stored = self._l2.get(self._key(key, 'val'))
+        if not stored or stored[0] != version:
+            # Writer raced us between the two reads; treat as a miss.
+            _count(self.family, 'misses')
+            return default
+        self._remember(key, version, stored[1], now)
+        _count(self.family, 'l2_hits')
+        return stored[1]
+
+    def set(self, key: str, value) -> None:
+        """Store `value` under a new version. Other workers pick it up on
+        their next version check."""
+        version = uuid.uuid4().hex[:12]
+        self._l2.set_many(
+            {
+                self._key(key, 'val'): (version, value),
+                self._key(key, 'ver'): version,
+            },
+            self.ttl,
+        )
+        self._remember(key, version, value, time.monotonic())
+        _count(self.family, 'sets')
+
+    def peek(self, key: str, default=None):
+        """This worker's L1 copy even if it has expired or been superseded.
+        For serving stale data when a rebuild fails."""
+        with self._lock:
+            local = self._l1.get(key)
+        return default if local is None else local[1]
+
+    def invalidate(self, key: str) -> None:
+        self._l2.delete_many([self._key(key, 'ver'), self._key(key, 'val')])
+        self._forget(key)
+
+    # -- async API -----------------------------------------------------------
+
+    async def aget(self, key: str, default=None):
+        return await sync_to_async(self.get, thread_sensitive=True)(key, default)
+
+    async def aset(self, key: str, value) -> None:
+        await sync_to_async(self.set, thread_sensitive=True)(key, value)
@@ -41,6 +41,7 @@ urlpatterns = [
     path('game/leaderboard/', views.game_leaderboard, name='game_leaderboard'),
     path('game/hall_of_fame/', views.game_hall_of_fame, name='game_hall_of_fame'),
     path('game/upgrades/', views.game_upgrades_set, name='game_upgrades_set'),
+    path('game/upgrades/sync/', views.game_upgrades_sync, name='game_upgrades_sync'),
     path('game/upgrades/<str:address>/', views.game_upgrades_get, name='game_upgrades_get'),
     path('game/steal/', views.game_steal, name='game_steal'),
     path('game/steals/', views.game_steal_log, name='game_steal_log'),
@@ -66,4 +67,6 @@ urlpatterns = [
 
     path('dashboard/tx/', views.dashboard_tx_log, name='dashboard_tx_log'),
     path('dashboard/tx/<str:feature>/', views.dashboard_tx_recent, name='dashboard_tx_recent'),
+
+    path('submissions/<int:submission_id>/', views.submission_status_view, name='submission_status'),
 ]
\ No newline at end of file
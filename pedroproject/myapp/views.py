@@ -1,14 +1,21 @@
 import asyncio
 from asyncio.log import logger
+import atexit
+import contextlib
+import dataclasses
+import hashlib
 import json
 import os
 import threading
 import time
 
+from asgiref.sync import async_to_sync, sync_to_async
 from dotenv import load_dotenv
 
+from django.conf import settings
 from django.core.cache import cache
-from django.http import JsonResponse, HttpResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, HttpResponse, HttpResponseNotModified
 from django.shortcuts import render
 from django.views.decorators.csrf import csrf_exempt
 
@@ -40,15 +47,19 @@ from .injective_scam_check import ScamChecker
 from .injective_talent_check import TalentNotifier
 
 from datetime import datetime, timezone, timedelta
-from django.db import IntegrityError
-from django.db.models import Sum, F
-from django.db.models.functions import Greatest
+from django.db import IntegrityError, close_old_connections, connection, transaction
+from django.db.models import (
+    BigIntegerField, Case, DateTimeField, F, OuterRef, Q, Subquery, Sum, Value, When,
+)
+from django.db.models.functions import Coalesce, Greatest, NullIf
 from .models import (
     GameLeaderboardEntry,
     GameUpgradeState,
     GameStealLog,
     GameMonthPayout,
+    GameMonthBest,
     GovernanceVoterSnapshot,
+    GovernanceSnapshotJob,
     GovernanceVote,
     GovernanceMonthResult,
     SpecialProposal,
@@ -58,10 +69,32 @@ from .models import (
     RaffleFreeClaim,
     RafflePurchase,
     RaffleResult,
+    RaffleWeekStats,
+    RaffleEntrant,
+    ContractScanCheckpoint,
+    PedroNftSnapshot,
+    PedroNftHolding,
+    PendingSubmission,
 )
-from .injective_game import GameVerifier, INJECTIVE_LCD, TENTH_PEDRO_WEI
+from .injective_game import GameVerifier, TENTH_PEDRO_WEI, verify_submission
 from .injective_governance import GovernanceVerifier, VALID_CHOICES
 from .injective_dashboard_logs import DashboardLogVerifier, FEATURE_MEMOS
+from .injective_chain import (
+    ContractStateScanStats,
+    LcdContractStateClient,
+    decode_nft_token_owner,
+    scan_contract_state_pages,
+)
+from .tiered_cache import TieredCache
+from .leases import hold_lease, lease_is_current, renew_lease
+from .rollover_epochs import (
+    RolloverLeaseLost,
+    clear_epoch,
+    epoch_is_current,
+    mark_epoch,
+    run_once_per_period,
+)
+from .submissions import accept_submission, register_processor, submission_status, wants_async
 
 # Effectively unlimited score. The only ceiling is the DB column type:
 # `score` is a BigIntegerField, so the hard limit is the signed 64-bit max
@@ -70,6 +103,24 @@ from .injective_dashboard_logs import DashboardLogVerifier, FEATURE_MEMOS
 GAME_MAX_SCORE = 9_223_372_036_854_775_807
 GAME_MAX_LEVEL = 1000
 
+
+def _live_score(score_base: int, auto_level: int, accrual_started_at, now=None) -> int:
+    """A wallet's current score: its saved `score_base` plus the idle income
+    its `auto_level` has earned since `accrual_started_at` — auto_level ×
+    settings.GAME_AUTO_POINTS_PER_SECOND_PER_LEVEL points per second —
+    capped at GAME_MAX_SCORE. Closed form, so reading a score never writes."""
+    earned = 0
+    if auto_level and accrual_started_at is not None:
+        now = now or datetime.now(timezone.utc)
+        elapsed = max(0.0, (now - accrual_started_at).total_seconds())
+        rate = auto_level * float(getattr(settings, 'GAME_AUTO_POINTS_PER_SECOND_PER_LEVEL', 0))
+        earned = min(GAME_MAX_SCORE, int(elapsed * rate))
+    return max(0, min(GAME_MAX_SCORE, score_base + earned))
+
+
+def _state_live_score(state, now=None) -> int:
+    return _live_score(state.score_base, state.auto_level, state.accrual_started_at, now)
+
 # Raffle admins — comma-separated inj1 addresses in the RAFFLE_ADMIN_ADDRESSES
 # env var. Only these wallets can call /raffle/admin/set_payout/.
 RAFFLE_ADMIN_ADDRESSES = {
@@ -92,20 +143,36 @@ STEAL_COOLDOWN_SECONDS = 6 * 60 * 60
 STEAL_MAX_LEVEL = 12
 
 
-# Shared across all workers via the database cache (see settings.CACHES).
-# Value is a dict[str, int] mapping inj1 address -> Pedro NFT count.
-_NFT_HOLDERS_CACHE_KEY = 'pedro_nft_holders_v2'  # v2: value is {counts, fetched_at}
-# Within this window the cached map is "fresh" and served as-is. Past it we
-# still serve the (stale) map instantly but kick off a background refresh —
-# stale-while-revalidate, so a user request never waits on the state scan.
+# Pedro NFT counts live in PedroNftHolding, one row per holder per
+# PedroNftSnapshot; the newest snapshot is the current one. Within this window
+# it is "fresh" and served as-is. Past it we still answer from it instantly
+# but kick off a background refresh — stale-while-revalidate, so a user
+# request never waits on the state scan.
 _NFT_HOLDERS_FRESH_SECONDS = 600  # 10 minutes — NFTs don't move every second.
-# How long the cache keeps the map around even when stale, so reads stay
-# instant once it's been warmed once. The scheduled `refresh_nft_holders`
-# command should run well inside this window to keep it fresh.
-_NFT_HOLDERS_RETENTION_SECONDS = 86_400  # 24h
+# Pointer to the current snapshot, {'id', 'created_at'}. Workers re-check the
+# shared version at most every 2s, so a new snapshot is picked up within that.
+_NFT_SNAPSHOT_CACHE = TieredCache(
+    'nft_snapshot', ttl=86_400, max_entries=1, check_interval=2,
+)
+# A superseded snapshot is kept this long after the next one is published,
+# so a worker still holding the old pointer (up to the 2s check above, plus
+# a request in flight) reads its holdings instead of an empty set.
+_NFT_SNAPSHOT_RETAIN_SECONDS = 60
 # Serializes refreshes so we never run the multi-page state scan twice at
-# once (cold sync path and background revalidate share this lock).
+# once (cold sync path and background revalidate share this lock). This only
+# covers one worker; the `nft_holders_scan` lease covers the cluster.
 _NFT_HOLDERS_LOCK = threading.Lock()
+_NFT_HOLDERS_LEASE = 'nft_holders_scan'
+# Renewed after every page, so this only has to outlast one LCD request; a
+# crashed scanner blocks the next one for at most this long.
+_NFT_HOLDERS_LEASE_SECONDS = 120
+# ContractScanCheckpoint row the holder scan resumes from.
+_NFT_HOLDERS_SCAN_NAME = 'pedro_nft_holders'
+# Save the checkpoint every this many pages while a run is going well.
+_NFT_HOLDERS_SCAN_SAVE_EVERY = 10
+# A half-finished pass older than this is dropped and restarted from page 1 —
+# counts gathered that long ago no longer describe the current holders.
+_NFT_HOLDERS_SCAN_MAX_AGE_SECONDS = 6 * 60 * 60
 
 
 # Crit table: (cumulative threshold, multiplier). Roll random in [0,1); the
@@ -129,106 +196,239 @@ def _roll_nft_crit() -> int:
     return 1
 
 
-def _refresh_nft_holders() -> dict[str, int]:
+def _refresh_nft_holders(max_pages: int | None = None, lease=None) -> dict[str, int]:
     """Walks the full Pedro NFT contract state and rebuilds the
     address->count map. Called on cold cache or after TTL expiry. Cold
     refresh can take a few seconds — concurrent callers in the same worker
     block on the lock so only one refetch happens at a time.
 
     Uses the same approach as `AApedro_verify_all_webpage.fetch_holder_nft`
-    (raw contract-state scan) because the standard CW721 `tokens(owner)`
-    query doesn't return correct counts on this particular contract."""
-    import base64
-    import requests
+    (raw contract-state scan, through `injective_chain`'s shared scanner
+    over the LCD pool) because the standard CW721 `tokens(owner)` query
+    doesn't return correct counts on this particular contract.
+
+    Resumable: the pagination key and the counts gathered so far are kept
+    in a ContractScanCheckpoint row. An LCD error, or running out of the
+    per-run page budget (`max_pages`, default
+    settings.NFT_HOLDERS_SCAN_PAGES_PER_RUN), saves the checkpoint and the
+    next call carries on from that page. A new PedroNftSnapshot is only
+    stored once a pass completes; until then the previous one stays current.
+    Returns the counts gathered by this pass (partial if it paused).
+
+    With a `lease` (see _refresh_nft_holders_leased) the lease is renewed
+    after every page, and the scan stops without writing anything once it
+    has been lost to another worker."""
+    from django.conf import settings
+
+    if max_pages is None:
+        max_pages = int(getattr(settings, 'NFT_HOLDERS_SCAN_PAGES_PER_RUN', 200))
 
-    counts: dict[str, int] = {}
-    next_key: str | None = None
+    now = datetime.now(timezone.utc)
+    checkpoint, _ = ContractScanCheckpoint.objects.get_or_create(
+        name=_NFT_HOLDERS_SCAN_NAME,
+    )
+    if (
+        checkpoint.in_progress()
+        and checkpoint.started_at
+        and (now - checkpoint.started_at).total_seconds() > _NFT_HOLDERS_SCAN_MAX_AGE_SECONDS
+    ):
+        logger.info(
+            "Discarding NFT holder scan checkpoint started at %s",
+            checkpoint.started_at,
+        )
+        checkpoint.next_key = ''
+
+    if checkpoint.in_progress():
+        counts: dict[str, int] = dict(checkpoint.partial.get('counts') or {})
+        next_key: str | None = checkpoint.next_key
+        logger.info("Resuming NFT holder scan at page %s", checkpoint.pages + 1)
+    else:
+        counts = {}
+        next_key = None
+        checkpoint.pages = 0
+        checkpoint.started_at = now
+
+    def _save_checkpoint(error: str = '') -> None:
+        checkpoint.next_key = next_key or ''
+        checkpoint.partial = {'counts': counts}
+        checkpoint.last_error = error
+        checkpoint.save()
+
+    client = LcdContractStateClient(timeout=30)
+    stats = ContractStateScanStats()
     pages = 0
 
-    while pages < 200:  # safety cap; supports up to ~200k state entries
+    def _take_page(entries) -> bool:
+        """Count one page into the pass and advance the checkpoint past it.
+        False once the lease has been lost to another worker."""
+        nonlocal pages, next_key
+        for _, (owner, _token_id) in entries:
+            counts[owner] = counts.get(owner, 0) + 1
+        if lease is not None and not renew_lease(lease, _NFT_HOLDERS_LEASE_SECONDS):
+            logger.warning(
+                "NFT holder scan lost its lease on page %s; stopping", checkpoint.pages + 1,
+            )
+            return False
         pages += 1
-        params: dict[str, str] = {'pagination.limit': '1000'}
-        if next_key:
-            params['pagination.key'] = next_key
-        url = (
-            f"{INJECTIVE_LCD}/cosmwasm/wasm/v1/contract/"
-            f"{PEDRO_NFT_CONTRACT}/state"
-        )
+        checkpoint.pages += 1
+        next_key = stats.next_key
+        # Persist now and then too, so a killed worker loses little.
+        if next_key and pages % _NFT_HOLDERS_SCAN_SAVE_EVERY == 0:
+            _save_checkpoint()
+        return True
+
+    async def _scan() -> str | None:
+        """Run this call's share of the pass through the shared state
+        scanner. Returns the error that stopped it ('' if none), or None
+        once the lease is lost."""
+        take_page = sync_to_async(_take_page)
         try:
-            resp = requests.get(url, params=params, timeout=30)
-            if resp.status_code != 200:
-                logger.warning(
-                    "NFT state fetch returned %s on page %s",
-                    resp.status_code, pages,
-                )
-                break
-            data = resp.json()
+            async with contextlib.aclosing(scan_contract_state_pages(
+                client, PEDRO_NFT_CONTRACT,
+                decode=decode_nft_token_owner,
+                start_key=next_key,
+                max_pages=max_pages,
+                stats=stats,
+            )) as scan:
+                async for entries in scan:
+                    if not await take_page(entries):
+                        return None
         except Exception as e:
-            logger.warning("NFT state fetch failed on page %s: %s", pages, e)
-            break
-
-        for model in data.get('models') or []:
-            try:
-                value = model.get('value')
-                if not value:
-                    continue
-                decoded = base64.b64decode(value).decode('utf-8')
-                obj = json.loads(decoded)
-            except Exception:
-                continue
-            owner = obj.get('owner') if isinstance(obj, dict) else None
-            token_id = obj.get('token_id') if isinstance(obj, dict) else None
-            # Token records have BOTH owner and token_id; other state entries
-            # (config, minter, etc.) don't and get skipped.
-            if owner and token_id:
-                counts[owner] = counts.get(owner, 0) + 1
-
-        next_key = (data.get('pagination') or {}).get('next_key')
-        if not next_key:
-            break
-
-    # Write to the shared (database-backed) cache so all gunicorn workers see
-    # the same value. Stored with a fetch timestamp so readers can tell a
-    # fresh map from a stale one, and retained well past the freshness window
-    # so reads keep hitting cache between refreshes.
-    cache.set(
-        _NFT_HOLDERS_CACHE_KEY,
-        {'counts': counts, 'fetched_at': time.time()},
-        _NFT_HOLDERS_RETENTION_SECONDS,
+            return f"{e} on page {checkpoint.pages + 1}"
+        return ''
+
+    error = async_to_sync(_scan)() if max_pages > 0 else ''
+    if error is None:
+        return counts
+    complete = not error and stats.complete
+    logger.debug(
+        "NFT holder scan: %s pages, %s entries, %s token records, %s bytes in %.1fs",
+        stats.pages, stats.entries, stats.matched, stats.bytes, stats.seconds,
     )
+
+    if not complete:
+        _save_checkpoint(error)
+        if error:
+            logger.warning("NFT holder scan paused: %s", error)
+        else:
+            logger.info(
+                "NFT holder scan paused after %s pages (budget %s), %s pages so far",
+                pages, max_pages, checkpoint.pages,
+            )
+        return counts
+
+    if lease is not None and not lease_is_current(lease):
+        logger.warning("NFT holder scan lost its lease before publishing; dropped")
+        return counts
+    _store_nft_snapshot(counts, checkpoint.pages)
+    checkpoint.next_key = ''
+    checkpoint.partial = {}
+    checkpoint.last_error = ''
+    checkpoint.completed_at = datetime.now(timezone.utc)
+    checkpoint.save()
     logger.info(
         "NFT holders refreshed: %s holders, %s tokens, %s pages",
-        len(counts), sum(counts.values()), pages,
+        len(counts), sum(counts.values()), checkpoint.pages,
     )
     return counts
 
 
-def _refresh_nft_holders_locked() -> dict[str, int]:
+def _store_nft_snapshot(counts: dict[str, int], pages: int) -> PedroNftSnapshot:
+    """Publish `counts` as the new current snapshot. The snapshot row and all
+    its holdings commit together, so readers flip from the old snapshot to
+    the new one atomically. Snapshots are dropped once they were superseded
+    more than _NFT_SNAPSHOT_RETAIN_SECONDS ago."""
+    with transaction.atomic():
+        snapshot = PedroNftSnapshot.objects.create(
+            holders=len(counts), tokens=sum(counts.values()), pages=pages,
+        )
+        PedroNftHolding.objects.bulk_create(
+            [
+                PedroNftHolding(snapshot=snapshot, address=address, count=count)
+                for address, count in counts.items()
+            ],
+            batch_size=1000,
+        )
+    _NFT_SNAPSHOT_CACHE.set(
+        'current', {'id': snapshot.id, 'created_at': snapshot.created_at},
+    )
+    _drop_superseded_nft_snapshots()
+    return snapshot
+
+
+def _drop_superseded_nft_snapshots() -> None:
+    """Delete snapshots that stopped being current more than
+    _NFT_SNAPSHOT_RETAIN_SECONDS ago: everything older than the snapshot
+    that was current at that cutoff."""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=_NFT_SNAPSHOT_RETAIN_SECONDS)
+    current_at_cutoff = (
+        PedroNftSnapshot.objects
+        .filter(created_at__lte=cutoff)
+        .order_by('-id')
+        .values_list('id', flat=True)
+        .first()
+    )
+    if current_at_cutoff is None:
+        return
+    PedroNftHolding.objects.filter(snapshot_id__lt=current_at_cutoff).delete()
+    PedroNftSnapshot.objects.filter(id__lt=current_at_cutoff).delete()
+
+
+def _current_nft_snapshot() -> dict | None:
+    """{'id', 'created_at'} of the newest holder snapshot, or None before the
+    first scan has completed."""
+    snapshot = _NFT_SNAPSHOT_CACHE.get('current')
+    if snapshot is None:
+        snapshot = (
+            PedroNftSnapshot.objects
+            .order_by('-id')
+            .values('id', 'created_at')
+            .first()
+        )
+        if snapshot is not None:
+            _NFT_SNAPSHOT_CACHE.set('current', snapshot)
+    return snapshot
+
+
+def _nft_snapshot_is_fresh(snapshot: dict | None) -> bool:
+    if snapshot is None:
+        return False
+    age = datetime.now(timezone.utc) - snapshot['created_at']
+    return age.total_seconds() <= _NFT_HOLDERS_FRESH_SECONDS
+
+
+def _refresh_nft_holders_leased(max_pages: int | None = None) -> dict[str, int] | None:
+    """Run one refresh while holding the cluster-wide scan lease. Returns
+    None without scanning when another worker (or the cron command) holds
+    it — exactly one scan runs at a time across all workers."""
+    with hold_lease(_NFT_HOLDERS_LEASE, _NFT_HOLDERS_LEASE_SECONDS) as lease:
+        if lease is None:
+            return None
+        return _refresh_nft_holders(max_pages=max_pages, lease=lease)
+
+
+def _refresh_nft_holders_locked() -> dict[str, int] | None:
     """Run the refresh under the shared lock with a double-check, so a burst
-    of cold-cache requests triggers only one state scan. Returns the map."""
+    of cold requests triggers only one state scan. Returns the scanned map,
+    or None when another thread or worker stored a fresh snapshot, or is
+    scanning right now."""
     with _NFT_HOLDERS_LOCK:
-        entry = cache.get(_NFT_HOLDERS_CACHE_KEY)
-        # Another thread may have refreshed while we waited for the lock.
-        if (
-            isinstance(entry, dict)
-            and 'counts' in entry
-            and time.time() - entry.get('fetched_at', 0) <= _NFT_HOLDERS_FRESH_SECONDS
-        ):
-            return entry['counts']
-        return _refresh_nft_holders()
+        if _nft_snapshot_is_fresh(_current_nft_snapshot()):
+            return None
+        return _refresh_nft_holders_leased()
 
 
 def _trigger_async_holder_refresh() -> None:
     """Kick off a background refresh if one isn't already running. Never
     blocks the caller — this is the 'revalidate' half of stale-while-
-    revalidate. If the lock is already held, a refresh is in flight, so we
-    skip."""
+    revalidate. If the lock (or, in another worker, the lease) is already
+    held, a refresh is in flight, so we skip."""
     if not _NFT_HOLDERS_LOCK.acquire(blocking=False):
         return
 
     def _run():
         try:
-            _refresh_nft_holders()
+            _refresh_nft_holders_leased()
         except Exception as e:  # never let a background failure escape
             logger.warning("Background NFT holder refresh failed: %s", e)
         finally:
@@ -244,22 +444,35 @@ def _trigger_async_holder_refresh() -> None:
 
 
 def _fetch_pedro_nft_count(address: str) -> int:
-    """Returns the number of Pedro NFTs the given address holds. Backed by
-    Django's database cache so the value is shared across all workers.
-
-    Stale-while-revalidate: a warmed cache always answers instantly. When the
-    cached map is older than the freshness window we still return it right
-    away and refresh in the background, so a user request only ever blocks on
-    the (expensive, multi-page) state scan when the cache is completely cold —
-    which the scheduled `refresh_nft_holders` command keeps from happening."""
-    entry = cache.get(_NFT_HOLDERS_CACHE_KEY)
-    if isinstance(entry, dict) and 'counts' in entry:
-        if time.time() - entry.get('fetched_at', 0) > _NFT_HOLDERS_FRESH_SECONDS:
-            _trigger_async_holder_refresh()
-        return entry['counts'].get(address, 0)
-    # Cold cache (first call after deploy / cache eviction) — block once to
-    # fill it. Every subsequent read is served from cache.
-    return _refresh_nft_holders_locked().get(address, 0)
+    """Returns the number of Pedro NFTs the given address holds: an indexed
+    (snapshot, address) lookup in PedroNftHolding, so the cost doesn't grow
+    with the number of holders and every worker sees a new snapshot as soon
+    as it commits.
+
+    Stale-while-revalidate: once a snapshot exists we always answer from it
+    instantly. When it is older than the freshness window we still answer
+    right away and refresh in the background, so a user request only ever
+    blocks on the (expensive, multi-page) state scan before the very first
+    snapshot — which the scheduled `refresh_nft_holders` command keeps from
+    happening."""
+    snapshot = _current_nft_snapshot()
+    if snapshot is None:
+        # No snapshot yet (first call after deploy) — block once to build it.
+        counts = _refresh_nft_holders_locked()
+        if counts is not None:
+            return counts.get(address, 0)
+        snapshot = _current_nft_snapshot()
+        if snapshot is None:
+            return 0
+    elif not _nft_snapshot_is_fresh(snapshot):
+        _trigger_async_holder_refresh()
+    return (
+        PedroNftHolding.objects
+        .filter(snapshot_id=snapshot['id'], address=address)
+        .values_list('count', flat=True)
+        .first()
+        or 0
+    )
 
 
 def _locked_name_for(address: str) -> str:
@@ -275,13 +488,170 @@ def _locked_name_for(address: str) -> str:
         or ''
     )
 
+
+def _record_month_best(entry) -> None:
+    """Fold a new leaderboard entry into its wallet's GameMonthBest row. Only
+    a strictly higher score replaces the best, so on a tie the earlier entry
+    keeps its place — the same order the board has always used."""
+    def raise_best():
+        return (
+            GameMonthBest.objects
+            .filter(month=entry.month, address=entry.address, best_score__lt=entry.score)
+            .update(
+                best_score=entry.score,
+                best_tx=entry.tx_hash,
+                name=entry.name,
+                best_at=entry.submitted_at,
+            )
+        )
+
+    if raise_best():
+        return
+    try:
+        with transaction.atomic():
+            GameMonthBest.objects.create(
+                month=entry.month,
+                address=entry.address,
+                best_score=entry.score,
+                best_tx=entry.tx_hash,
+                name=entry.name,
+                best_at=entry.submitted_at,
+            )
+    except IntegrityError:
+        # A concurrent submit created the row first; ours may still beat it.
+        raise_best()
+
+
+def _rebuild_game_month_best() -> int:
+    """Recompute GameMonthBest from GameLeaderboardEntry, for entries written
+    outside the submit path (import_leaderboard). Returns the row count."""
+    best = {}
+    entries = (
+        GameLeaderboardEntry.objects
+        .order_by('-score', 'submitted_at', 'id')
+        .values_list('month', 'address', 'score', 'tx_hash', 'name', 'submitted_at')
+        .iterator()
+    )
+    for month, address, score, tx_hash, name, submitted_at in entries:
+        best.setdefault((month, address), GameMonthBest(
+            month=month, address=address, best_score=score,
+            best_tx=tx_hash, name=name, best_at=submitted_at,
+        ))
+    with transaction.atomic():
+        GameMonthBest.objects.all().delete()
+        GameMonthBest.objects.bulk_create(best.values(), batch_size=500)
+    return len(best)
+
+
+def _month_board(month: str):
+    """GameMonthBest rows for `month` in leaderboard order, each annotated
+    with `display_name`: the wallet's locked name, else the submitted one."""
+    locked_name = (
+        GameUpgradeState.objects
+        .filter(address=OuterRef('address'))
+        .values('locked_name')[:1]
+    )
+    return (
+        GameMonthBest.objects
+        .filter(month=month)
+        .annotate(display_name=Coalesce(NullIf(Subquery(locked_name), Value('')), F('name')))
+        .order_by('-best_score', 'best_at')
+    )
+
+
+def _game_rank(month: str, address: str) -> dict | None:
+    """{'rank', 'score', 'players'} for `address` this month, or None if it
+    has no leaderboard entry. Two indexed counts, however many players."""
+    mine = (
+        GameMonthBest.objects
+        .filter(month=month, address=address)
+        .values('best_score', 'best_at')
+        .first()
+    )
+    if mine is None:
+        return None
+    board = GameMonthBest.objects.filter(month=month)
+    ahead = board.filter(
+        Q(best_score__gt=mine['best_score'])
+        | Q(best_score=mine['best_score'], best_at__lt=mine['best_at'])
+    ).count()
+    return {'rank': ahead + 1, 'score': mine['best_score'], 'players': board.count()}
+
+# Serialized /game/leaderboard/ and /game/hall_of_fame/ payloads. Both only
+# change on a submit, steal, rollover or admin payout, and each of those bumps
+# the shared generation counter; a payload is cached under the generation it
+# was built at, so a bump makes every worker rebuild on its next request. The
+# per-worker copy of a (name, month, generation) key never goes stale, hence
+# the long check interval. Workers re-read the counter at most once per
+# _GAME_BOARD_GEN_CHECK_SECONDS, so polls in between — including 304s for
+# If-None-Match — are answered from memory.
+_GAME_BOARD_CACHE = TieredCache('game_board', ttl=3600, max_entries=8, check_interval=300)
+_GAME_BOARD_GEN_KEY = 'game_board:generation'
+_GAME_BOARD_GEN_CHECK_SECONDS = 1.0
+_game_board_gen_local = (None, 0.0)  # (generation, monotonic time read)
+
+
+def _game_board_generation() -> int:
+    global _game_board_gen_local
+    generation, checked = _game_board_gen_local
+    now = time.monotonic()
+    if generation is not None and now - checked < _GAME_BOARD_GEN_CHECK_SECONDS:
+        return generation
+    generation = cache.get(_GAME_BOARD_GEN_KEY)
+    if generation is None:
+        # First use, or evicted: seed from the clock so a generation number
+        # from before the eviction is never handed out again.
+        cache.add(_GAME_BOARD_GEN_KEY, time.time_ns(), None)
+        generation = cache.get(_GAME_BOARD_GEN_KEY)
+    _game_board_gen_local = (generation, now)
+    return generation
+
+
+def _bump_game_board_generation() -> None:
+    """Invalidate the cached leaderboard / hall-of-fame payloads."""
+    global _game_board_gen_local
+    try:
+        cache.incr(_GAME_BOARD_GEN_KEY)
+    except ValueError:
+        cache.set(_GAME_BOARD_GEN_KEY, time.time_ns(), None)
+    _game_board_gen_local = (None, 0.0)
+
+
+def _game_board_response(request, name: str, build) -> HttpResponse:
+    """Serve `build(month)` from the payload cache with a strong ETag,
+    answering 304 when the client already has it."""
+    month = _current_month()
+    key = f'{name}:{month}:{_game_board_generation()}'
+    cached = _GAME_BOARD_CACHE.get(key)
+    if cached is None:
+        body = json.dumps(build(month), cls=DjangoJSONEncoder).encode()
+        cached = (f'"{hashlib.sha256(body).hexdigest()[:32]}"', body)
+        _GAME_BOARD_CACHE.set(key, cached)
+    etag, body = cached
+
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+    if etag in (tag.strip() for tag in if_none_match.split(',')):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    # Cacheable, but clients must revalidate — the ETag makes that cheap.
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
 PEDRO_NFT_CONTRACT = 'inj1uq453kp4yda7ruc0axpmd9vzfm0fj62padhe0p'
 
-# Mirrors the exclusion list in management/commands/snapshot_governance.py:
-# burn address + Talis marketplace shouldn't get voting power.
+# Housekeeping (month rollover, governance finalization, governance snapshot,
+# the raffle finalizer) runs under a lease so only one worker does each job;
+# the others skip it and keep serving what is already there.
+_HOUSEKEEPING_LEASE_SECONDS = 300
+
+# Left out of every governance snapshot: the burn address and the Talis
+# marketplace hold NFTs but shouldn't get voting power.
 GOVERNANCE_EXCLUDED_ADDRESSES = {
-    'inj1qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqe2hm49',
-    'inj1l9nh9wv24fktjvclc4zgrgyzees7rwdtx45f54',
+    'inj1qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqe2hm49',  # burn
+    'inj1l9nh9wv24fktjvclc4zgrgyzees7rwdtx45f54',  # Talis Marketplace
 }
 
 
@@ -289,31 +659,43 @@ def _current_month():
     return datetime.now(timezone.utc).strftime('%Y-%m')
 
 
+def _submission_month(payload) -> str:
+    """The month a submission counts for: the one it was accepted in
+    (stamped by accept_submission), or now when it is processed inline."""
+    return payload.get('month') or _current_month()
+
+
 def _ensure_month_rolled_over(current_month: str) -> None:
     """Month-end housekeeping. For every past month still sitting in the live
     tables: snapshot its winner (highest score) into GameMonthPayout — the
     permanent Hall-of-Fame record — then wipe ALL three live game tables so
     the new month starts from a completely empty board:
 
-        GameLeaderboardEntry · GameUpgradeState · GameStealLog
+        GameLeaderboardEntry (+ GameMonthBest) · GameUpgradeState · GameStealLog
 
-    Idempotent: once the live tables hold only the current month this is a
-    no-op. It runs lazily on the first request of the new month, and can also
-    be fired exactly at 00:00 UTC by the `rollover_game` management command
-    (cron / Windows Task Scheduler)."""
+    Runs once per month (rollover_epochs.py): after that this is a dict
+    lookup. It runs lazily on the first request of the new month, and can
+    also be fired exactly at 00:00 UTC by the `rollover_game` management
+    command (cron / Windows Task Scheduler)."""
+    run_once_per_period(
+        'game_month_rollover', current_month,
+        lambda: _roll_over_game_months(current_month),
+        _HOUSEKEEPING_LEASE_SECONDS,
+    )
+
+
+def _roll_over_game_months(current_month: str) -> None:
     past_months = list(
         GameLeaderboardEntry.objects
         .exclude(month=current_month)
         .values_list('month', flat=True)
         .distinct()
     )
-    if not past_months:
-        return
     for month in past_months:
         top = (
-            GameLeaderboardEntry.objects
+            GameMonthBest.objects
             .filter(month=month)
-            .order_by('-score', 'submitted_at', 'id')
+            .order_by('-best_score', 'best_at')
             .first()
         )
         if top:
@@ -326,8 +708,8 @@ def _ensure_month_rolled_over(current_month: str) -> None:
                 canonical = _locked_name_for(top.address) or top.name
                 payout.winning_address = top.address
                 payout.winning_name = (canonical or '')[:64]
-                payout.winning_score = top.score
-                payout.winning_tx_hash = top.tx_hash
+                payout.winning_score = top.best_score
+                payout.winning_tx_hash = top.best_tx
                 payout.save(update_fields=[
                     'winning_address', 'winning_name',
                     'winning_score', 'winning_tx_hash', 'updated_at',
@@ -335,6 +717,7 @@ def _ensure_month_rolled_over(current_month: str) -> None:
     # The winner(s) are now safely recorded in GameMonthPayout, so wipe every
     # live game table back to empty for the fresh month.
     GameLeaderboardEntry.objects.exclude(month=current_month).delete()
+    GameMonthBest.objects.exclude(month=current_month).delete()
     GameUpgradeState.objects.exclude(current_month=current_month).delete()
     # GameStealLog has no month column — clear everything logged before the
     # current month began (any steal already logged in the new month stays).
@@ -342,6 +725,7 @@ def _ensure_month_rolled_over(current_month: str) -> None:
         day=1, hour=0, minute=0, second=0, microsecond=0,
     )
     GameStealLog.objects.filter(created_at__lt=month_start).delete()
+    transaction.on_commit(_bump_game_board_generation)
 
 
 def _reset_upgrade_state_if_needed(state, current_month: str) -> bool:
@@ -353,95 +737,215 @@ def _reset_upgrade_state_if_needed(state, current_month: str) -> bool:
     state.click_level = 0
     state.auto_level = 0
     state.steal_level = 0
-    state.score = 0
+    state.score_base = 0
+    state.accrual_started_at = None
     state.last_steal_at = None
     state.current_month = current_month
     state.save(update_fields=[
-        'click_level', 'auto_level', 'steal_level',
-        'score', 'last_steal_at', 'current_month', 'updated_at',
+        'click_level', 'auto_level', 'steal_level', 'score_base',
+        'accrual_started_at', 'last_steal_at', 'current_month', 'updated_at',
     ])
     return True
 
 
-def _run_async(coro_factory):
+# A failed snapshot build is retried by the next request this long after it
+# failed; a build whose worker died is taken over once its progress is older
+# than the housekeeping lease.
+_GOVERNANCE_SNAPSHOT_RETRY_SECONDS = 300
+_GOVERNANCE_SNAPSHOT_LOCK = threading.Lock()
+
+
+def _ensure_snapshot(month) -> str:
     """
-    Run an async coroutine from a sync context. Handles both:
-      - WSGI / pure sync Django: asyncio.run() in this thread.
-      - ASGI / uvicorn / daphne: we're inside a running loop, so spin up a
-        worker thread with its own loop.
-
-    `coro_factory` must be a CALLABLE that returns a fresh coroutine — not a
-    coroutine object. We defer instantiation until we're inside the right
-    loop because libraries like gRPC bind their futures to whichever loop is
-    running at construction/first-call time. Passing a pre-built coroutine
-    creates futures attached to the parent loop, then awaiting them in the
-    worker loop fails with "attached to a different loop".
+    State of this month's voter snapshot — 'ready' once votes can be checked
+    against it, otherwise 'pending', 'building' or 'failed'. Never waits for
+    the build: the first request of a month (or the scheduled
+    `snapshot_governance` command) starts it in the background, and until
+    it is ready callers report the state instead of blocking.
     """
-    try:
-        running_loop = asyncio.get_running_loop()
-    except RuntimeError:
-        running_loop = None
+    # Once this month's snapshot is known to be ready, skip even the lookup.
+    # Shared cache only: a rebuild clears the epoch for every worker.
+    if epoch_is_current('governance_snapshot', month, local=False):
+        return GovernanceSnapshotJob.STATE_READY
+    return _snapshot_job(month).state
 
-    if running_loop is None:
-        return asyncio.run(coro_factory())
 
-    import concurrent.futures
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-        return pool.submit(lambda: asyncio.run(coro_factory())).result()
+def _snapshot_job(month) -> GovernanceSnapshotJob:
+    """This month's snapshot job, created as pending on first sight. Starts a
+    background build when the job needs one; never waits for it."""
+    job, _ = GovernanceSnapshotJob.objects.get_or_create(month=month)
+    if _snapshot_needs_build(job):
+        _trigger_snapshot_build(month)
+    return job
 
 
-def _ensure_snapshot(month):
-    """
-    Lazy snapshot: the first request to governance endpoints in a new month
-    triggers a fresh holder snapshot. Subsequent requests find rows already
-    present and skip the on-chain fetch.
-
-    Returns:
-        None on success (or when a snapshot already exists)
-        An error string when the lazy snapshot couldn't complete — useful for
-        surfacing the reason in the API response so the UI / debugger can see
-        why voting is still blocked.
-    """
-    if GovernanceVoterSnapshot.objects.filter(month=month).exists():
-        return None
+def _snapshot_needs_build(job) -> bool:
+    now = datetime.now(timezone.utc)
+    if job.state == GovernanceSnapshotJob.STATE_PENDING:
+        return True
+    if job.state == GovernanceSnapshotJob.STATE_FAILED:
+        failed_at = job.finished_at or job.updated_at
+        return (now - failed_at).total_seconds() >= _GOVERNANCE_SNAPSHOT_RETRY_SECONDS
+    if job.state == GovernanceSnapshotJob.STATE_BUILDING:
+        return (now - job.updated_at).total_seconds() >= _HOUSEKEEPING_LEASE_SECONDS
+    return False
+
+
+def _trigger_snapshot_build(month) -> None:
+    """Build the snapshot on a background thread unless this worker already
+    is. Across workers the lease in `build_governance_snapshot` lets only
+    one of them build."""
+    if not _GOVERNANCE_SNAPSHOT_LOCK.acquire(blocking=False):
+        return
+
+    def _run():
+        try:
+            build_governance_snapshot(month)
+        except Exception as e:  # never let a background failure escape
+            logger.warning("Background governance snapshot for %s failed: %s", month, e)
+        finally:
+            connection.close()
+            _GOVERNANCE_SNAPSHOT_LOCK.release()
 
     try:
-        from .injective_nft_holders import InjectiveHolders2
+        threading.Thread(
+            target=_run, daemon=True, name='governance-snapshot',
+        ).start()
+    except Exception:
+        _GOVERNANCE_SNAPSHOT_LOCK.release()
+        raise
 
-        async def _fetch():
-            # Construct *inside* the loop so gRPC futures bind to it.
-            return await InjectiveHolders2().fetch_holder_nft(PEDRO_NFT_CONTRACT)
 
-        data = _run_async(_fetch)
-    except Exception as e:
-        logger.error(
-            "Lazy snapshot for %s failed: %s", month, e, exc_info=True,
+def build_governance_snapshot(month, replace=False):
+    """
+    Build `month`'s GovernanceVoterSnapshot while holding the cluster-wide
+    snapshot lease, recording state, progress and duration on its
+    GovernanceSnapshotJob. Returns the job, or None when another worker
+    holds the lease. A ready snapshot is left alone unless `replace`.
+
+    The snapshot is a frozen copy of the current Pedro NFT holder snapshot
+    (the one the game and raffle read, kept fresh by `refresh_nft_holders`),
+    so voting power always matches what the rest of the site shows and no
+    second chain scan is needed.
+    """
+    with hold_lease(f'governance_snapshot:{month}', _HOUSEKEEPING_LEASE_SECONDS) as lease:
+        if lease is None:
+            return None
+        job, _ = GovernanceSnapshotJob.objects.get_or_create(month=month)
+        if job.state == GovernanceSnapshotJob.STATE_READY and not replace:
+            return job
+
+        # Votes stop being checked against the snapshot before any of its
+        # rows go; the epoch is set again only once the rebuild committed.
+        clear_epoch('governance_snapshot', month)
+        started = time.monotonic()
+        job.state = GovernanceSnapshotJob.STATE_BUILDING
+        job.attempts += 1
+        job.started_at = datetime.now(timezone.utc)
+        job.finished_at = None
+        job.duration_ms = None
+        job.error = ''
+        job.rows_written = 0
+        job.rows_total = None
+        job.save()
+        try:
+            # Old rows out and the copy in, in one transaction: readers of a
+            # replaced snapshot never see it half-written.
+            with transaction.atomic():
+                source, eligible, written = _take_governance_snapshot(month)
+                if not lease_is_current(lease):
+                    raise RolloverLeaseLost(f"governance snapshot lease lost while building {month}")
+            totals = (
+                GovernanceVoterSnapshot.objects
+                .filter(month=month)
+                .aggregate(power=Sum('nft_count'))
+            )
+            job.nft_snapshot_id = source.id
+            job.nft_snapshot_at = source.created_at
+            job.rows_total = eligible
+            job.rows_written = written
+            job.state = GovernanceSnapshotJob.STATE_READY
+            job.voters = written
+            job.voting_power = totals['power'] or 0
+        except Exception as e:
+            logger.error("Governance snapshot for %s failed: %s", month, e, exc_info=True)
+            job.state = GovernanceSnapshotJob.STATE_FAILED
+            job.error = str(e)
+        job.finished_at = datetime.now(timezone.utc)
+        job.duration_ms = int((time.monotonic() - started) * 1000)
+        job.save()
+        if job.state == GovernanceSnapshotJob.STATE_READY:
+            mark_epoch('governance_snapshot', month)
+        return job
+
+
+def _take_governance_snapshot(month) -> tuple[PedroNftSnapshot, int, int]:
+    """Replace `month`'s GovernanceVoterSnapshot rows with the holders of the
+    newest PedroNftSnapshot, minus GOVERNANCE_EXCLUDED_ADDRESSES, in a single
+    INSERT ... SELECT — no row passes through Python. Returns (source
+    snapshot, eligible holders, rows written). Raises when there is no
+    fresh holder snapshot, it has no eligible holder, or the copy came out
+    short (the source was dropped by a refresh meanwhile); the caller's
+    transaction then rolls the month back to its previous rows. Call
+    inside a transaction."""
+    source = PedroNftSnapshot.objects.order_by('-id').first()
+    if source is None:
+        raise RuntimeError("no NFT holder snapshot yet — run refresh_nft_holders")
+    if not _nft_snapshot_is_fresh({'created_at': source.created_at}):
+        # Voting power must be the holders as of now; the retry gets a new one.
+        _trigger_async_holder_refresh()
+        raise RuntimeError(
+            f"NFT holder snapshot #{source.id} is stale (taken {source.created_at:%Y-%m-%d %H:%M} UTC)"
+        )
+    holdings = (
+        PedroNftHolding.objects
+        .filter(snapshot=source, count__gt=0)
+        .exclude(address__in=GOVERNANCE_EXCLUDED_ADDRESSES)
+    )
+    eligible = holdings.count()
+    if not eligible:
+        raise RuntimeError(f"NFT holder snapshot #{source.id} has no eligible holders")
+
+    GovernanceVoterSnapshot.objects.filter(month=month).delete()
+    qn = connection.ops.quote_name
+    target = GovernanceVoterSnapshot._meta
+    holding = PedroNftHolding._meta
+    columns = ', '.join(
+        qn(target.get_field(name).column)
+        for name in ('month', 'address', 'nft_count', 'captured_at')
+    )
+    excluded = sorted(GOVERNANCE_EXCLUDED_ADDRESSES)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {qn(target.db_table)} ({columns}) "
+            f"SELECT %s, {qn(holding.get_field('address').column)}, "
+            f"{qn(holding.get_field('count').column)}, %s "
+            f"FROM {qn(holding.db_table)} "
+            f"WHERE {qn(holding.get_field('snapshot').column)} = %s "
+            f"AND {qn(holding.get_field('count').column)} > 0 "
+            f"AND {qn(holding.get_field('address').column)} NOT IN ({', '.join(['%s'] * len(excluded))})",
+            [month, datetime.now(timezone.utc), source.id, *excluded],
         )
-        return f"on-chain fetch failed: {e}"
+        written = cursor.rowcount
+    if written != eligible:
+        raise RuntimeError(
+            f"copied {written} of {eligible} holders from NFT snapshot #{source.id}; "
+            "it changed during the copy"
+        )
+    return source, eligible, written
 
-    rows = []
-    for h in data.get('holders') or []:
-        owner = h.get('owner')
-        total = h.get('total')
-        if not owner or owner in GOVERNANCE_EXCLUDED_ADDRESSES:
-            continue
-        try:
-            count = int(total)
-        except (TypeError, ValueError):
-            continue
-        if count <= 0:
-            continue
-        rows.append(GovernanceVoterSnapshot(month=month, address=owner, nft_count=count))
 
-    if not rows:
-        return "no holders returned by on-chain fetch"
+def _snapshot_not_ready(state: str) -> tuple[int, dict]:
+    return 409, {
+        'error': 'Voter snapshot for this month is not ready yet, try again shortly',
+        'snapshot_state': state,
+    }
 
-    GovernanceVoterSnapshot.objects.bulk_create(
-        rows,
-        ignore_conflicts=True,
-        batch_size=500,
-    )
-    return None
+
+def _is_snapshot_not_ready(status: int, body: dict) -> bool:
+    """For the submission worker: a `_snapshot_not_ready` answer is retried
+    later instead of stored as the outcome."""
+    return status == 409 and 'snapshot_state' in body
 
 def json_response(data, status=200):
     return JsonResponse(data, safe=False, status=status)
@@ -747,33 +1251,32 @@ async def Injective_cw20(request, address):
     except Exception as e:
         return json_response({'error': str(e)}, status=500)
 
-_TOKEN_INFO_CACHE = {'data': None, 'ts': 0.0}
 _TOKEN_INFO_CACHE_TTL = 60  # seconds
+# Shared across workers, so one of them rebuilds per TTL instead of each.
+_TOKEN_INFO_CACHE = TieredCache('token_info', ttl=_TOKEN_INFO_CACHE_TTL, max_entries=1)
 _TOKEN_INFO_LOCK = asyncio.Lock()
 
 async def token_info_view(request):
-    now = time.time()
-    cached = _TOKEN_INFO_CACHE['data']
-    if cached is not None and now - _TOKEN_INFO_CACHE['ts'] < _TOKEN_INFO_CACHE_TTL:
+    cached = await _TOKEN_INFO_CACHE.aget('all')
+    if cached is not None:
         return json_response(cached)
 
     async with _TOKEN_INFO_LOCK:
         # Re-check after acquiring the lock so concurrent callers don't all refresh.
-        now = time.time()
-        cached = _TOKEN_INFO_CACHE['data']
-        if cached is not None and now - _TOKEN_INFO_CACHE['ts'] < _TOKEN_INFO_CACHE_TTL:
+        cached = await _TOKEN_INFO_CACHE.aget('all')
+        if cached is not None:
             return json_response(cached)
 
         try:
             token = InjectiveTokenInfo()
             info = await token.circulation_supply()
-            _TOKEN_INFO_CACHE['data'] = info
-            _TOKEN_INFO_CACHE['ts'] = time.time()
+            await _TOKEN_INFO_CACHE.aset('all', info)
             return json_response(info)
         except Exception as e:
             # Serve stale data if we have any, rather than a hard error.
-            if cached is not None:
-                return json_response(cached)
+            stale = _TOKEN_INFO_CACHE.peek('all')
+            if stale is not None:
+                return json_response(stale)
             return json_response({'error': str(e)}, status=500)
 
 _HOLDERS_CACHE = {}            # (native, cw20) -> {'data': bytes, 'ts': float}
@@ -961,19 +1464,57 @@ def game_submit_score(request):
         request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')[0].strip()
         or request.META.get('REMOTE_ADDR', '')
     )
-    ok, reason = GameVerifier.verify_captcha(captcha_token, remote_ip)
-    if not ok:
-        return json_response({'error': f'Captcha failed: {reason}'}, status=400)
+    payload = {'address': address, 'name': name, 'score': score, 'tx_hash': tx_hash}
 
+    if wants_async(request):
+        # The captcha token is single-use and expires within minutes, so it
+        # is checked now; only the burn lookup is left to the worker.
+        ok, reason = GameVerifier.verify_captcha(captcha_token, remote_ip)
+        if not ok:
+            return json_response({'error': f'Captcha failed: {reason}'}, status=400)
+        return _accept_submission(PendingSubmission.KIND_GAME_SCORE, payload)
+
+    # Captcha and burn lookup hit two different upstreams; run them side by
+    # side under one deadline and bail out on the first failure.
     # The game charges 0.1 $PEDRO per score submission (fractional burn).
+    check = verify_submission({
+        'captcha': lambda timeout: GameVerifier.verify_captcha(
+            captcha_token, remote_ip, timeout=timeout,
+        ),
+        'burn': lambda timeout: GameVerifier.verify_pedro_burn(
+            tx_hash, address, expected_amount_wei=TENTH_PEDRO_WEI, timeout=timeout,
+        ),
+    })
+    if not check.ok:
+        prefix = 'Captcha failed' if check.failed == 'captcha' else 'Burn verification failed'
+        response = json_response({'error': f'{prefix}: {check.reason}'}, status=400)
+        response['Server-Timing'] = check.server_timing()
+        return response
+
+    status, data = _apply_game_score(payload)
+    response = json_response(data, status=status)
+    response['Server-Timing'] = check.server_timing()
+    return response
+
+
+def _process_game_score(payload):
+    """Worker half of an accepted score submission (captcha already passed)."""
     ok, reason = GameVerifier.verify_pedro_burn(
-        tx_hash, address, expected_amount_wei=TENTH_PEDRO_WEI,
+        payload['tx_hash'], payload['address'], expected_amount_wei=TENTH_PEDRO_WEI,
     )
     if not ok:
-        return json_response({'error': f'Burn verification failed: {reason}'}, status=400)
+        return 400, {'error': f'Burn verification failed: {reason}'}
+    return _apply_game_score(payload)
+
+
+def _apply_game_score(payload):
+    address = payload['address']
+    name = payload['name']
+    score = payload['score']
+    tx_hash = payload['tx_hash']
 
     current_month = _current_month()
-    _ensure_month_rolled_over(current_month)
+    month = _submission_month(payload)
 
     # If the wallet has submitted before, force the original display name so
     # everyone sees consistent identity across submissions / steal targeting.
@@ -982,15 +1523,20 @@ def game_submit_score(request):
         name = locked
 
     try:
-        entry = GameLeaderboardEntry.objects.create(
-            address=address,
-            name=name,
-            score=score,
-            tx_hash=tx_hash,
-            month=current_month,
-        )
+        with transaction.atomic():
+            entry = GameLeaderboardEntry.objects.create(
+                address=address,
+                name=name,
+                score=score,
+                tx_hash=tx_hash,
+                month=month,
+            )
+            _record_month_best(entry)
     except IntegrityError:
-        return json_response({'error': 'Tx hash already used'}, status=409)
+        return 409, {'error': 'Tx hash already used'}
+    # After the entry, so a score accepted in the month that just ended is
+    # on the board when that month's winner is recorded.
+    _ensure_month_rolled_over(current_month)
 
     # First submission for this wallet locks the display name forever — even
     # after monthly resets wipe their levels, the canonical name stays.
@@ -1005,63 +1551,63 @@ def game_submit_score(request):
 
     # Bank the submitted score into the wallet's persisted "saved" score so
     # the next page load reflects what was just submitted. Upgrades / steal
-    # spend from this same field, so it has to stay in sync with leaderboard
+    # spend from this same score, so it has to stay in sync with leaderboard
     # submits. We never lower it here — a stale resubmission won't erase a
-    # higher saved score earned via stealing.
-    GameUpgradeState.objects.filter(address=address, score__lte=score).update(
-        score=score,
-    )
+    # higher live score earned via stealing or idle income. A score from a
+    # month that has since ended stays out of the new month's game.
+    if month == current_month:
+        _flush_game_sync(address)
+        with transaction.atomic():
+            state = GameUpgradeState.objects.select_for_update().get(address=address)
+            now = datetime.now(timezone.utc)
+            if _state_live_score(state, now) <= score:
+                GameUpgradeState.objects.filter(pk=state.pk).update(
+                    score_base=score, accrual_started_at=now, updated_at=now,
+                )
+        _invalidate_sync_base(address)
+    _bump_game_board_generation()
 
-    return json_response({
+    return 200, {
         'ok': True,
         'id': entry.id,
         'month': entry.month,
         'name': entry.name,
-    })
+    }
 
 
-def game_leaderboard(request):
-    month = _current_month()
+def _game_leaderboard_payload(month: str) -> dict:
     _ensure_month_rolled_over(month)
-    # Dedup by address — only keep the highest score per wallet. Because the
-    # base queryset is already sorted by score desc, the first time we see an
-    # address is also its highest entry for the month.
-    qs = (
-        GameLeaderboardEntry.objects
-        .filter(month=month)
-        .order_by('-score', 'submitted_at')
-    )
-    seen = set()
-    deduped = []
-    for entry in qs:
-        if entry.address in seen:
-            continue
-        seen.add(entry.address)
-        deduped.append(entry)
-        if len(deduped) >= 50:
-            break
-
-    # Use the canonical (first-submitted) name for every row so a wallet that
-    # has submitted under different names in the past still shows up under
-    # its original identity.
-    locked = {addr: _locked_name_for(addr) for addr in seen}
-    return json_response({
+    return {
         'month': month,
         'entries': [
             {
-                'name': locked.get(e.address) or e.name,
-                'address': e.address,
-                'score': e.score,
-                'tx_hash': e.tx_hash,
-                'submitted_at': e.submitted_at.isoformat(),
+                'name': row.display_name,
+                'address': row.address,
+                'score': row.best_score,
+                'tx_hash': row.best_tx,
+                'submitted_at': row.best_at.isoformat(),
             }
-            for e in deduped
+            for row in _month_board(month)[:50]
         ],
-    })
+    }
 
 
-def game_hall_of_fame(request):
-    current = _current_month()
+def game_leaderboard(request):
+    """Top 50 wallets of the month, one row per wallet at its best score,
+    under its canonical (first-submitted) name. Served from the game board
+    cache with an ETag. `?address=inj1...` adds that wallet's own standing
+    as `me` (null when it hasn't submitted); that variant is per-wallet and
+    built fresh."""
+    address = (request.GET.get('address') or '').strip()
+    if not address:
+        return _game_board_response(request, 'leaderboard', _game_leaderboard_payload)
+    month = _current_month()
+    data = _game_leaderboard_payload(month)
+    data['me'] = _game_rank(month, address)
+    return json_response(data)
+
+
+def _game_hall_of_fame_payload(current: str) -> dict:
     # Trigger the lazy snapshot in case this is the first request of a new
     # month — otherwise the just-ended month's winner wouldn't appear yet.
     _ensure_month_rolled_over(current)
@@ -1085,7 +1631,11 @@ def game_hall_of_fame(request):
         }
         for p in payouts
     ]
-    return json_response({'winners': winners})
+    return {'winners': winners}
+
+
+def game_hall_of_fame(request):
+    return _game_board_response(request, 'hall_of_fame', _game_hall_of_fame_payload)
 
 
 def game_upgrades_get(request, address):
@@ -1093,6 +1643,7 @@ def game_upgrades_get(request, address):
     if not address.startswith('inj1'):
         return json_response({'error': 'Invalid address'}, status=400)
     current_month = _current_month()
+    _flush_game_sync(address)
     try:
         state = GameUpgradeState.objects.get(address=address)
         _reset_upgrade_state_if_needed(state, current_month)
@@ -1101,7 +1652,7 @@ def game_upgrades_get(request, address):
             'click_level': state.click_level,
             'auto_level': state.auto_level,
             'steal_level': state.steal_level,
-            'score': state.score,
+            'score': _state_live_score(state),
             'last_steal_at': state.last_steal_at.isoformat() if state.last_steal_at else None,
             'locked_name': state.locked_name,
             'updated_at': state.updated_at.isoformat(),
@@ -1147,13 +1698,19 @@ def game_upgrades_set(request):
         return json_response({'error': 'Invalid score'}, status=400)
 
     current_month = _current_month()
+    # A full-state write supersedes any buffered deltas.
+    _discard_game_sync(address)
+    # The client's score already includes what its auto level earned, so it
+    # becomes the new base and accrual restarts from now.
+    now = datetime.now(timezone.utc)
     state, created = GameUpgradeState.objects.get_or_create(
         address=address,
         defaults={
             'click_level': click_level,
             'auto_level': auto_level,
             'steal_level': steal_level,
-            'score': score,
+            'score_base': score,
+            'accrual_started_at': now,
             'current_month': current_month,
         },
     )
@@ -1167,13 +1724,337 @@ def game_upgrades_set(request):
         state.click_level = click_level
         state.auto_level = auto_level
         state.steal_level = steal_level
-        state.score = score
+        state.score_base = score
+        state.accrual_started_at = now
         state.save(update_fields=[
-            'click_level', 'auto_level', 'steal_level', 'score', 'updated_at',
+            'click_level', 'auto_level', 'steal_level', 'score_base',
+            'accrual_started_at', 'updated_at',
         ])
     return json_response({'ok': True})
 
 
+# ---------------------------------------------------------------------------
+# Upgrade sync: coalesced deltas behind a write-behind buffer
+# ---------------------------------------------------------------------------
+#
+# Auto-mining moves the score every second, and /game/upgrades/ wrote the
+# whole client state to GameUpgradeState on every call. /game/upgrades/sync/
+# takes what changed since the client's last sync instead, numbered by a
+# client sequence:
+#
+#     {"address": "inj1...", "seq": 42,
+#      "deltas": {"score": 1830, "click_level": 1}}
+#
+# Score deltas are what the player earned by hand (clicks) or spent; idle
+# income from auto_level accrues server-side (_live_score) and must not be
+# sent. Deltas accumulate in the worker's in-memory buffer for the wallet and
+# reach GameUpgradeState once they are GAME_SYNC_FLUSH_SECONDS old, or at once
+# on an upgrade purchase or a score move of 10%+. A sync that doesn't flush
+# writes nothing and locks no row; it only reads the cached copy of the state
+# row. A batch whose seq isn't above the last one seen (still buffered, or
+# flushed into the row's `sync_seq`) is a retry and is ignored. Each response
+# is the authoritative state: the table row plus whatever is still buffered.
+#
+# Each wallet's buffer has its own thread lock, so syncs and flushes of one
+# wallet queue and different wallets never wait on each other. The flush
+# rebases the state row under its row lock — live score plus deltas becomes
+# the new base — so steals and score submits that wrote the row meanwhile are
+# kept. Those paths flush the buffer first so they act on the buffered score
+# too. A buffer with nothing pending is dropped, so memory only holds wallets
+# that have unflushed deltas.
+#
+# Buffers belong to one worker process. Each serving worker runs a flush
+# thread for players who stopped syncing (start_game_sync_flusher, from
+# MyappConfig.ready) and flushes everything pending when it exits; a killed
+# worker loses at most GAME_SYNC_FLUSH_SECONDS of deltas. When several workers
+# serve one wallet, each buffers and flushes its own share, so every delta
+# still lands once, but a response only counts the buffer of the worker that
+# answered it and a retry that reaches another worker before the first one
+# flushed is counted again.
+
+_SYNC_FIELDS = ('score', 'click_level', 'auto_level', 'steal_level')
+_SYNC_LEVEL_CAPS = {
+    'click_level': GAME_MAX_LEVEL,
+    'auto_level': GAME_MAX_LEVEL,
+    'steal_level': STEAL_MAX_LEVEL,
+}
+# A buffered score move at least this share of the saved score flushes at once.
+_SYNC_SIGNIFICANT_SCORE_SHARE = 0.10
+_SYNC_SIGNIFICANT_SCORE_FLOOR = 10_000
+_SYNC_BASE_TTL = 300  # seconds the cached copy of the row is trusted
+
+
+@dataclasses.dataclass(eq=False)
+class _SyncBuffer:
+    """One wallet's pending deltas in this worker, read and written under
+    `lock`. `retired` is set when the buffer is dropped from _SYNC_BUFFERS,
+    so a thread that was waiting on its lock looks the wallet up again."""
+    month: str
+    seq: int = 0  # last client sequence accepted into this buffer
+    score: int = 0
+    click_level: int = 0
+    auto_level: int = 0
+    steal_level: int = 0
+    dirty_since: datetime | None = None
+    retired: bool = False
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock, repr=False)
+
+
+_SYNC_BUFFERS: dict[str, _SyncBuffer] = {}
+_SYNC_BUFFERS_LOCK = threading.Lock()  # guards the dict, not the buffers in it
+_SYNC_FLUSHER_PID: int | None = None
+
+
+def _sync_key(kind: str, address: str) -> str:
+    return f'game_sync:{kind}:{address}'
+
+
+def _sync_flush_seconds() -> float:
+    return float(getattr(settings, 'GAME_SYNC_FLUSH_SECONDS', 30))
+
+
+@contextlib.contextmanager
+def _locked_sync_buffer(address: str, month: str, create: bool = True):
+    """The wallet's buffer, locked for the `with` block — or None if it has
+    none and `create` is false. Deltas left from an earlier month are
+    dropped; a buffer left with nothing pending is dropped afterwards."""
+    while True:
+        with _SYNC_BUFFERS_LOCK:
+            buf = _SYNC_BUFFERS.get(address)
+            if buf is None and create:
+                buf = _SYNC_BUFFERS[address] = _SyncBuffer(month)
+        if buf is None:
+            yield None
+            return
+        with buf.lock:
+            if buf.retired:
+                continue
+            if buf.month != month:
+                _clear_sync_buffer(buf)
+                buf.month = month
+                buf.seq = 0
+            yield buf
+            if buf.dirty_since is None:
+                buf.retired = True
+                with _SYNC_BUFFERS_LOCK:
+                    if _SYNC_BUFFERS.get(address) is buf:
+                        del _SYNC_BUFFERS[address]
+            return
+
+
+def _sync_pending(buf: _SyncBuffer) -> dict:
+    return {field: getattr(buf, field) for field in _SYNC_FIELDS}
+
+
+def _clear_sync_buffer(buf: _SyncBuffer) -> None:
+    for field in _SYNC_FIELDS:
+        setattr(buf, field, 0)
+    buf.dirty_since = None
+
+
+def _sync_base(address: str, month: str, refresh: bool = False) -> dict:
+    """The wallet's GameUpgradeState as of the last read, cached briefly
+    (`refresh` reads it again). A row from a past month reads as the zeros
+    it is about to be reset to."""
+    key = _sync_key('base', address)
+    base = None if refresh else cache.get(key)
+    if base is not None and base['month'] == month:
+        return base
+    fields = ('score_base', 'accrual_started_at', *_SYNC_LEVEL_CAPS)
+    row = (
+        GameUpgradeState.objects
+        .filter(address=address)
+        .values(*fields, 'current_month', 'sync_seq')
+        .first()
+    )
+    current = row is not None and row['current_month'] == month
+    base = {'month': month, 'sync_seq': row['sync_seq'] if row else 0}
+    for field in fields:
+        base[field] = row[field] if current else (None if field == 'accrual_started_at' else 0)
+    cache.set(key, base, _SYNC_BASE_TTL)
+    return base
+
+
+def _invalidate_sync_base(address: str) -> None:
+    cache.delete(_sync_key('base', address))
+
+
+def _base_live_score(base: dict) -> int:
+    return _live_score(base['score_base'], base['auto_level'], base['accrual_started_at'])
+
+
+def _sync_state(base: dict, pending: dict) -> dict:
+    state = {'score': min(GAME_MAX_SCORE, max(0, _base_live_score(base) + pending['score']))}
+    for field, cap in _SYNC_LEVEL_CAPS.items():
+        state[field] = min(cap, base[field] + pending[field])
+    return state
+
+
+def _sync_flush_due(buf: _SyncBuffer, base: dict) -> bool:
+    if any(getattr(buf, field) for field in _SYNC_LEVEL_CAPS):
+        return True  # an upgrade was bought
+    threshold = _SYNC_SIGNIFICANT_SCORE_SHARE * max(_base_live_score(base), _SYNC_SIGNIFICANT_SCORE_FLOOR)
+    if abs(buf.score) >= threshold:
+        return True
+    age = datetime.now(timezone.utc) - buf.dirty_since
+    return age.total_seconds() >= _sync_flush_seconds()
+
+
+def _flush_sync_buffer(address: str, buf: _SyncBuffer) -> None:
+    """Write `buf`'s pending deltas to GameUpgradeState and clear them.
+    The caller holds `buf.lock`; if the write fails the deltas stay."""
+    pending = _sync_pending(buf)
+    with transaction.atomic():
+        state, _ = (
+            GameUpgradeState.objects
+            .select_for_update()
+            .get_or_create(address=address, defaults={'current_month': buf.month})
+        )
+        _reset_upgrade_state_if_needed(state, buf.month)
+        now = datetime.now(timezone.utc)
+        score = _state_live_score(state, now) + pending['score']
+        changes = {
+            'score_base': min(GAME_MAX_SCORE, max(0, score)),
+            'accrual_started_at': now,
+            'sync_seq': max(state.sync_seq, buf.seq),
+            'updated_at': now,
+        }
+        for field, cap in _SYNC_LEVEL_CAPS.items():
+            changes[field] = min(cap, getattr(state, field) + pending[field])
+        GameUpgradeState.objects.filter(pk=state.pk).update(**changes)
+        transaction.on_commit(lambda: _invalidate_sync_base(address))
+    _clear_sync_buffer(buf)
+
+
+def _apply_game_sync(address: str, seq: int, deltas: dict) -> dict:
+    month = _current_month()
+    with _locked_sync_buffer(address, month) as buf:
+        base = _sync_base(address, month)
+        applied = seq > max(buf.seq, base['sync_seq'])
+        if applied:
+            for field, delta in deltas.items():
+                setattr(buf, field, getattr(buf, field) + delta)
+            buf.seq = seq
+            if buf.dirty_since is None:
+                buf.dirty_since = datetime.now(timezone.utc)
+        flushed = False
+        if buf.dirty_since is not None and _sync_flush_due(buf, base):
+            _flush_sync_buffer(address, buf)
+            base = _sync_base(address, month, refresh=True)
+            flushed = True
+        return {
+            'ok': True,
+            'address': address,
+            'applied': applied,
+            'seq': max(buf.seq, base['sync_seq']),
+            **_sync_state(base, _sync_pending(buf)),
+            'flushed': flushed,
+            'buffered': buf.dirty_since is not None,
+        }
+
+
+def _flush_game_sync(address: str) -> None:
+    """Write `address`'s buffered deltas now, before a path that reads or
+    replaces its saved score. A dict lookup when nothing is buffered."""
+    with _locked_sync_buffer(address, _current_month(), create=False) as buf:
+        if buf is not None and buf.dirty_since is not None:
+            _flush_sync_buffer(address, buf)
+
+
+def _discard_game_sync(address: str) -> None:
+    """Drop buffered deltas for `address`; its state was just replaced."""
+    with _locked_sync_buffer(address, _current_month(), create=False) as buf:
+        if buf is not None:
+            _clear_sync_buffer(buf)
+    _invalidate_sync_base(address)
+
+
+def flush_due_game_syncs(force: bool = False) -> int:
+    """Flush this worker's buffers whose deltas are due (all of them with
+    `force`), for players who stopped syncing. Returns how many were
+    flushed."""
+    month = _current_month()
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=_sync_flush_seconds())
+    with _SYNC_BUFFERS_LOCK:
+        addresses = list(_SYNC_BUFFERS)
+    flushed = 0
+    for address in addresses:
+        try:
+            with _locked_sync_buffer(address, month, create=False) as buf:
+                # Re-checked under the lock: its own request may have flushed it.
+                if buf is None or buf.dirty_since is None:
+                    continue
+                if not force and buf.dirty_since > cutoff:
+                    continue
+                _flush_sync_buffer(address, buf)
+                flushed += 1
+        except Exception as e:
+            logger.warning("Flushing buffered game sync for %s failed: %s", address, e)
+    return flushed
+
+
+def _run_game_sync_flusher() -> None:
+    while True:
+        time.sleep(_sync_flush_seconds() / 2)
+        close_old_connections()
+        flushed = flush_due_game_syncs()
+        if flushed:
+            logger.info("Flushed %d buffered game sync(s)", flushed)
+
+
+def start_game_sync_flusher() -> None:
+    """Start this worker's flush thread, once per process, and flush every
+    pending buffer when the worker exits. Called from MyappConfig.ready()
+    in processes that serve web traffic."""
+    global _SYNC_FLUSHER_PID
+    pid = os.getpid()
+    with _SYNC_BUFFERS_LOCK:
+        if _SYNC_FLUSHER_PID == pid:
+            return
+        _SYNC_FLUSHER_PID = pid
+    threading.Thread(
+        target=_run_game_sync_flusher, daemon=True, name='game-sync-flush',
+    ).start()
+    atexit.register(flush_due_game_syncs, force=True)
+
+
+@csrf_exempt
+def game_upgrades_sync(request):
+    """Batched upgrade / score sync. Body:
+    { address: 'inj1...', seq: <int, increasing per client>,
+      deltas: { score: <int>, click_level: <int >= 0>, ... } }
+    Answers the authoritative state with `applied: false` when `seq` was
+    already seen (a retry, or another tab that got ahead — adopt the
+    returned state and `seq`)."""
+    if request.method != 'POST':
+        return json_response({'error': 'POST only'}, status=405)
+    try:
+        body = json.loads(request.body.decode('utf-8'))
+    except json.JSONDecodeError:
+        return json_response({'error': 'Invalid JSON'}, status=400)
+
+    address = (body.get('address') or '').strip()
+    seq = body.get('seq')
+    deltas = body.get('deltas') or {}
+
+    if not address.startswith('inj1'):
+        return json_response({'error': 'Invalid address'}, status=400)
+    if not isinstance(seq, int) or seq < 1:
+        return json_response({'error': 'Invalid seq'}, status=400)
+    if not isinstance(deltas, dict) or set(deltas) - set(_SYNC_FIELDS):
+        return json_response({'error': 'Invalid deltas'}, status=400)
+    for field, delta in deltas.items():
+        if not isinstance(delta, int) or isinstance(delta, bool):
+            return json_response({'error': f'Invalid {field} delta'}, status=400)
+        if field == 'score' and abs(delta) > GAME_MAX_SCORE:
+            return json_response({'error': 'Invalid score delta'}, status=400)
+        if field != 'score' and not 0 <= delta <= _SYNC_LEVEL_CAPS[field]:
+            return json_response({'error': f'Invalid {field} delta'}, status=400)
+
+    _ensure_month_rolled_over(_current_month())
+    return json_response(_apply_game_sync(address, seq, deltas))
+
+
 def game_nft_status(request, address):
     """Returns the wallet's Pedro NFT count and whether they're crit-eligible.
     Holding one NFT enables the same crit chance as holding many — only
@@ -1214,81 +2095,128 @@ def game_steal(request):
     if attacker_addr == target_addr:
         return json_response({'error': "You can't steal from yourself"}, status=400)
 
-    current_month = _current_month()
-    _ensure_month_rolled_over(current_month)
-    attacker, attacker_created = GameUpgradeState.objects.get_or_create(
-        address=attacker_addr,
-        defaults={'current_month': current_month},
-    )
-    if not attacker_created:
-        _reset_upgrade_state_if_needed(attacker, current_month)
-    try:
-        target = GameUpgradeState.objects.get(address=target_addr)
-    except GameUpgradeState.DoesNotExist:
-        return json_response({'error': 'Target has no game state'}, status=404)
-    _reset_upgrade_state_if_needed(target, current_month)
+    _ensure_month_rolled_over(_current_month())
+    # NFT crit — Pedro NFT holders get random 2×/5×/10× steal hits. Holding
+    # a single NFT is enough; holding more does NOT improve odds. Rolled
+    # before the transaction so no row lock is held across the lookup.
+    nft_count = _fetch_pedro_nft_count(attacker_addr)
+    crit_multiplier = _roll_nft_crit() if nft_count >= 1 else 1
 
-    # Cooldown: time since last steal must exceed STEAL_COOLDOWN_SECONDS.
-    now = datetime.now(timezone.utc)
-    if attacker.last_steal_at:
-        elapsed = (now - attacker.last_steal_at).total_seconds()
-        if elapsed < STEAL_COOLDOWN_SECONDS:
-            wait = int(STEAL_COOLDOWN_SECONDS - elapsed) + 1
-            return json_response(
-                {'error': f'Cooldown — try again in {wait}s'},
-                status=429,
+    # Steal from, and credit, the scores including any buffered sync deltas.
+    _flush_game_sync(attacker_addr)
+    _flush_game_sync(target_addr)
+
+    status, data = _execute_steal(attacker_addr, target_addr, crit_multiplier)
+    return json_response(data, status=status)
+
+
+def _execute_steal(attacker_addr: str, target_addr: str, crit_multiplier: int = 1,
+                   cooldown_seconds: int = STEAL_COOLDOWN_SECONDS) -> tuple[int, dict]:
+    """Apply one steal as a single transaction and return (status, body).
+
+    Both players' GameUpgradeState rows are locked (SELECT ... FOR UPDATE)
+    in address order, so concurrent steals touching the same wallet queue up
+    instead of overwriting each other's score, and two steals between the
+    same pair in opposite directions can't deadlock. The score move, the
+    leaderboard shift and the log row then commit together. Each write
+    covers both wallets with one UPDATE, for about seven statements in all.
+    `cooldown_seconds` is only overridden by the steal benchmark."""
+    current_month = _current_month()
+    pair = (attacker_addr, target_addr)
+    with transaction.atomic():
+        GameUpgradeState.objects.get_or_create(
+            address=attacker_addr,
+            defaults={'current_month': current_month},
+        )
+        states = {
+            state.address: state
+            for state in (
+                GameUpgradeState.objects
+                .select_for_update()
+                .filter(address__in=pair)
+                .order_by('address')
             )
+        }
+        # Read the clock under the lock, after any steal it waited on.
+        now = datetime.now(timezone.utc)
+        attacker = states[attacker_addr]
+        target = states.get(target_addr)
+        if target is None:
+            return 404, {'error': 'Target has no game state'}
+        _reset_upgrade_state_if_needed(attacker, current_month)
+        _reset_upgrade_state_if_needed(target, current_month)
+
+        # Cooldown: time since last steal must exceed the cooldown.
+        if attacker.last_steal_at:
+            elapsed = (now - attacker.last_steal_at).total_seconds()
+            if elapsed < cooldown_seconds:
+                wait = int(cooldown_seconds - elapsed) + 1
+                return 429, {'error': f'Cooldown — try again in {wait}s'}
+
+        target_live = _state_live_score(target, now)
+        if target_live <= 0:
+            return 400, {'error': 'Target has no points to steal'}
+
+        steal_amount = STEAL_BASE_AMOUNT * (2 ** attacker.steal_level) * crit_multiplier
+        actual = min(steal_amount, target_live)
+        attacker_score = min(GAME_MAX_SCORE, _state_live_score(attacker, now) + actual)
+        target_score = target_live - actual
+
+        # The rows are locked, so writing the computed scores is safe. Both
+        # are rebased: idle income so far is folded into the base.
+        GameUpgradeState.objects.filter(address__in=pair).update(
+            score_base=Case(
+                When(address=attacker_addr, then=Value(attacker_score)),
+                default=Value(target_score),
+                output_field=BigIntegerField(),
+            ),
+            accrual_started_at=now,
+            last_steal_at=Case(
+                When(address=attacker_addr, then=Value(now)),
+                default=F('last_steal_at'),
+                output_field=DateTimeField(),
+            ),
+            updated_at=now,
+        )
 
-    if target.score <= 0:
-        return json_response(
-            {'error': 'Target has no points to steal'},
-            status=400,
+        # Reflect the steal on the public leaderboard immediately so a steal
+        # moves both players' standings without anyone re-submitting (and
+        # re-burning). Each existing current-month entry shifts by exactly the
+        # stolen amount — NOT by copying the live score, which also holds
+        # un-burned clicking gains. Rows are only updated, never created:
+        # getting onto the board still requires a paid 0.1 PEDRO burn, which
+        # supplies the unique tx_hash an entry needs. Every entry moves by the
+        # same amount, so each wallet's GameMonthBest does too.
+        GameLeaderboardEntry.objects.filter(month=current_month, address__in=pair).update(
+            score=Case(
+                When(address=attacker_addr, then=F('score') + actual),
+                default=Greatest(F('score') - actual, 0),
+            ),
+        )
+        GameMonthBest.objects.filter(month=current_month, address__in=pair).update(
+            best_score=Case(
+                When(address=attacker_addr, then=F('best_score') + actual),
+                default=Greatest(F('best_score') - actual, 0),
+            ),
         )
 
-    base_amount = STEAL_BASE_AMOUNT * (2 ** attacker.steal_level)
-    # NFT crit — Pedro NFT holders get random 2×/5×/10× steal hits. Holding
-    # a single NFT is enough; holding more does NOT improve odds.
-    nft_count = _fetch_pedro_nft_count(attacker_addr)
-    crit_multiplier = _roll_nft_crit() if nft_count >= 1 else 1
-    steal_amount = base_amount * crit_multiplier
-    actual = min(steal_amount, target.score)
-
-    target.score -= actual
-    attacker.score = min(GAME_MAX_SCORE, attacker.score + actual)
-    attacker.last_steal_at = now
-    target.save(update_fields=['score', 'updated_at'])
-    attacker.save(update_fields=['score', 'last_steal_at', 'updated_at'])
-
-    # Reflect the steal on the public leaderboard immediately so a steal moves
-    # both players' standings without anyone re-submitting (and re-burning).
-    # We shift each existing current-month entry by exactly the stolen amount
-    # — NOT by copying the live score, which also holds un-burned clicking
-    # gains. We only UPDATE existing rows (never create): getting onto the
-    # board still requires a paid 0.1 PEDRO burn, which supplies the unique
-    # tx_hash an entry needs. `.update()` on an empty match is a harmless no-op,
-    # so a player who never submitted simply isn't affected here.
-    GameLeaderboardEntry.objects.filter(
-        address=attacker_addr, month=current_month,
-    ).update(score=F('score') + actual)
-    GameLeaderboardEntry.objects.filter(
-        address=target_addr, month=current_month,
-    ).update(score=Greatest(F('score') - actual, 0))
-
-    GameStealLog.objects.create(
-        attacker=attacker_addr,
-        target=target_addr,
-        amount=actual,
-        attacker_level=attacker.steal_level,
-    )
+        GameStealLog.objects.create(
+            attacker=attacker_addr,
+            target=target_addr,
+            amount=actual,
+            attacker_level=attacker.steal_level,
+        )
+        transaction.on_commit(_bump_game_board_generation)
+        transaction.on_commit(lambda: [_invalidate_sync_base(a) for a in pair])
 
-    return json_response({
+    return 200, {
         'ok': True,
         'stolen': actual,
         'crit': crit_multiplier,
-        'attacker_score': attacker.score,
-        'target_score': target.score,
-        'cooldown_seconds': STEAL_COOLDOWN_SECONDS,
-    })
+        'attacker_score': attacker_score,
+        'target_score': target_score,
+        'cooldown_seconds': cooldown_seconds,
+    }
 
 
 def game_steal_log(request):
@@ -1337,9 +2265,9 @@ RAFFLE_PRIZE_LABEL = '1 INJ'
 RAFFLE_COST_HOLDER_PEDRO = 5  # PEDRO per ticket if you hold ≥1 NFT
 RAFFLE_COST_NON_HOLDER_PEDRO = 10  # PEDRO per ticket if you don't
 
-# Lazy winner-picking runs on every raffle read. We use `secrets.choice` (CSPRNG)
-# so the team can't be accused of cherry-picking even though picking is
-# automatic. Same entropy source as the legacy `pick_raffle_winner` cron.
+# Lazy winner-picking runs on every raffle read. We use `secrets.randbelow`
+# (CSPRNG) so the team can't be accused of cherry-picking even though picking
+# is automatic. Same entropy source as the legacy `pick_raffle_winner` cron.
 import secrets as _raffle_secrets
 
 
@@ -1351,71 +2279,223 @@ def _current_week() -> str:
     return f"{iso_year}-W{iso_week:02d}"
 
 
-def _ensure_raffle_weeks_finalized(current_week: str) -> None:
-    """Lazy weekly draw: for every past ISO week that has tickets but no
-    `RaffleResult` row yet, pick a winning ticket and persist it.
+def _submission_week(payload) -> str:
+    """The raffle week a submission's tickets go into: the week it was
+    accepted in (stamped by accept_submission), or now when processed
+    inline. A week that has already been drawn can't take tickets any
+    more, so those go into the running week instead."""
+    week = payload.get('week')
+    if not week or RaffleResult.objects.filter(week=week).exists():
+        return _current_week()
+    return week
+
+
+_RAFFLE_FINALIZER_LEASE = 'raffle_week_draw'
 
-    Once a week is drawn its RaffleTicket rows are deleted — the winner and
-    the ticket count live permanently on RaffleResult, so nothing visible is
-    lost and the ticket table (one row PER TICKET) can't grow forever.
+
+def finalize_raffle_weeks(batch_size: int | None = None) -> dict | None:
+    """Weekly draw, run by the scheduled `finalize_raffle` command — never
+    from a request. For every finished ISO week with tickets but no
+    `RaffleResult` yet, pick a winning ticket and persist it; then delete
+    the drawn weeks' RaffleTicket and RaffleEntrant rows `batch_size` at a
+    time (settings.RAFFLE_CLEANUP_BATCH_SIZE), one short transaction per
+    batch, so purchases for the new week never wait behind one long DELETE.
+
+    The winner and the ticket count live permanently on RaffleResult (and
+    the week's totals on RaffleWeekStats), so nothing visible is lost and
+    the per-purchase and per-wallet tables can't grow forever.
 
     RafflePurchase and RaffleFreeClaim are deliberately NOT deleted: their
     tx_hash rows are the replay ledger that stops an old burn from being
-    credited again in a later week. They're one row per transaction rather
-    than per ticket, so keeping them costs almost nothing.
+    credited again in a later week. They're one row per transaction, so
+    keeping them costs almost nothing.
+
+    Runs under a cluster-wide lease and returns None when another worker
+    holds it. Otherwise returns the run's metrics; the per-week draw and
+    cleanup timings are also stored on each RaffleResult. A run that loses
+    its lease stops between batches and the next run carries on."""
+    batch_size = batch_size or getattr(settings, 'RAFFLE_CLEANUP_BATCH_SIZE', 500)
+    started = time.monotonic()
+    metrics = {'drawn': [], 'cleaned': [], 'complete': True}
+    with hold_lease(_RAFFLE_FINALIZER_LEASE, _HOUSEKEEPING_LEASE_SECONDS) as lease:
+        if lease is None:
+            return None
+        current_week = _current_week()
+        for week in _raffle_weeks_to_draw(current_week):
+            drawn = _draw_raffle_week(week, lease)
+            if drawn is not None:
+                metrics['drawn'].append(drawn)
+        # Never the running week, even if it somehow has a result already:
+        # its tickets are still being bought.
+        undone = RaffleResult.objects.filter(cleaned_up_at__isnull=True, week__lt=current_week)
+        for result in undone.order_by('week'):
+            cleaned = _clean_up_raffle_week(result, batch_size, lease)
+            metrics['cleaned'].append(cleaned)
+            if not cleaned['complete']:
+                metrics['complete'] = False
+                break
+    metrics['total_ms'] = int((time.monotonic() - started) * 1000)
+    logger.info("Raffle finalizer: %s", metrics)
+    return metrics
 
-    Idempotent — a second call is a no-op because the RaffleResult row now
-    exists. Mirrors `_ensure_month_rolled_over` for the game.
-    """
-    past_weeks_with_tickets = list(
-        RaffleTicket.objects
-        .exclude(week=current_week)
-        .values_list('week', flat=True)
-        .distinct()
-    )
-    if not past_weeks_with_tickets:
-        return
-    already_drawn = set(
-        RaffleResult.objects
-        .filter(week__in=past_weeks_with_tickets)
+
+def _raffle_weeks_to_draw(current_week: str) -> list[str]:
+    return list(
+        RaffleWeekStats.objects
+        .filter(week__lt=current_week, total_tickets__gt=0)
+        .exclude(week__in=RaffleResult.objects.values('week'))
+        .order_by('week')
         .values_list('week', flat=True)
     )
-    for week in past_weeks_with_tickets:
-        if week in already_drawn:
-            continue
-        ticket_ids = list(
-            RaffleTicket.objects
-            .filter(week=week)
-            .values_list('id', 'address')
-        )
-        if not ticket_ids:
-            continue
-        winning_id, winning_address = _raffle_secrets.choice(ticket_ids)
-        winning_name = _locked_name_for(winning_address)
-        try:
+
+
+def _draw_raffle_week(week: str, lease) -> dict | None:
+    started = time.monotonic()
+    drawn = _draw_raffle_ticket(week)
+    if drawn is None:
+        return None
+    winning_range, winning_number, ticket_count = drawn
+    winning_name = _locked_name_for(winning_range.address)
+    draw_ms = int((time.monotonic() - started) * 1000)
+    try:
+        with transaction.atomic():
+            if not lease_is_current(lease):
+                raise RolloverLeaseLost(f"raffle draw lease lost before drawing {week}")
             RaffleResult.objects.create(
                 week=week,
-                winning_address=winning_address,
-                winning_ticket_id=winning_id,
+                winning_address=winning_range.address,
+                winning_ticket_id=winning_range.id,
+                winning_ticket_number=winning_number,
                 winning_name=winning_name,
-                ticket_count=len(ticket_ids),
+                ticket_count=ticket_count,
+                draw_ms=draw_ms,
             )
-        except IntegrityError:
-            # Race with another concurrent request that just drew this week.
-            # Whichever transaction got there first wins; we silently move on.
-            continue
+    except IntegrityError:
+        # Drawn meanwhile by the manual pick_raffle_winner command.
+        return None
+    return {
+        'week': week,
+        'winning_address': winning_range.address,
+        'winning_ticket_number': winning_number,
+        'ticket_count': ticket_count,
+        'draw_ms': draw_ms,
+    }
 
-    # Re-query (the loop above may have just created results) and drop the
-    # ticket rows for every past week that is now safely drawn. We filter on
-    # RaffleResult rather than on `past_weeks_with_tickets` directly so a week
-    # whose draw failed keeps its tickets and can still be drawn next time.
-    drawn_weeks = set(
-        RaffleResult.objects
-        .filter(week__in=past_weeks_with_tickets)
-        .values_list('week', flat=True)
+
+def _delete_in_batches(queryset, batch_size: int, lease) -> tuple[int, int, bool]:
+    """Delete `queryset` `batch_size` rows per statement, renewing `lease`
+    between batches. Returns (rows deleted, batches, finished) — finished is
+    False when the lease was lost and the rest is left for the next run."""
+    deleted = batches = 0
+    while True:
+        ids = list(queryset.order_by().values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return deleted, batches, True
+        deleted += queryset.model.objects.filter(id__in=ids).delete()[0]
+        batches += 1
+        if not renew_lease(lease, _HOUSEKEEPING_LEASE_SECONDS):
+            return deleted, batches, False
+
+
+def _clean_up_raffle_week(result, batch_size: int, lease) -> dict:
+    started = time.monotonic()
+    rows = batches = 0
+    complete = True
+    for model in (RaffleTicket, RaffleEntrant):
+        deleted, n, complete = _delete_in_batches(
+            model.objects.filter(week=result.week), batch_size, lease,
+        )
+        rows += deleted
+        batches += n
+        if not complete:
+            break
+    cleanup_ms = int((time.monotonic() - started) * 1000)
+    if complete:
+        # Accumulates over runs if an earlier one was cut short.
+        result.cleanup_ms = (result.cleanup_ms or 0) + cleanup_ms
+        result.cleaned_up_at = datetime.now(timezone.utc)
+        result.save(update_fields=['cleanup_ms', 'cleaned_up_at'])
+    return {
+        'week': result.week,
+        'rows_deleted': rows,
+        'batches': batches,
+        'cleanup_ms': cleanup_ms,
+        'complete': complete,
+    }
+
+
+def _raffle_ticket_total(week: str) -> int:
+    """Tickets entered for `week` so far — the last range's last number."""
+    last = (
+        RaffleTicket.objects
+        .filter(week=week)
+        .order_by('-first_no')
+        .values_list('first_no', 'count')
+        .first()
+    )
+    return last[0] + last[1] - 1 if last else 0
+
+
+def _draw_raffle_ticket(week: str):
+    """Pick one of `week`'s tickets uniformly at random. Returns
+    (RaffleTicket range holding it, ticket number, total tickets), or None
+    for a week without tickets.
+
+    Range starts are the running ticket count, so finding the owner of
+    ticket n is a binary search for the last first_no <= n — done by the
+    (week, first_no) index in O(log n), without loading the week's tickets."""
+    total = _raffle_ticket_total(week)
+    if not total:
+        return None
+    number = _raffle_secrets.randbelow(total) + 1
+    owner = (
+        RaffleTicket.objects
+        .filter(week=week, first_no__lte=number)
+        .order_by('-first_no')
+        .first()
     )
-    if drawn_weeks:
-        RaffleTicket.objects.filter(week__in=drawn_weeks).delete()
+    return owner, number, total
+
+
+def _reserve_raffle_numbers(week: str, count: int) -> int:
+    """Add `count` to the week's ticket total and return the first of the
+    numbers reserved. The UPDATE locks the week's stats row until the
+    caller's transaction ends, so concurrent purchases get consecutive,
+    non-overlapping ranges."""
+    if not RaffleWeekStats.objects.filter(week=week).update(total_tickets=F('total_tickets') + count):
+        RaffleWeekStats.objects.get_or_create(week=week)
+        RaffleWeekStats.objects.filter(week=week).update(total_tickets=F('total_tickets') + count)
+    total = RaffleWeekStats.objects.values_list('total_tickets', flat=True).get(week=week)
+    return total - count + 1
+
+
+def _credit_raffle_tickets(week: str, address: str, source: str, tx_hash: str,
+                           count: int, create_ledger_row) -> None:
+    """Enter `count` tickets for `address` as one range numbered after the
+    week's last ticket, and bump the week's and the wallet's counters.
+    `create_ledger_row()` writes the RafflePurchase / RaffleFreeClaim row
+    that consumes `tx_hash`; everything commits together, so tickets are
+    never credited twice for one tx and the counters never drift from the
+    ranges. Raises IntegrityError when that ledger row loses its race."""
+    free = source == RaffleTicket.SOURCE_FREE
+    with transaction.atomic():
+        create_ledger_row()
+        RaffleTicket.objects.create(
+            week=week,
+            address=address,
+            source=source,
+            tx_hash=tx_hash,
+            first_no=_reserve_raffle_numbers(week, count),
+            count=count,
+        )
+        changes = {'tickets': F('tickets') + count}
+        if free:
+            changes['free_claimed'] = True
+        if not RaffleEntrant.objects.filter(week=week, address=address).update(**changes):
+            # The stats row is locked by now, so no one else can be adding
+            # this wallet's first range concurrently.
+            RaffleEntrant.objects.create(week=week, address=address, tickets=count, free_claimed=free)
+            RaffleWeekStats.objects.filter(week=week).update(participants=F('participants') + 1)
 
 
 def _week_bounds_utc(week: str) -> tuple[datetime, datetime]:
@@ -1443,35 +2523,38 @@ def _ticket_cost_for(address: str) -> int:
 
 
 def _serialize_my_tickets(address: str, week: str) -> list[dict]:
+    """The wallet's tickets this week as ranges, one per purchase / claim."""
     return [
         {
             'id': t.id,
+            'first_no': t.first_no,
+            'last_no': t.last_no,
+            'count': t.count,
             'source': t.source,
             'created_at': t.created_at.isoformat(),
         }
         for t in RaffleTicket.objects
         .filter(week=week, address=address)
-        .order_by('id')
+        .order_by('first_no')
     ]
 
 
 def raffle_current(request, address):
     """Snapshot of the current week for one wallet — entries, totals, prize,
-    ticket cost, free-claim eligibility."""
+    ticket cost, free-claim eligibility and win odds. Totals come from the
+    week's and the wallet's counter rows; `my_tickets` lists the wallet's
+    ticket ranges, one row per purchase / claim."""
     address = (address or '').strip()
     if not address.startswith('inj1'):
         return json_response({'error': 'Invalid address'}, status=400)
 
     week = _current_week()
-    # Whoever loads the page first after a Monday rollover triggers the draw
-    # for last week. No more manual `pick_raffle_winner` cron needed.
-    _ensure_raffle_weeks_finalized(week)
     nft_count = _fetch_pedro_nft_count(address)
-    total_tickets = RaffleTicket.objects.filter(week=week).count()
-    my_tickets = _serialize_my_tickets(address, week)
-    already_claimed_free = RaffleFreeClaim.objects.filter(
-        address=address, week=week,
-    ).exists()
+    stats = RaffleWeekStats.objects.filter(week=week).first()
+    total_tickets = stats.total_tickets if stats else 0
+    entrant = RaffleEntrant.objects.filter(week=week, address=address).first()
+    my_ticket_count = entrant.tickets if entrant else 0
+    already_claimed_free = bool(entrant and entrant.free_claimed)
     cost_pedro = (
         RAFFLE_COST_HOLDER_PEDRO if nft_count >= 1 else RAFFLE_COST_NON_HOLDER_PEDRO
     )
@@ -1485,7 +2568,10 @@ def raffle_current(request, address):
         'free_tickets_available': nft_count if not already_claimed_free else 0,
         'free_already_claimed': already_claimed_free,
         'total_tickets_this_week': total_tickets,
-        'my_tickets': my_tickets,
+        'participants_this_week': stats.participants if stats else 0,
+        'my_ticket_count': my_ticket_count,
+        'win_chance': my_ticket_count / total_tickets if total_tickets else 0.0,
+        'my_tickets': _serialize_my_tickets(address, week),
     })
 
 
@@ -1509,65 +2595,59 @@ def raffle_claim_free(request):
     if not address.startswith('inj1') or not tx_hash:
         return json_response({'error': 'Missing or invalid fields'}, status=400)
 
+    payload = {'address': address, 'tx_hash': tx_hash}
+    if wants_async(request):
+        return _accept_submission(PendingSubmission.KIND_RAFFLE_FREE, payload)
+    status, data = _process_raffle_claim_free(payload)
+    return json_response(data, status=status)
+
+
+def _process_raffle_claim_free(payload):
+    address = payload['address']
+    tx_hash = payload['tx_hash']
+
     # Replay protection — same tx_hash can't be reused across weeks/claims.
     if (
         RaffleFreeClaim.objects.filter(tx_hash=tx_hash).exists()
         or RafflePurchase.objects.filter(tx_hash=tx_hash).exists()
     ):
-        return json_response({'error': 'Tx hash already used'}, status=409)
+        return 409, {'error': 'Tx hash already used'}
 
-    week = _current_week()
+    week = _submission_week(payload)
     nft_count = _fetch_pedro_nft_count(address)
     if nft_count < 1:
-        return json_response(
-            {'error': 'Free tickets require at least one Pedro NFT'},
-            status=400,
-        )
+        return 400, {'error': 'Free tickets require at least one Pedro NFT'}
 
     if RaffleFreeClaim.objects.filter(address=address, week=week).exists():
-        return json_response(
-            {'error': 'Free tickets already claimed for this week'},
-            status=409,
-        )
+        return 409, {'error': 'Free tickets already claimed for this week'}
 
     ok, reason = GameVerifier.verify_pedro_burn(tx_hash, address, 1)
     if not ok:
-        return json_response(
-            {'error': f'Burn verification failed: {reason}'},
-            status=400,
-        )
+        return 400, {'error': f'Burn verification failed: {reason}'}
 
-    new_tickets = [
-        RaffleTicket(
-            week=week,
-            address=address,
-            source=RaffleTicket.SOURCE_FREE,
-            tx_hash=tx_hash,
-        )
-        for _ in range(nft_count)
-    ]
-    RaffleTicket.objects.bulk_create(new_tickets)
     try:
-        RaffleFreeClaim.objects.create(
-            address=address,
-            week=week,
-            nft_count_at_claim=nft_count,
-            tickets_granted=nft_count,
-            tx_hash=tx_hash,
+        # Claim row and tickets commit together, so a retried or racing
+        # request can never leave tickets without their claim.
+        _credit_raffle_tickets(
+            week, address, RaffleTicket.SOURCE_FREE, tx_hash, nft_count,
+            lambda: RaffleFreeClaim.objects.create(
+                address=address,
+                week=week,
+                nft_count_at_claim=nft_count,
+                tickets_granted=nft_count,
+                tx_hash=tx_hash,
+            ),
         )
     except IntegrityError:
-        # Race lost — another request just consumed this tx_hash. Roll back.
-        RaffleTicket.objects.filter(
-            week=week, address=address, tx_hash=tx_hash, source=RaffleTicket.SOURCE_FREE,
-        ).delete()
-        return json_response({'error': 'Tx hash already used'}, status=409)
+        # Race lost — another request just consumed this tx_hash.
+        return 409, {'error': 'Tx hash already used'}
 
-    return json_response({
+    return 200, {
         'ok': True,
         'tickets_granted': nft_count,
         'week': week,
         'my_tickets': _serialize_my_tickets(address, week),
-    })
+    }
 
 
 @csrf_exempt
@@ -1597,56 +2677,58 @@ def raffle_buy(request):
             status=400,
         )
 
+    payload = {'address': address, 'tickets': tickets, 'tx_hash': tx_hash}
+    if wants_async(request):
+        return _accept_submission(PendingSubmission.KIND_RAFFLE_BUY, payload)
+    status, data = _process_raffle_buy(payload)
+    return json_response(data, status=status)
+
+
+def _process_raffle_buy(payload):
+    address = payload['address']
+    tickets = payload['tickets']
+    tx_hash = payload['tx_hash']
+
     if RafflePurchase.objects.filter(tx_hash=tx_hash).exists():
-        return json_response({'error': 'Tx hash already used'}, status=409)
+        return 409, {'error': 'Tx hash already used'}
 
     cost_per_ticket = _ticket_cost_for(address)
     expected_burn = tickets * cost_per_ticket
 
     ok, reason = GameVerifier.verify_pedro_burn(tx_hash, address, expected_burn)
     if not ok:
-        return json_response(
-            {'error': f'Burn verification failed: {reason}'},
-            status=400,
-        )
+        return 400, {'error': f'Burn verification failed: {reason}'}
 
-    week = _current_week()
-    new_tickets = [
-        RaffleTicket(
-            week=week,
-            address=address,
-            source=RaffleTicket.SOURCE_PAID,
-            tx_hash=tx_hash,
-        )
-        for _ in range(tickets)
-    ]
-    RaffleTicket.objects.bulk_create(new_tickets)
+    week = _submission_week(payload)
     try:
-        RafflePurchase.objects.create(
-            tx_hash=tx_hash,
-            address=address,
-            week=week,
-            tickets=tickets,
-            pedro_burned=expected_burn,
+        # Purchase row and tickets commit together, so tickets are never
+        # credited twice for one tx even if the request is retried.
+        _credit_raffle_tickets(
+            week, address, RaffleTicket.SOURCE_PAID, tx_hash, tickets,
+            lambda: RafflePurchase.objects.create(
+                tx_hash=tx_hash,
+                address=address,
+                week=week,
+                tickets=tickets,
+                pedro_burned=expected_burn,
+            ),
         )
     except IntegrityError:
         # Lost the race — another request just consumed this tx_hash.
-        # Roll back the tickets we just created so they aren't double-credited.
-        RaffleTicket.objects.filter(week=week, address=address, tx_hash=tx_hash).delete()
-        return json_response({'error': 'Tx hash already used'}, status=409)
+        return 409, {'error': 'Tx hash already used'}
 
-    return json_response({
+    return 200, {
         'ok': True,
         'tickets_added': tickets,
         'pedro_burned': expected_burn,
         'week': week,
         'my_tickets': _serialize_my_tickets(address, week),
-    })
+    }
 
 
 def raffle_history(request):
-    """Past weekly winners + payout status."""
-    _ensure_raffle_weeks_finalized(_current_week())
+    """Past weekly winners + payout status. Weeks are drawn by the
+    scheduled `finalize_raffle` command; this only reads its results."""
     rows = RaffleResult.objects.all()[:24]
     return json_response({
         'results': [
@@ -1654,6 +2736,7 @@ def raffle_history(request):
                 'week': r.week,
                 'winning_address': r.winning_address,
                 'winning_ticket_id': r.winning_ticket_id,
+                'winning_ticket_number': r.winning_ticket_number,
                 'winning_name': r.winning_name,
                 'ticket_count': r.ticket_count,
                 'payout_tx_hash': r.payout_tx_hash,
@@ -1747,31 +2830,36 @@ def governance_vote(request):
             status=400,
         )
 
-    month = _current_month()
-    _ensure_snapshot(month)
+    payload = {'address': address, 'choice': choice, 'tx_hash': tx_hash}
+    if wants_async(request):
+        return _accept_submission(PendingSubmission.KIND_GOVERNANCE_VOTE, payload)
+    status, data = _process_governance_vote(payload)
+    return json_response(data, status=status)
+
+
+def _process_governance_vote(payload):
+    address = payload['address']
+    choice = payload['choice']
+    tx_hash = payload['tx_hash']
+
+    month = _submission_month(payload)
+    if GovernanceMonthResult.objects.filter(month=month).exists():
+        return 409, {'error': f'Voting for {month} has closed'}
+    state = _ensure_snapshot(month)
+    if state != GovernanceSnapshotJob.STATE_READY:
+        return _snapshot_not_ready(state)
 
     try:
         snapshot = GovernanceVoterSnapshot.objects.get(month=month, address=address)
     except GovernanceVoterSnapshot.DoesNotExist:
-        if not GovernanceVoterSnapshot.objects.filter(month=month).exists():
-            return json_response(
-                {'error': 'Voter snapshot for this month has not been taken yet'},
-                status=409,
-            )
-        return json_response(
-            {'error': 'You did not hold any Pedro NFTs at the start of this month'},
-            status=403,
-        )
+        return 403, {'error': 'You did not hold any Pedro NFTs at the start of this month'}
 
     if GovernanceVote.objects.filter(month=month, address=address).exists():
-        return json_response(
-            {'error': 'You have already voted this month'},
-            status=409,
-        )
+        return 409, {'error': 'You have already voted this month'}
 
     ok, reason = GovernanceVerifier.verify_vote(tx_hash, address, month, choice)
     if not ok:
-        return json_response({'error': f'Vote verification failed: {reason}'}, status=400)
+        return 400, {'error': f'Vote verification failed: {reason}'}
 
     try:
         vote = GovernanceVote.objects.create(
@@ -1782,41 +2870,42 @@ def governance_vote(request):
             tx_hash=tx_hash,
         )
     except IntegrityError:
-        return json_response(
-            {'error': 'Tx hash already used or duplicate vote'},
-            status=409,
-        )
+        return 409, {'error': 'Tx hash already used or duplicate vote'}
 
-    return json_response({
+    return 200, {
         'ok': True,
         'id': vote.id,
         'month': month,
         'choice': choice,
         'points': vote.points,
-    })
+    }
 
 
 def governance_current(request):
+    """This month's vote: tally, snapshot totals and, with `?address=`, the
+    caller's eligibility. Answers at once while the voter snapshot is still
+    being built — `snapshot_state` / `snapshot_progress` say how far it is."""
     month = _current_month()
-    snapshot_error = _ensure_snapshot(month)
+    job = _snapshot_job(month)
+    ready = job.state == GovernanceSnapshotJob.STATE_READY
     address = (request.GET.get('address') or '').strip()
 
-    snapshot_count = GovernanceVoterSnapshot.objects.filter(month=month).count()
-    total_power = (
-        GovernanceVoterSnapshot.objects
-        .filter(month=month)
-        .aggregate(total=Sum('nft_count'))
-    )['total'] or 0
-
     tally = _tally_for_month(month)
     voters = GovernanceVote.objects.filter(month=month).count()
 
     response = {
         'month': month,
-        'snapshot_taken': snapshot_count > 0,
-        'snapshot_error': snapshot_error,
-        'eligible_voters': snapshot_count,
-        'total_voting_power': int(total_power),
+        'snapshot_state': job.state,
+        'snapshot_taken': ready,
+        'snapshot_error': job.error or None,
+        'snapshot_progress': {
+            'rows_written': job.rows_written,
+            'rows_total': job.rows_total,
+            'started_at': job.started_at.isoformat() if job.started_at else None,
+            'duration_ms': job.duration_ms,
+        },
+        'eligible_voters': job.voters if ready else 0,
+        'total_voting_power': job.voting_power if ready else 0,
         'voters_so_far': voters,
         'tally': tally,
     }
@@ -1830,12 +2919,13 @@ def governance_current(request):
             'choice': None,
             'tx_hash': None,
         }
-        try:
-            snap = GovernanceVoterSnapshot.objects.get(month=month, address=address)
+        snap = (
+            GovernanceVoterSnapshot.objects.filter(month=month, address=address).first()
+            if ready else None
+        )
+        if snap is not None:
             my['eligible'] = True
             my['nft_count'] = snap.nft_count
-        except GovernanceVoterSnapshot.DoesNotExist:
-            pass
         try:
             vote = GovernanceVote.objects.get(month=month, address=address)
             my['has_voted'] = True
@@ -1852,17 +2942,23 @@ def _ensure_governance_month_finalized(current_month: str) -> None:
     """Lazy month-end finalization: for every past month with votes but no
     `GovernanceMonthResult` row yet, compute the winning choice from the
     tallies and persist a result row. `payout_tx_hash` is left blank — admin
-    fills it in via the UI later. Mirrors `_ensure_month_rolled_over` (game)
-    and `_ensure_raffle_weeks_finalized` (raffle).
+    fills it in via the UI later. Runs once per month (rollover_epochs.py).
+    Mirrors `_ensure_month_rolled_over` (game).
     """
+    run_once_per_period(
+        'governance_month_finalize', current_month,
+        lambda: _finalize_governance_months(current_month),
+        _HOUSEKEEPING_LEASE_SECONDS,
+    )
+
+
+def _finalize_governance_months(current_month: str) -> None:
     past_months = list(
         GovernanceVote.objects
         .exclude(month=current_month)
         .values_list('month', flat=True)
         .distinct()
     )
-    if not past_months:
-        return
     already_finalized = set(
         GovernanceMonthResult.objects
         .filter(month__in=past_months)
@@ -1876,13 +2972,14 @@ def _ensure_governance_month_finalized(current_month: str) -> None:
             max(tally, key=lambda c: tally[c]) if any(tally.values()) else ''
         )
         try:
-            GovernanceMonthResult.objects.create(
-                month=month,
-                winning_choice=winner,
-                points_liquidity=tally.get('liquidity', 0),
-                points_buy_nfts=tally.get('buy_nfts', 0),
-                points_giveaway=tally.get('giveaway', 0),
-            )
+            with transaction.atomic():
+                GovernanceMonthResult.objects.create(
+                    month=month,
+                    winning_choice=winner,
+                    points_liquidity=tally.get('liquidity', 0),
+                    points_buy_nfts=tally.get('buy_nfts', 0),
+                    points_giveaway=tally.get('giveaway', 0),
+                )
         except IntegrityError:
             # Race with another concurrent request that just finalized this
             # month. Whichever transaction landed first wins; move on.
@@ -1966,18 +3063,23 @@ def special_proposals_list(request):
     address = (request.GET.get('address') or '').strip()
     today = date.today()
     proposals = SpecialProposal.objects.filter(is_active=True, end_date__gte=today)
+    snap = None
+    snapshot_state = None
+    if address.startswith('inj1'):
+        month = _current_month()
+        snapshot_state = _ensure_snapshot(month)
+        if snapshot_state == GovernanceSnapshotJob.STATE_READY:
+            snap = GovernanceVoterSnapshot.objects.filter(month=month, address=address).first()
     out = []
     for p in proposals:
         options = _options_for(p)
         tally = _tally_for_special_proposal(p.id, len(options))
         me = None
         if address.startswith('inj1'):
-            month = _current_month()
-            _ensure_snapshot(month)
-            snap = GovernanceVoterSnapshot.objects.filter(month=month, address=address).first()
             sv = SpecialVote.objects.filter(proposal=p, address=address).first()
             me = {
                 'address': address,
+                'snapshot_state': snapshot_state,
                 'eligible': snap is not None,
                 'nft_count': snap.nft_count if snap else 0,
                 'has_voted': sv is not None,
@@ -2035,41 +3137,6 @@ def special_proposal_create(request):
     is_admin = caller.lower() == PEDRO_ADMIN_ADDRESS
     tx_hash = (body.get('tx_hash') or body.get('creation_tx_hash') or '').strip()
 
-    if not is_admin:
-        # Non-admin creators must be NFT holders this month AND burn the
-        # creation fee.
-        month = _current_month()
-        _ensure_snapshot(month)
-        snap = GovernanceVoterSnapshot.objects.filter(
-            month=month, address=caller,
-        ).first()
-        if not snap or snap.nft_count < 1:
-            return json_response(
-                {'error': 'Only Pedro NFT holders can create proposals'},
-                status=403,
-            )
-        if not tx_hash:
-            return json_response(
-                {
-                    'error': (
-                        f'Burn {SPECIAL_PROPOSAL_BURN_PEDRO} $PEDRO and submit '
-                        f'the tx hash to create a proposal'
-                    ),
-                },
-                status=400,
-            )
-        # Replay protection — reuse the same indexes the game/raffle use.
-        if SpecialProposal.objects.filter(creation_tx_hash=tx_hash).exists():
-            return json_response({'error': 'Tx hash already used'}, status=409)
-        ok, reason = GameVerifier.verify_pedro_burn(
-            tx_hash, caller, SPECIAL_PROPOSAL_BURN_PEDRO,
-        )
-        if not ok:
-            return json_response(
-                {'error': f'Burn verification failed: {reason}'},
-                status=400,
-            )
-
     title = (body.get('title') or '').strip()
     description = (body.get('description') or '').strip()
     end_date_str = (body.get('end_date') or '').strip()
@@ -2103,9 +3170,60 @@ def special_proposal_create(request):
     if end_date < date.today():
         return json_response({'error': 'end_date must be in the future'}, status=400)
 
+    payload = {
+        'caller': caller,
+        'tx_hash': tx_hash,
+        'title': title,
+        'description': description,
+        'options': options,
+        'end_date': end_date.isoformat(),
+    }
+    # Only the holder flow has a burn to wait for; admins create directly.
+    if not is_admin and tx_hash and wants_async(request):
+        return _accept_submission(PendingSubmission.KIND_SPECIAL_CREATE, payload)
+    status, data = _process_special_proposal_create(payload)
+    return json_response(data, status=status)
+
+
+def _process_special_proposal_create(payload):
+    from datetime import date
+
+    caller = payload['caller']
+    tx_hash = payload['tx_hash']
+    is_admin = caller.lower() == PEDRO_ADMIN_ADDRESS
+
+    if not is_admin:
+        # Non-admin creators must be NFT holders this month AND burn the
+        # creation fee.
+        month = _submission_month(payload)
+        state = _ensure_snapshot(month)
+        if state != GovernanceSnapshotJob.STATE_READY:
+            return _snapshot_not_ready(state)
+        snap = GovernanceVoterSnapshot.objects.filter(
+            month=month, address=caller,
+        ).first()
+        if not snap or snap.nft_count < 1:
+            return 403, {'error': 'Only Pedro NFT holders can create proposals'}
+        if not tx_hash:
+            return 400, {
+                'error': (
+                    f'Burn {SPECIAL_PROPOSAL_BURN_PEDRO} $PEDRO and submit '
+                    f'the tx hash to create a proposal'
+                ),
+            }
+        # Replay protection — reuse the same indexes the game/raffle use.
+        if SpecialProposal.objects.filter(creation_tx_hash=tx_hash).exists():
+            return 409, {'error': 'Tx hash already used'}
+        ok, reason = GameVerifier.verify_pedro_burn(
+            tx_hash, caller, SPECIAL_PROPOSAL_BURN_PEDRO,
+        )
+        if not ok:
+            return 400, {'error': f'Burn verification failed: {reason}'}
+
+    options = payload['options']
     proposal = SpecialProposal.objects.create(
-        title=title[:200],
-        description=description,
+        title=payload['title'][:200],
+        description=payload['description'],
         options=options,
         # Keep the two label columns populated (from the first two options) so
         # any legacy reader still works.
@@ -2113,17 +3231,17 @@ def special_proposal_create(request):
         choice_no_label=options[1],
         is_active=True,
         start_date=date.today(),
-        end_date=end_date,
+        end_date=date.fromisoformat(payload['end_date']),
         creator_address='' if is_admin else caller,
         creation_tx_hash='' if is_admin else tx_hash,
     )
-    return json_response({
+    return 200, {
         'ok': True,
         'id': proposal.id,
         'title': proposal.title,
         'creator_address': proposal.creator_address,
         'creation_tx_hash': proposal.creation_tx_hash,
-    })
+    }
 
 
 @csrf_exempt
@@ -2143,41 +3261,53 @@ def special_proposal_vote(request):
     if not address.startswith('inj1') or not tx_hash:
         return json_response({'error': 'Missing or invalid fields'}, status=400)
 
+    payload = {
+        'address': address, 'proposal_id': proposal_id, 'choice': choice, 'tx_hash': tx_hash,
+    }
+    if wants_async(request):
+        return _accept_submission(PendingSubmission.KIND_SPECIAL_VOTE, payload)
+    status, data = _process_special_proposal_vote(payload)
+    return json_response(data, status=status)
+
+
+def _process_special_proposal_vote(payload):
+    address = payload['address']
+    proposal_id = payload['proposal_id']
+    choice = payload['choice']
+    tx_hash = payload['tx_hash']
+
     try:
         proposal = SpecialProposal.objects.get(id=proposal_id, is_active=True)
     except (SpecialProposal.DoesNotExist, TypeError, ValueError):
-        return json_response({'error': 'Proposal not found or inactive'}, status=404)
+        return 404, {'error': 'Proposal not found or inactive'}
 
     # `choice` is the option index ("0", "1", ...); legacy 'yes'/'no' still map.
     options = _options_for(proposal)
     choice_index = _choice_to_index(choice)
     if choice_index is None or not (0 <= choice_index < len(options)):
-        return json_response({'error': 'Invalid option'}, status=400)
+        return 400, {'error': 'Invalid option'}
 
     from datetime import date
     if proposal.end_date < date.today():
-        return json_response({'error': 'Voting has closed for this proposal'}, status=409)
+        return 409, {'error': 'Voting has closed for this proposal'}
 
-    month = _current_month()
-    _ensure_snapshot(month)
+    month = _submission_month(payload)
+    state = _ensure_snapshot(month)
+    if state != GovernanceSnapshotJob.STATE_READY:
+        return _snapshot_not_ready(state)
     try:
         snapshot = GovernanceVoterSnapshot.objects.get(month=month, address=address)
     except GovernanceVoterSnapshot.DoesNotExist:
-        if not GovernanceVoterSnapshot.objects.filter(month=month).exists():
-            return json_response({'error': 'Voter snapshot not yet taken'}, status=409)
-        return json_response(
-            {'error': 'You did not hold any Pedro NFTs at the start of this month'},
-            status=403,
-        )
+        return 403, {'error': 'You did not hold any Pedro NFTs at the start of this month'}
 
     if SpecialVote.objects.filter(proposal=proposal, address=address).exists():
-        return json_response({'error': 'You have already voted on this proposal'}, status=409)
+        return 409, {'error': 'You have already voted on this proposal'}
 
     # Verify the on-chain memo using exactly the choice string the client
     # signed (`pedro-special:{id}:{choice}`), then store the canonical index.
     ok, reason = GovernanceVerifier.verify_special_vote(tx_hash, address, proposal.id, choice)
     if not ok:
-        return json_response({'error': f'Vote verification failed: {reason}'}, status=400)
+        return 400, {'error': f'Vote verification failed: {reason}'}
 
     try:
         vote = SpecialVote.objects.create(
@@ -2188,9 +3318,9 @@ def special_proposal_vote(request):
             tx_hash=tx_hash,
         )
     except IntegrityError:
-        return json_response({'error': 'Tx hash already used or duplicate vote'}, status=409)
+        return 409, {'error': 'Tx hash already used or duplicate vote'}
 
-    return json_response({'ok': True, 'id': vote.id, 'proposal_id': proposal.id, 'choice': choice_index, 'points': vote.points})
+    return 200, {'ok': True, 'id': vote.id, 'proposal_id': proposal.id, 'choice': choice_index, 'points': vote.points}
 
 
 def special_proposals_history(request):
@@ -2299,6 +3429,7 @@ def game_admin_set_payout(request):
         payout.payout_nft_tx_hash = (nft_tx or '').strip()[:128]
         update_fields.append('payout_nft_tx_hash')
     payout.save(update_fields=update_fields)
+    _bump_game_board_generation()
 
     return json_response({
         'ok': True,
@@ -2326,9 +3457,22 @@ def dashboard_tx_log(request):
     if not tx_hash or not address.startswith('inj1') or feature not in FEATURE_MEMOS:
         return json_response({'error': 'Missing or invalid fields'}, status=400)
 
+    payload = {'tx_hash': tx_hash, 'feature': feature, 'address': address, 'summary': summary}
+    if wants_async(request):
+        return _accept_submission(PendingSubmission.KIND_DASHBOARD_LOG, payload)
+    status, data = _process_dashboard_tx_log(payload)
+    return json_response(data, status=status)
+
+
+def _process_dashboard_tx_log(payload):
+    tx_hash = payload['tx_hash']
+    feature = payload['feature']
+    address = payload['address']
+    summary = payload['summary']
+
     ok, reason = DashboardLogVerifier.verify(tx_hash, address, feature)
     if not ok:
-        return json_response({'error': f'Tx verification failed: {reason}'}, status=400)
+        return 400, {'error': f'Tx verification failed: {reason}'}
 
     try:
         DashboardTxLog.objects.create(
@@ -2341,7 +3485,7 @@ def dashboard_tx_log(request):
         # Already logged — treat as success so the frontend doesn't surface an error.
         pass
 
-    return json_response({'ok': True})
+    return 200, {'ok': True}
 
 
 # Activity features whose transactions live in their own models (game score
@@ -2444,4 +3588,57 @@ def dashboard_tx_recent(request, feature):
             }
             for e in qs
         ],
-    })
\ No newline at end of file
+    })
+
+
+# ---------------------------------------------------------------------------
+# Accept-then-verify submissions (see submissions.py)
+# ---------------------------------------------------------------------------
+
+def _accept_submission(kind, payload):
+    address = payload.get('address') or payload.get('caller')
+    status, data = accept_submission(kind, address, payload['tx_hash'], payload)
+    return json_response(data, status=status)
+
+
+def submission_status_view(request, submission_id):
+    try:
+        submission = PendingSubmission.objects.get(id=submission_id)
+    except PendingSubmission.DoesNotExist:
+        return json_response({'error': 'Submission not found'}, status=404)
+    return json_response(submission_status(submission))
+
+
+register_processor(
+    PendingSubmission.KIND_GAME_SCORE, _process_game_score,
+    lambda p: GameLeaderboardEntry.objects.filter(tx_hash=p['tx_hash'], address=p['address']).exists(),
+)
+register_processor(
+    PendingSubmission.KIND_RAFFLE_BUY, _process_raffle_buy,
+    lambda p: RafflePurchase.objects.filter(tx_hash=p['tx_hash'], address=p['address']).exists(),
+)
+register_processor(
+    PendingSubmission.KIND_RAFFLE_FREE, _process_raffle_claim_free,
+    lambda p: RaffleFreeClaim.objects.filter(tx_hash=p['tx_hash'], address=p['address']).exists(),
+)
+register_processor(
+    PendingSubmission.KIND_GOVERNANCE_VOTE, _process_governance_vote,
+    lambda p: GovernanceVote.objects.filter(tx_hash=p['tx_hash'], address=p['address']).exists(),
+    retry_when=_is_snapshot_not_ready,
+)
+register_processor(
+    PendingSubmission.KIND_SPECIAL_VOTE, _process_special_proposal_vote,
+    lambda p: SpecialVote.objects.filter(tx_hash=p['tx_hash'], address=p['address']).exists(),
+    retry_when=_is_snapshot_not_ready,
+)
+register_processor(
+    PendingSubmission.KIND_SPECIAL_CREATE, _process_special_proposal_create,
+    lambda p: SpecialProposal.objects.filter(
+        creation_tx_hash=p['tx_hash'], creator_address=p['caller'],
+    ).exists(),
+    retry_when=_is_snapshot_not_ready,
+)
+register_processor(
+    PendingSubmission.KIND_DASHBOARD_LOG, _process_dashboard_tx_log,
+    lambda p: DashboardTxLog.objects.filter(tx_hash=p['tx_hash'], address=p['address']).exists(),
+)
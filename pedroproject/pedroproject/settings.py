@@ -75,6 +75,15 @@ DATABASES = {
         'NAME': BASE_DIR / 'db.sqlite3',
     }
 }
+# SQLite's default DEFERRED transactions take the write lock only at the
+# first write, and a reader that then upgrades gets "database is locked"
+# instead of waiting (steals, raffle purchases). BEGIN IMMEDIATE takes it up
+# front, so concurrent writers queue on the busy timeout (raised from 5s,
+# which a burst of steals outlasts).
+if DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    _sqlite_options = DATABASES['default'].setdefault('OPTIONS', {})
+    _sqlite_options.setdefault('transaction_mode', 'IMMEDIATE')
+    _sqlite_options.setdefault('timeout', 30)
 
 # Shared cache backed by the existing database. Survives across gunicorn
 # workers, so the Pedro-NFT holder map seen by /raffle, /game, and /governance
@@ -85,8 +94,81 @@ CACHES = {
         'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
         'LOCATION': 'django_cache',
     },
+    # Verified chain txs (myapp/injective_txs.py) get their own table, so
+    # every fetched tx doesn't cull holder maps, locks and leases out of
+    # the 300-entry default. Needs `createcachetable` too.
+    'chain_tx': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'chain_tx_cache',
+        'TIMEOUT': 86_400,
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
 }
 
+# Injective chain gateway (myapp/injective_chain.py). Each worker process
+# keeps one pool of gRPC AsyncClients open for its whole life instead of every
+# request building its own; the concurrency cap bounds in-flight chain calls
+# per worker so a burst of dashboard hits can't open hundreds of streams.
+INJECTIVE_CHAIN_POOL_SIZE = int(os.getenv('INJECTIVE_CHAIN_POOL_SIZE', '2'))
+INJECTIVE_CHAIN_MAX_CONCURRENCY = int(os.getenv('INJECTIVE_CHAIN_MAX_CONCURRENCY', '32'))
+
+# Injective LCD endpoints (myapp/lcd_pool.py), comma-separated. Requests go to
+# the healthiest one by latency / error rate; slow GETs are hedged to the next
+# one and an endpoint that keeps failing is skipped for the breaker cooldown.
+INJECTIVE_LCD_ENDPOINTS = [
+    url.strip()
+    for url in os.getenv('INJECTIVE_LCD_ENDPOINTS', 'https://sentry.lcd.injective.network').split(',')
+    if url.strip()
+]
+INJECTIVE_LCD_HEDGE = os.getenv('INJECTIVE_LCD_HEDGE', '1') == '1'
+INJECTIVE_LCD_BREAKER_FAILURES = int(os.getenv('INJECTIVE_LCD_BREAKER_FAILURES', '5'))
+INJECTIVE_LCD_BREAKER_COOLDOWN = float(os.getenv('INJECTIVE_LCD_BREAKER_COOLDOWN', '30'))
+
+# Injective explorer REST API (accountTxs for the scam checker).
+INJECTIVE_EXPLORER_API = os.getenv(
+    'INJECTIVE_EXPLORER_API', 'https://sentry.exchange.grpc-web.injective.network'
+).rstrip('/')
+
+# Offline chain stand-in for load tests (myapp/chain_standin.py). A dataset
+# path here serves every gRPC chain call from that file; point
+# INJECTIVE_LCD_ENDPOINTS / INJECTIVE_EXPLORER_API at `manage.py chain_standin
+# serve` for the HTTP side. Latency and failure rate apply to both.
+INJECTIVE_CHAIN_STANDIN = os.getenv('INJECTIVE_CHAIN_STANDIN', '')
+INJECTIVE_STANDIN_LATENCY_MS = float(os.getenv('INJECTIVE_STANDIN_LATENCY_MS', '0'))
+INJECTIVE_STANDIN_JITTER_MS = float(os.getenv('INJECTIVE_STANDIN_JITTER_MS', '0'))
+INJECTIVE_STANDIN_FAILURE_RATE = float(os.getenv('INJECTIVE_STANDIN_FAILURE_RATE', '0'))
+
+# Page budget for one run of the Pedro NFT holder scan (1000 state entries per
+# page). A scan that doesn't finish within it is checkpointed and continued on
+# the next run, so a very large contract can be spread over several cron ticks.
+NFT_HOLDERS_SCAN_PAGES_PER_RUN = int(os.getenv('NFT_HOLDERS_SCAN_PAGES_PER_RUN', '200'))
+
+# Accept-then-verify for the burn-gated endpoints (myapp/submissions.py). When
+# on, they answer 202 with a submission id and the process_submissions worker
+# verifies the tx and applies it; clients poll /submissions/<id>/. When off, a
+# client can still opt in per request with the `Prefer: respond-async` header.
+SUBMISSIONS_ACCEPT_THEN_VERIFY = os.getenv('SUBMISSIONS_ACCEPT_THEN_VERIFY', '0') == '1'
+
+# Write-behind buffer for /game/upgrades/sync/ (views.game_upgrades_sync).
+# Buffered score / level deltas reach GameUpgradeState at most this many
+# seconds after they arrive — sooner on an upgrade purchase or a large score
+# move. Buffers are kept in each web worker's memory; a thread in the worker
+# flushes players who stopped syncing, and a worker flushes all of its
+# buffers when it shuts down.
+GAME_SYNC_FLUSH_SECONDS = float(os.getenv('GAME_SYNC_FLUSH_SECONDS', '30'))
+
+# Idle income: points per second for each auto_level, accrued server-side
+# from GameUpgradeState.accrual_started_at (views._live_score). Off by
+# default: the current client still adds auto-mined points to the score it
+# syncs and submits, so a non-zero rate would pay them twice. Turn it on
+# together with the client release that stops doing that.
+GAME_AUTO_POINTS_PER_SECOND_PER_LEVEL = float(os.getenv('GAME_AUTO_POINTS_PER_SECOND_PER_LEVEL', '0'))
+
+# The finalize_raffle job deletes a drawn week's ticket ranges and per-wallet
+# counters this many rows per transaction, so no single DELETE holds the
+# raffle tables locked for long.
+RAFFLE_CLEANUP_BATCH_SIZE = int(os.getenv('RAFFLE_CLEANUP_BATCH_SIZE', '500'))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 AUTH_PASSWORD_VALIDATORS = [